@@ -79,6 +79,14 @@ options:
     required: false
     default: []
     version_added: "2.1"
+  wait_timeout:
+    description:
+      - How long to wait, in seconds, for the table and its global indexes to become C(ACTIVE) between the steps of an update.
+      - Throughput changes, global index deletes and global index creates are applied one at a time, as DynamoDB rejects
+        a change while the previous one is still in progress.
+    required: false
+    default: 600
+    version_added: "2.2"
 extends_documentation_fragment:
     - aws
     - ec2
@@ -133,6 +141,8 @@ table_status:
     sample: ACTIVE
 '''
 
+import time
+
 try:
     import boto
     import boto.dynamodb2
@@ -140,7 +150,6 @@ try:
     from boto.dynamodb2.fields import HashKey, RangeKey, AllIndex, GlobalAllIndex, GlobalIncludeIndex, GlobalKeysOnlyIndex, IncludeIndex, KeysOnlyIndex
     from boto.dynamodb2.types import STRING, NUMBER, BINARY
     from boto.exception import BotoServerError, NoAuthHandlerFound, JSONResponseError
-    from boto.dynamodb2.exceptions import ValidationException
     HAS_BOTO = True
 
     DYNAMO_TYPE_MAP = {
@@ -157,6 +166,10 @@ INDEX_REQUIRED_OPTIONS = ['name', 'type', 'hash_key_name']
 INDEX_OPTIONS = INDEX_REQUIRED_OPTIONS + ['hash_key_type', 'range_key_name', 'range_key_type', 'includes', 'read_capacity', 'write_capacity']
 INDEX_TYPE_OPTIONS = ['all', 'global_all', 'global_include', 'global_keys_only', 'include', 'keys_only']
 
+# Bounds of the exponential backoff between describes while waiting for ACTIVE
+DYNAMO_WAIT_MIN_DELAY = 1
+DYNAMO_WAIT_MAX_DELAY = 20
+
 
 def create_or_update_dynamo_table(connection, module):
     table_name = module.params.get('name')
@@ -195,16 +208,17 @@ def create_or_update_dynamo_table(connection, module):
     try:
         table = Table(table_name, connection=connection)
 
-
-        if dynamo_table_exists(table):
-            result['changed'] = update_dynamo_table(table, throughput=throughput, check_mode=module.check_mode, global_indexes=global_indexes)
+        description = get_table_description(table)
+        if description:
+            result['changed'], description = update_dynamo_table(table, description, module, throughput=throughput, global_indexes=global_indexes)
         else:
             if not module.check_mode:
                 Table.create(table_name, connection=connection, schema=schema, throughput=throughput, indexes=indexes, global_indexes=global_indexes)
+                description = table.describe()
             result['changed'] = True
 
-        if not module.check_mode:
-            result['table_status'] = table.describe()['Table']['TableStatus']
+        if description:
+            result['table_status'] = description['Table']['TableStatus']
 
     except BotoServerError:
         result['msg'] = 'Failed to create/update dynamo table due to error: ' + traceback.format_exc()
@@ -224,7 +238,7 @@ def delete_dynamo_table(connection, module):
     try:
         table = Table(table_name, connection=connection)
 
-        if dynamo_table_exists(table):
+        if get_table_description(table):
             if not module.check_mode:
                 table.delete()
             result['changed'] = True
@@ -239,62 +253,76 @@ def delete_dynamo_table(connection, module):
         module.exit_json(**result)
 
 
-def dynamo_table_exists(table):
+def get_table_description(table):
+    """Describe the table, populating its details, or return None if it does not exist"""
     try:
-        table.describe()
-        return True
+        return table.describe()
 
     except JSONResponseError, e:
         if e.message and e.message.startswith('Requested resource not found'):
-            return False
+            return None
         else:
             raise e
 
 
-def update_dynamo_table(table, throughput=None, check_mode=False, global_indexes=None):
-    table.describe()  # populate table details
-    throughput_changed = False
-    global_indexes_changed = False
+def is_table_active(description):
+    if description['Table']['TableStatus'] != 'ACTIVE':
+        return False
+    return all(index['IndexStatus'] == 'ACTIVE' for index in description['Table'].get('GlobalSecondaryIndexes', []))
+
+
+def wait_for_table_active(table, description, module):
+    """
+    Describe the table with an exponential backoff until it and all of its
+    global indexes are ACTIVE, and return the last description.
+    """
+    wait_timeout = time.time() + module.params.get('wait_timeout')
+    delay = DYNAMO_WAIT_MIN_DELAY
+    while not is_table_active(description):
+        if time.time() > wait_timeout:
+            module.fail_json(msg='Timed out waiting for table %s and its global indexes to become ACTIVE' % table.table_name,
+                             table_status=description['Table']['TableStatus'])
+        time.sleep(delay)
+        delay = min(delay * 2, DYNAMO_WAIT_MAX_DELAY)
+        description = table.describe()
+    return description
+
+
+def update_dynamo_table(table, description, module, throughput=None, global_indexes=None):
+    """
+    Apply the throughput and global index changes one step at a time, waiting
+    for the table to be ACTIVE before each step. Returns whether anything
+    changed and the last known description of the table.
+    """
+    removed_indexes, added_indexes, index_throughput_changes = get_changed_global_indexes(description, global_indexes)
+
+    steps = []
     if has_throughput_changed(table, throughput):
-        if not check_mode:
-            throughput_changed = table.update(throughput=throughput)
-        else:
-            throughput_changed = True
-
-    removed_indexes, added_indexes, index_throughput_changes = get_changed_global_indexes(table, global_indexes)
-    if removed_indexes:
-        if not check_mode:
-            for name, index in removed_indexes.iteritems():
-                global_indexes_changed = table.delete_global_secondary_index(name) or global_indexes_changed
-        else:
-            global_indexes_changed = True
-
-    if added_indexes:
-        if not check_mode:
-            for name, index in added_indexes.iteritems():
-                global_indexes_changed = table.create_global_secondary_index(global_index=index) or global_indexes_changed
-        else:
-            global_indexes_changed = True
-
+        steps.append(lambda: table.update(throughput=throughput))
+    for name in removed_indexes:
+        steps.append(lambda name=name: table.delete_global_secondary_index(name))
+    for name, index in added_indexes.iteritems():
+        steps.append(lambda index=index: table.create_global_secondary_index(global_index=index))
     if index_throughput_changes:
-        if not check_mode:
-            # todo: remove try once boto has https://github.com/boto/boto/pull/3447 fixed
-            try:
-                global_indexes_changed = table.update_global_secondary_index(global_indexes=index_throughput_changes) or global_indexes_changed
-            except ValidationException as e:
-                pass
-        else:
-            global_indexes_changed = True
+        steps.append(lambda: table.update_global_secondary_index(global_indexes=index_throughput_changes))
+
+    if module.check_mode or not steps:
+        return bool(steps), description
 
-    return throughput_changed or global_indexes_changed
+    changed = False
+    for step in steps:
+        description = wait_for_table_active(table, description, module)
+        changed = step() or changed
+        description = table.describe()
+    return changed, description
 
 
 def has_throughput_changed(table, new_throughput):
     if not new_throughput:
         return False
 
-    return new_throughput['read'] != table.throughput['read'] or \
-           new_throughput['write'] != table.throughput['write']
+    return int(new_throughput['read']) != table.throughput['read'] or \
+           int(new_throughput['write']) != table.throughput['write']
 
 
 def get_schema_param(hash_key_name, hash_key_type, range_key_name, range_key_type):
@@ -310,20 +338,18 @@ def get_schema_param(hash_key_name, hash_key_type, range_key_name, range_key_typ
     return schema
 
 
-def get_changed_global_indexes(table, global_indexes):
-    table.describe()
-
-    table_index_info = dict((index.name, index.schema()) for index in table.global_indexes)
-    table_index_objects = dict((index.name, index) for index in table.global_indexes)
-    set_index_info = dict((index.name, index.schema()) for index in global_indexes)
+def get_changed_global_indexes(description, global_indexes):
+    # boto does not parse the throughput of existing global indexes, so read it from the raw description
+    table_index_throughput = dict((index['IndexName'], index['ProvisionedThroughput'])
+                                  for index in description['Table'].get('GlobalSecondaryIndexes', []))
     set_index_objects = dict((index.name, index) for index in global_indexes)
 
-    removed_indexes = dict((name, index) for name, index in table_index_info.iteritems() if name not in set_index_info)
-    added_indexes = dict((name, set_index_objects[name]) for name, index in set_index_info.iteritems() if name not in table_index_info)
-    # todo: uncomment once boto has https://github.com/boto/boto/pull/3447 fixed
-    # index_throughput_changes = dict((name, index.throughput) for name, index in set_index_objects.iteritems() if name not in added_indexes and (index.throughput['read'] != str(table_index_objects[name].throughput['read']) or index.throughput['write'] != str(table_index_objects[name].throughput['write'])))
-    # todo: remove once boto has https://github.com/boto/boto/pull/3447 fixed
-    index_throughput_changes = dict((name, index.throughput) for name, index in set_index_objects.iteritems() if name not in added_indexes)
+    removed_indexes = [name for name in table_index_throughput if name not in set_index_objects]
+    added_indexes = dict((name, index) for name, index in set_index_objects.iteritems() if name not in table_index_throughput)
+    index_throughput_changes = dict((name, index.throughput) for name, index in set_index_objects.iteritems()
+                                    if name in table_index_throughput and
+                                    (int(index.throughput['read']) != table_index_throughput[name]['ReadCapacityUnits'] or
+                                     int(index.throughput['write']) != table_index_throughput[name]['WriteCapacityUnits']))
 
     return removed_indexes, added_indexes, index_throughput_changes
 
@@ -383,6 +409,7 @@ def main():
         read_capacity=dict(default=1, type='int'),
         write_capacity=dict(default=1, type='int'),
         indexes=dict(default=[], type='list'),
+        wait_timeout=dict(default=600, type='int'),
     ))
 
     module = AnsibleModule(
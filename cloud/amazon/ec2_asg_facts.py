@@ -28,6 +28,18 @@ options:
       - The prefix or name of the auto scaling group(s) you are searching for.
       - "Note: This is a regular expression match with implicit '^' (beginning of string). Append '$' for a complete name match."
     required: false
+  names:
+    description:
+      - A list of exact auto scaling group names to look up. The names are passed to AWS so only these groups are described.
+    required: false
+  regions:
+    description:
+      - A list of regions to search in parallel, the groups found in every region are merged into C(results)
+        and each carries a C(region) key.
+      - Defaults to the region of the connection.
+      - A custom C(ec2_url) is ignored when C(regions) is given, as an endpoint only serves a single region;
+        the default endpoint of every region is used.
+    required: false
   tags:
     description:
       - "A dictionary/hash of tags in the format { tag1_name: 'tag1_value', tag2_name: 'tag2_value' } to match against the auto scaling group(s) you are searching for."
@@ -63,6 +75,16 @@ EXAMPLES = '''
       env: production
   register: asgs
 
+# Describe two groups by their exact names in two regions at once
+- ec2_asg_facts:
+    names:
+      - public-webserver-asg
+      - private-worker-asg
+    regions:
+      - us-east-1
+      - us-west-2
+  register: asgs
+
 # Fail if no groups are found
 - ec2_asg_facts:
     name: public-webserver-asg
@@ -88,6 +110,11 @@ auto_scaling_group_name:
     returned: success
     type: str
     sample: "public-webapp-production-1"
+region:
+    description: The region of the ASG
+    returned: when regions is given
+    type: string
+    sample: "us-west-2"
 availability_zones:
     description: List of Availability Zones that are enabled for this ASG.
     returned: success
@@ -194,6 +221,12 @@ termination_policies:
     sample: ["Default"]
 '''
 
+import re
+from multiprocessing.pool import ThreadPool
+
+# AutoScalingGroupNames accepted per describe_auto_scaling_groups call
+ASG_NAMES_PER_CALL = 50
+
 try:
     import boto3
     from botocore.exceptions import ClientError
@@ -209,12 +242,33 @@ def match_asg_tags(tags_to_match, asg):
         else: return False
     return True
 
-def find_asgs(conn, module, name=None, tags=None):
+def describe_asgs(conn, names=None):
+    """
+    Describe every auto scaling group, following all pages of results.
+
+    When names are given they are sent to AWS in chunks, so only those
+    groups are described. Raises ClientError.
+    """
+    paginator = conn.get_paginator('describe_auto_scaling_groups')
+    if names:
+        calls = [dict(AutoScalingGroupNames=names[i:i + ASG_NAMES_PER_CALL])
+                 for i in range(0, len(names), ASG_NAMES_PER_CALL)]
+    else:
+        calls = [dict()]
+
+    asgs = []
+    for params in calls:
+        for page in paginator.paginate(**params):
+            asgs.extend(page['AutoScalingGroups'])
+    return asgs
+
+def find_asgs(conn, module, name=None, tags=None, names=None):
     """
     Args:
         conn (boto3.AutoScaling.Client): Valid Boto3 ASG client.
         name (str): Optional name of the ASG you are looking for.
         tags (dict): Optional dictionary of tags and values to search for.
+        names (list): Optional list of exact ASG names, filtered by AWS.
 
     Basic Usage:
         >>> name = 'public-webapp-production'
@@ -294,15 +348,21 @@ def find_asgs(conn, module, name=None, tags=None):
     """
 
     try:
-        asgs = conn.describe_auto_scaling_groups()
+        asgs = describe_asgs(conn, names)
     except ClientError as e:
         module.fail_json(msg=e.message, **camel_dict_to_snake_dict(e.response))
 
+    return match_asgs(asgs, name, tags)
+
+
+def match_asgs(asgs, name=None, tags=None):
+    """Filter described groups by name prefix and tags, converting only the matches"""
     matched_asgs = []
-    name_prog = re.compile(r'^' + name)
-    for asg in asgs['AutoScalingGroups']:
+    if name:
+        name_prog = re.compile(r'^' + name)
+    for asg in asgs:
         if name:
-            matched_name = name_prog.search(asg['auto_scaling_group_name'])
+            matched_name = name_prog.search(asg['AutoScalingGroupName'])
         else:
             matched_name = True
 
@@ -317,12 +377,44 @@ def find_asgs(conn, module, name=None, tags=None):
     return matched_asgs
 
 
+def find_asgs_in_regions(module, regions, name=None, tags=None, names=None):
+    """Search every region from its own thread and merge the results in region order"""
+    region, ec2_url, aws_connect_kwargs = get_aws_connection_info(module, boto3=True)
+    # ec2_url is ignored, a custom endpoint only serves one region
+    # clients are thread safe, but creating them is not
+    conns = [boto3_conn(module, conn_type='client', resource='autoscaling', region=r, endpoint=None, **aws_connect_kwargs)
+             for r in regions]
+
+    def describe(conn):
+        try:
+            return describe_asgs(conn, names), None
+        except ClientError as e:
+            return None, e
+
+    pool = ThreadPool(len(conns))
+    try:
+        described = pool.map(describe, conns)
+    finally:
+        pool.close()
+
+    results = []
+    for region, (asgs, error) in zip(regions, described):
+        if error is not None:
+            module.fail_json(msg="%s: %s" % (region, error.message), **camel_dict_to_snake_dict(error.response))
+        for asg in match_asgs(asgs, name, tags):
+            asg['region'] = region
+            results.append(asg)
+    return results
+
+
 def main():
 
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
             name=dict(type='str'),
+            names=dict(type='list'),
+            regions=dict(type='list'),
             tags=dict(type='dict'),
         )
     )
@@ -333,6 +425,11 @@ def main():
 
     asg_name = module.params.get('name')
     asg_tags = module.params.get('tags')
+    asg_names = module.params.get('names')
+
+    if module.params.get('regions'):
+        results = find_asgs_in_regions(module, module.params.get('regions'), name=asg_name, tags=asg_tags, names=asg_names)
+        module.exit_json(results=results)
 
     try:
         region, ec2_url, aws_connect_kwargs = get_aws_connection_info(module, boto3=True)
@@ -340,7 +437,7 @@ def main():
     except ClientError as e:
         module.fail_json(msg=e.message, **camel_dict_to_snake_dict(e.response))
 
-    results = find_asgs(autoscaling, module, name=asg_name, tags=asg_tags)
+    results = find_asgs(autoscaling, module, name=asg_name, tags=asg_tags, names=asg_names)
     module.exit_json(results=results)
 
 # import module snippets
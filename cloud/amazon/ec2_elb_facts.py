@@ -74,14 +74,42 @@ EXAMPLES = '''
 
 '''
 
+import threading
+from multiprocessing.pool import ThreadPool
+
 try:
     import boto.ec2.elb
     from boto.ec2.tag import Tag
     from boto.exception import BotoServerError
+    from boto.resultset import ResultSet
     HAS_BOTO = True
 except ImportError:
     HAS_BOTO = False
 
+# Load balancer names accepted per DescribeLoadBalancers and DescribeTags call
+ELB_NAMES_PER_CALL = 20
+
+# Upper bound on concurrent DescribeTags and DescribeInstanceHealth calls
+ELB_MAX_THREADS = 10
+
+
+class ElbTagDescription(object):
+    """ Parses one TagDescriptions member of a DescribeTags response """
+
+    def __init__(self, connection=None):
+        self.load_balancer_name = None
+        self.tags = []
+
+    def startElement(self, name, attrs, connection):
+        if name == 'Tags':
+            self.tags = ResultSet([('member', Tag)])
+            return self.tags
+
+    def endElement(self, name, value, connection):
+        if name == 'LoadBalancerName':
+            self.load_balancer_name = value
+
+
 class ElbInformation(object):
     """ Handles ELB information """
 
@@ -96,15 +124,41 @@ class ElbInformation(object):
         self.region = region
         self.aws_connect_params = aws_connect_params
         self.connection = self._get_elb_connection()
+        self.local = threading.local()
 
-    def _get_tags(self, elbname):
-        params = {'LoadBalancerNames.member.1': elbname}
+    def _get_connection(self):
+        # boto connections are not thread safe, every worker thread gets its own
+        if not hasattr(self.local, 'connection'):
+            self.local.connection = self._get_elb_connection()
+        return self.local.connection
+
+    def _get_tags(self, elbnames):
+        params = {}
+        self.connection.build_list_params(params, elbnames, 'LoadBalancerNames.member.%d')
         try:
-            elb_tags = self.connection.get_list('DescribeTags', params, [('member', Tag)])
-            return dict((tag.Key, tag.Value) for tag in elb_tags if hasattr(tag, 'Key'))
+            descriptions = self._get_connection().get_list('DescribeTags', params, [('member', ElbTagDescription)])
+            return dict((description.load_balancer_name,
+                         dict((tag.Key, tag.Value) for tag in description.tags if hasattr(tag, 'Key')))
+                        for description in descriptions)
         except:
             return {}
 
+    def _run_concurrently(self, func, items):
+        """ Call func on every item from a bounded pool, returns (result, error) tuples in order """
+        def run(item):
+            try:
+                return func(item), None
+            except BotoServerError as err:
+                return None, err
+
+        if not items:
+            return []
+        pool = ThreadPool(min(ELB_MAX_THREADS, len(items)))
+        try:
+            return pool.map(run, items)
+        finally:
+            pool.close()
+
     def _get_elb_connection(self):
         try:
             return connect_to_aws(boto.ec2.elb, self.region, **self.aws_connect_params)
@@ -155,7 +209,7 @@ class ElbInformation(object):
             health_check_dict['ping_path'] = path
         return health_check_dict
 
-    def _get_elb_info(self, elb):
+    def _get_elb_info(self, elb, tags=None):
         elb_info = {
             'name': elb.name,
             'zones': elb.availability_zones,
@@ -175,17 +229,15 @@ class ElbInformation(object):
             'instances_outofservice': [],
             'instances_outofservice_count': 0,
             'instances_inservice_percent': 0.0,
-            'tags': self._get_tags(elb.name)
+            'tags': tags or {}
         }
 
         if elb.vpc_id:
             elb_info['vpc_id'] = elb.vpc_id
 
         if elb.instances:
-            try:
-                instance_health = self.connection.describe_instance_health(elb.name)
-            except BotoServerError as err:
-                self.module.fail_json(msg=err.message)
+            # runs in a worker thread, BotoServerError is reported by list_elbs
+            instance_health = self._get_connection().describe_instance_health(elb.name)
             elb_info['instances_inservice'] = [inst.instance_id for inst in instance_health if inst.state == 'InService']
             elb_info['instances_inservice_count'] = len(elb_info['instances_inservice'])
             elb_info['instances_outofservice'] = [inst.instance_id for inst in instance_health if inst.state == 'OutOfService']
@@ -196,18 +248,47 @@ class ElbInformation(object):
         return elb_info
 
 
-    def list_elbs(self):
-        elb_array = []
+    def _get_all_elbs(self, names=None):
+        if names:
+            chunks = [names[i:i + ELB_NAMES_PER_CALL] for i in range(0, len(names), ELB_NAMES_PER_CALL)]
+        else:
+            chunks = [None]
+
+        all_elbs = []
+        for chunk in chunks:
+            marker = None
+            while True:
+                result = self.connection.get_all_load_balancers(load_balancer_names=chunk, marker=marker)
+                all_elbs.extend(result)
+                marker = result.next_marker
+                if not marker:
+                    break
+        return all_elbs
 
+    def list_elbs(self):
         try:
-            all_elbs = self.connection.get_all_load_balancers()
+            try:
+                all_elbs = self._get_all_elbs(self.names)
+            except BotoServerError as err:
+                # A single unknown name fails the whole call, list every ELB
+                # instead so unknown names are skipped.
+                if not self.names or err.error_code != 'LoadBalancerNotFound':
+                    raise
+                all_elbs = [lb for lb in self._get_all_elbs() if lb.name in self.names]
         except BotoServerError as err:
             self.module.fail_json(msg = "%s: %s" % (err.error_code, err.error_message))
 
-        if all_elbs:
-            for existing_lb in all_elbs:
-                if existing_lb.name in self.names:
-                    elb_array.append(self._get_elb_info(existing_lb))
+        elb_names = [lb.name for lb in all_elbs]
+        tags = {}
+        for elb_tags, err in self._run_concurrently(self._get_tags,
+                [elb_names[i:i + ELB_NAMES_PER_CALL] for i in range(0, len(elb_names), ELB_NAMES_PER_CALL)]):
+            tags.update(elb_tags)
+
+        elb_array = []
+        for elb_info, err in self._run_concurrently(lambda lb: self._get_elb_info(lb, tags.get(lb.name)), all_elbs):
+            if err is not None:
+                self.module.fail_json(msg=err.message)
+            elb_array.append(elb_info)
 
         return elb_array
 
@@ -26,6 +26,29 @@ options:
       - A dict of filters to apply. Each dict item consists of a filter key and a filter value. See U(http://docs.aws.amazon.com/AWSEC2/latest/APIReference/API_DescribeInstances.html) for possible filters.
     required: false
     default: null
+  max_results:
+    description:
+      - The maximum number of instances to gather. Requires boto3.
+    required: false
+    default: null
+    version_added: "2.2"
+  fields:
+    description:
+      - A list of instance keys to return, e.g. C(id), C(state) and C(tags). Every other key is dropped, and the
+        C(groups), C(interfaces) and C(block_device_mapping) lists are only built when requested. Requires boto3.
+    required: false
+    default: null
+    version_added: "2.2"
+  regions:
+    description:
+      - A list of regions to query in parallel, the instances of every region are merged into C(instances).
+        Requires boto3.
+    required: false
+    default: null
+    version_added: "2.2"
+notes:
+  - When I(max_results), I(fields) or I(regions) is set the instances are gathered with boto3, page by page,
+    otherwise boto is used.
 author:
     - "Michael Schuett (@michaeljs1990)"
 extends_documentation_fragment:
@@ -50,6 +73,18 @@ EXAMPLES = '''
     filters:
       instance-id: i-123456
 
+# Gather the id and state of every running instance in two regions
+- ec2_remote_facts:
+    regions:
+      - us-east-1
+      - eu-west-1
+    filters:
+      instance-state-name: running
+    fields:
+      - id
+      - state
+      - region
+
 # Gather facts about all instances in vpc-123456 that are t2.small type
 - ec2_remote_facts:
     filters:
@@ -58,6 +93,8 @@ EXAMPLES = '''
 
 '''
 
+from multiprocessing.pool import ThreadPool
+
 try:
     import boto.ec2
     from boto.exception import BotoServerError
@@ -65,6 +102,16 @@ try:
 except ImportError:
     HAS_BOTO = False
 
+try:
+    import boto3
+    from botocore.exceptions import ClientError
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+# Largest page DescribeInstances returns
+EC2_MAX_PAGE_SIZE = 1000
+
 def get_instance_info(instance):
 
     # Get groups
@@ -137,6 +184,130 @@ def get_instance_info(instance):
     return instance_info
 
 
+def get_instance_info_boto3(instance, reservation, region, fields=None):
+    """
+    Build the same dict as get_instance_info from a boto3 instance,
+    skipping the nested lists that are not in fields.
+    """
+
+    def wanted(key):
+        return not fields or key in fields
+
+    instance_info = { 'id': instance['InstanceId'],
+                    'kernel': instance.get('KernelId'),
+                    'instance_profile': None,
+                    'root_device_type': instance.get('RootDeviceType'),
+                    'private_dns_name': instance.get('PrivateDnsName'),
+                    'public_dns_name': instance.get('PublicDnsName'),
+                    'ebs_optimized': instance.get('EbsOptimized'),
+                    'client_token': instance.get('ClientToken'),
+                    'virtualization_type': instance.get('VirtualizationType'),
+                    'architecture': instance.get('Architecture'),
+                    'ramdisk': instance.get('RamdiskId'),
+                    'tags': dict((tag['Key'], tag['Value']) for tag in instance.get('Tags', [])),
+                    'key_name': instance.get('KeyName'),
+                    # If an instance is terminated, sourceDestCheck is no longer returned
+                    'source_destination_check': instance.get('SourceDestCheck'),
+                    'image_id': instance.get('ImageId'),
+                    'spot_instance_request_id': instance.get('SpotInstanceRequestId'),
+                    'requester_id': reservation.get('RequesterId'),
+                    'monitoring_state': instance.get('Monitoring', {}).get('State'),
+                    'placement': {
+                                  'tenancy': instance.get('Placement', {}).get('Tenancy'),
+                                  'zone': instance.get('Placement', {}).get('AvailabilityZone')
+                                 },
+                    'ami_launch_index': instance.get('AmiLaunchIndex'),
+                    'launch_time': instance['LaunchTime'].strftime('%Y-%m-%dT%H:%M:%S.000Z'),
+                    'hypervisor': instance.get('Hypervisor'),
+                    'region': region,
+                    'persistent': False,
+                    'private_ip_address': instance.get('PrivateIpAddress'),
+                    'public_ip_address': instance.get('PublicIpAddress'),
+                    'state': instance['State']['Name'],
+                    'vpc_id': instance.get('VpcId'),
+                  }
+
+    if 'IamInstanceProfile' in instance:
+        instance_info['instance_profile'] = { 'arn': instance['IamInstanceProfile']['Arn'],
+                                              'id': instance['IamInstanceProfile']['Id'] }
+
+    if wanted('groups'):
+        instance_info['groups'] = [{ 'id': group['GroupId'], 'name': group['GroupName'] }
+                                   for group in instance.get('SecurityGroups', [])]
+
+    if wanted('interfaces'):
+        instance_info['interfaces'] = [{ 'id': interface['NetworkInterfaceId'], 'mac_address': interface['MacAddress'] }
+                                       for interface in instance.get('NetworkInterfaces', [])]
+
+    if wanted('block_device_mapping'):
+        instance_info['block_device_mapping'] = [{
+                'device_name': bdm['DeviceName'],
+                'status': bdm['Ebs']['Status'],
+                'volume_id': bdm['Ebs']['VolumeId'],
+                'delete_on_termination': bdm['Ebs']['DeleteOnTermination'],
+                'attach_time': bdm['Ebs']['AttachTime'].strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            } for bdm in instance.get('BlockDeviceMappings', []) if 'Ebs' in bdm]
+
+    if fields:
+        instance_info = dict((k, v) for k, v in instance_info.items() if k in fields)
+
+    return instance_info
+
+
+def describe_ec2_instances(connection, region, module):
+    """
+    Gather the instances of one region page by page, converting every page
+    as it arrives. Raises ClientError.
+    """
+
+    filters = ansible_dict_to_boto3_filter_list(module.params.get("filters") or {})
+    fields = module.params.get("fields")
+    pagination_config = dict(PageSize=EC2_MAX_PAGE_SIZE)
+    if module.params.get("max_results"):
+        pagination_config['MaxItems'] = module.params.get("max_results")
+
+    instance_dict_array = []
+    paginator = connection.get_paginator('describe_instances')
+    for page in paginator.paginate(Filters=filters, PaginationConfig=pagination_config):
+        for reservation in page['Reservations']:
+            for instance in reservation['Instances']:
+                instance_dict_array.append(get_instance_info_boto3(instance, reservation, region, fields))
+    return instance_dict_array
+
+
+def list_ec2_instances_boto3(module, regions):
+    """Query every region from its own thread and merge the instances in region order"""
+
+    region, ec2_url, aws_connect_params = get_aws_connection_info(module, boto3=True)
+    # clients are thread safe, but creating them is not
+    connections = [(r, boto3_conn(module, conn_type='client', resource='ec2', region=r,
+                                  endpoint=ec2_url if len(regions) == 1 else None, **aws_connect_params))
+                   for r in regions]
+
+    def describe(args):
+        try:
+            return describe_ec2_instances(args[1], args[0], module), None
+        except ClientError as e:
+            return None, e
+
+    pool = ThreadPool(len(connections))
+    try:
+        results = pool.map(describe, connections)
+    finally:
+        pool.close()
+
+    instance_dict_array = []
+    for r, (instances, error) in zip(regions, results):
+        if error is not None:
+            module.fail_json(msg="%s: %s" % (r, error.message))
+        instance_dict_array.extend(instances)
+        if module.params.get("max_results") and len(instance_dict_array) >= module.params.get("max_results"):
+            instance_dict_array = instance_dict_array[:module.params.get("max_results")]
+            break
+
+    module.exit_json(instances=instance_dict_array)
+
+
 def list_ec2_instances(connection, module):
 
     filters = module.params.get("filters")
@@ -157,12 +328,26 @@ def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
-            filters = dict(default=None, type='dict')
+            filters = dict(default=None, type='dict'),
+            max_results = dict(default=None, type='int'),
+            fields = dict(default=None, type='list'),
+            regions = dict(default=None, type='list'),
         )
     )
 
     module = AnsibleModule(argument_spec=argument_spec)
 
+    if module.params.get('max_results') or module.params.get('fields') or module.params.get('regions'):
+        if not HAS_BOTO3:
+            module.fail_json(msg='boto3 is required for max_results, fields and regions')
+        regions = module.params.get('regions')
+        if not regions:
+            region, ec2_url, aws_connect_params = get_aws_connection_info(module, boto3=True)
+            if not region:
+                module.fail_json(msg="region must be specified")
+            regions = [region]
+        list_ec2_instances_boto3(module, regions)
+
     if not HAS_BOTO:
         module.fail_json(msg='boto required for this module')
 
@@ -47,6 +47,26 @@ options:
       names and values are case sensitive.
     required: false
     default: {}
+  max_results:
+    description:
+      - The maximum number of snapshots to gather. All pages of snapshots are gathered when not set.
+    required: false
+    default: null
+    version_added: "2.2"
+  fields:
+    description:
+      - A list of snapshot keys to return, e.g. C(snapshot_id) and C(tags). Every other key is dropped from each \
+      snapshot as it is gathered. All keys are returned when not set.
+    required: false
+    default: null
+    version_added: "2.2"
+  summarize_by:
+    description:
+      - Instead of returning the snapshots, return their count and total volume size per C(volume) or per value of a \
+      tag given as C(tag:<tag key>) in C(summary).
+    required: false
+    default: null
+    version_added: "2.2"
 notes:
   - By default, the module will return all snapshots, including public ones. To limit results to snapshots owned by \
   the account use the filter 'owner-id'.
@@ -87,6 +107,21 @@ EXAMPLES = '''
     filters:
       "tag:Name": Example
 
+# Gather the id and start time of the first 500 snapshots owned by the account
+- ec2_snapshot_facts:
+    filters:
+      owner-id: 0123456789
+    max_results: 500
+    fields:
+      - snapshot_id
+      - start_time
+
+# Count the snapshots and their size per value of the Name tag
+- ec2_snapshot_facts:
+    filters:
+      owner-id: 0123456789
+    summarize_by: "tag:Name"
+
 # Gather facts about any snapshot with an error status
 - ec2_snapshot_facts:
     filters:
@@ -153,6 +188,12 @@ data_encryption_key_id:
     corresponds to the data encryption key that was used to encrypt the original volume or snapshot copy.
     type: string
     sample: "arn:aws:kms:ap-southeast-2:012345678900:key/74c9742a-a1b2-45cb-b3fe-abcdef123456"
+summary:
+    description: The number of snapshots, their total volume size in GiB and the oldest and newest start time per \
+    volume id or tag value, snapshots without the tag are counted under an empty string. Only returned with \
+    summarize_by, in which case snapshots is not returned.
+    type: dict
+    sample: "{ 'web': { 'count': 2, 'volume_size': 16, 'oldest': '2016-08-29T13:45:55+00:00', 'newest': '2016-08-30T13:45:55+00:00' } }"
 
 '''
 
@@ -164,28 +205,70 @@ except ImportError:
     HAS_BOTO3 = False
 
 
+def summarize_snapshot(summary, snapshot, summarize_by):
+    if summarize_by == 'volume':
+        key = snapshot.get('volume_id', '')
+    else:
+        key = snapshot.get('tags', {}).get(summarize_by[len('tag:'):], '')
+
+    group = summary.setdefault(key, dict(count=0, volume_size=0, oldest=None, newest=None))
+    group['count'] += 1
+    group['volume_size'] += snapshot.get('volume_size', 0)
+    start_time = snapshot.get('start_time')
+    if start_time is not None:
+        if group['oldest'] is None or start_time < group['oldest']:
+            group['oldest'] = start_time
+        if group['newest'] is None or start_time > group['newest']:
+            group['newest'] = start_time
+
+
 def list_ec2_snapshots(connection, module):
 
     snapshot_ids = module.params.get("snapshot_ids")
     owner_ids = module.params.get("owner_ids")
     restorable_by_user_ids = module.params.get("restorable_by_user_ids")
     filters = ansible_dict_to_boto3_filter_list(module.params.get("filters"))
+    max_results = module.params.get("max_results")
+    fields = module.params.get("fields")
+    summarize_by = module.params.get("summarize_by")
 
-    try:
-        snapshots = connection.describe_snapshots(SnapshotIds=snapshot_ids, OwnerIds=owner_ids, RestorableByUserIds=restorable_by_user_ids, Filters=filters)
-    except ClientError, e:
-        module.fail_json(msg=e.message)
+    if summarize_by and summarize_by != 'volume' and not summarize_by.startswith('tag:'):
+        module.fail_json(msg="summarize_by must be volume or tag:<tag key>, got %s" % summarize_by)
+
+    pagination_config = dict()
+    if max_results:
+        pagination_config['MaxItems'] = max_results
+    if not snapshot_ids:
+        # MaxResults can not be combined with SnapshotIds
+        pagination_config['PageSize'] = 1000
 
-    # Turn the boto3 result in to ansible_friendly_snaked_names
     snaked_snapshots = []
-    for snapshot in snapshots['Snapshots']:
-        snaked_snapshots.append(camel_dict_to_snake_dict(snapshot))
+    summary = dict()
+    try:
+        paginator = connection.get_paginator('describe_snapshots')
+        pages = paginator.paginate(SnapshotIds=snapshot_ids, OwnerIds=owner_ids, RestorableByUserIds=restorable_by_user_ids,
+                                   Filters=filters, PaginationConfig=pagination_config)
+        # Convert every page as it arrives so only the requested data is kept
+        for page in pages:
+            for snapshot in page['Snapshots']:
+                # Turn the boto3 result in to ansible_friendly_snaked_names
+                snapshot = camel_dict_to_snake_dict(snapshot)
 
-    # Turn the boto3 result in to ansible friendly tag dictionary
-    for snapshot in snaked_snapshots:
-        if 'tags' in snapshot:
-            snapshot['tags'] = boto3_tag_list_to_ansible_dict(snapshot['tags'])
+                # Turn the boto3 result in to ansible friendly tag dictionary
+                if 'tags' in snapshot:
+                    snapshot['tags'] = boto3_tag_list_to_ansible_dict(snapshot['tags'])
+
+                if summarize_by:
+                    summarize_snapshot(summary, snapshot, summarize_by)
+                    continue
+                if fields:
+                    snapshot = dict((k, v) for k, v in snapshot.items() if k in fields)
+                snaked_snapshots.append(snapshot)
+    except ClientError, e:
+        module.fail_json(msg=e.message)
 
+    if summarize_by:
+        module.exit_json(summary=summary)
     module.exit_json(snapshots=snaked_snapshots)
 
 
@@ -197,7 +280,10 @@ def main():
             snapshot_ids=dict(default=[], type='list'),
             owner_ids=dict(default=[], type='list'),
             restorable_by_user_ids=dict(default=[], type='list'),
-            filters=dict(default={}, type='dict')
+            filters=dict(default={}, type='dict'),
+            max_results=dict(type='int'),
+            fields=dict(type='list'),
+            summarize_by=dict(type='str'),
         )
     )
 
@@ -121,6 +121,8 @@ task:
   type: dictionary
 '''
 
+from multiprocessing.pool import ThreadPool
+
 try:
     import json
     import botocore
@@ -145,6 +147,9 @@ DEFAULT_EGRESS = dict(DEFAULT_RULE_FIELDS.items() + [('Egress', True)])
 # http://www.iana.org/assignments/protocol-numbers/protocol-numbers.xhtml
 PROTOCOL_NUMBERS = {'all': -1, 'icmp': 1, 'tcp': 6, 'udp': 17, }
 
+# Upper bound on concurrent NACL entry calls
+NACL_MAX_THREADS = 5
+
 
 #Utility methods
 def icmp_present(entry):
@@ -217,9 +222,15 @@ def nacls_changed(nacl, client, module):
     tmp_ingress = [entry for entry in entries if entry['Egress'] is False]
     egress = [rule for rule in tmp_egress if DEFAULT_EGRESS != rule]
     ingress = [rule for rule in tmp_ingress if DEFAULT_INGRESS != rule]
-    if rules_changed(egress, params['egress'], True, nacl_id, client, module):
-        changed = True
-    if rules_changed(ingress, params['ingress'], False, nacl_id, client, module):
+    upserts, deletes = rules_changed(egress, params['egress'], True, nacl_id)
+    ingress_upserts, ingress_deletes = rules_changed(ingress, params['ingress'], False, nacl_id)
+    upserts += ingress_upserts
+    deletes += ingress_deletes
+    if upserts or deletes:
+        # Create and replace first, so rules that move to another number
+        # exist at the new one before the old one is deleted.
+        apply_entry_changes(upserts, client, module)
+        apply_entry_changes(deletes, client, module)
         changed = True
     return changed
 
@@ -247,30 +258,49 @@ def tags_changed(nacl_id, client, module):
     return changed
 
 
-def rules_changed(aws_rules, param_rules, Egress, nacl_id, client, module):
-    changed = False
-    rules = list()
+def rules_changed(aws_rules, param_rules, Egress, nacl_id):
+    """
+    Diff the rules of one direction keyed by (RuleNumber, Egress).
+
+    Returns the entry calls to make as (method, params) tuples, creates and
+    in place replacements first, deletes second.
+    """
+    rules = dict()
     for entry in param_rules:
-        rules.append(process_rule_entry(entry, Egress))
-    if rules == aws_rules:
-        return changed
-    else:
-        removed_rules = [x for x in aws_rules if x not in rules]
-        if removed_rules:
-            params = dict()
-            for rule in removed_rules:
-                params['NetworkAclId'] = nacl_id
-                params['RuleNumber'] = rule['RuleNumber']
-                params['Egress'] = Egress
-                delete_network_acl_entry(params, client, module)
-            changed = True
-        added_rules = [x for x in rules if x not in aws_rules]
-        if added_rules:
-            for rule in added_rules:
-                rule['NetworkAclId'] = nacl_id
-                create_network_acl_entry(rule, client, module)
-            changed = True
-    return changed
+        rule = process_rule_entry(entry, Egress)
+        rules[(rule['RuleNumber'], rule['Egress'])] = rule
+    current = dict(((rule['RuleNumber'], rule['Egress']), rule) for rule in aws_rules)
+
+    upserts = []
+    for key, rule in rules.items():
+        if key not in current:
+            upserts.append(('create_network_acl_entry', dict(rule, NetworkAclId=nacl_id)))
+        elif current[key] != rule:
+            upserts.append(('replace_network_acl_entry', dict(rule, NetworkAclId=nacl_id)))
+
+    deletes = [('delete_network_acl_entry', dict(NetworkAclId=nacl_id, RuleNumber=key[0], Egress=key[1]))
+               for key in current if key not in rules]
+    return upserts, deletes
+
+
+def apply_entry_changes(changes, client, module):
+    """Run independent NACL entry calls concurrently, failing once all returned"""
+    def apply(change):
+        method, params = change
+        try:
+            getattr(client, method)(**params)
+        except botocore.exceptions.ClientError as e:
+            return str(e)
+
+    if not changes:
+        return
+    pool = ThreadPool(min(NACL_MAX_THREADS, len(changes)))
+    try:
+        errors = [error for error in pool.map(apply, changes) if error is not None]
+    finally:
+        pool.close()
+    if errors:
+        module.fail_json(msg='; '.join(errors))
 
 
 def process_rule_entry(entry, Egress):
@@ -299,14 +329,10 @@ def restore_default_associations(assoc_ids, default_nacl_id, client, module):
 
 
 def construct_acl_entries(nacl, client, module):
-    for entry in module.params.get('ingress'):
-        params = process_rule_entry(entry, Egress=False)
-        params['NetworkAclId'] = nacl['NetworkAcl']['NetworkAclId']
-        create_network_acl_entry(params, client, module)
-    for rule in module.params.get('egress'):
-        params = process_rule_entry(rule, Egress=True)
-        params['NetworkAclId'] = nacl['NetworkAcl']['NetworkAclId']
-        create_network_acl_entry(params, client, module)
+    nacl_id = nacl['NetworkAcl']['NetworkAclId']
+    ingress = rules_changed([], module.params.get('ingress'), False, nacl_id)[0]
+    egress = rules_changed([], module.params.get('egress'), True, nacl_id)[0]
+    apply_entry_changes(ingress + egress, client, module)
 
 
 ## Module invocations
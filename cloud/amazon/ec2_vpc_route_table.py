@@ -310,22 +310,27 @@ def rename_key(d, old_key, new_key):
     del d[old_key]
 
 
-def index_of_matching_route(route_spec, routes_to_match):
-    for i, route in enumerate(routes_to_match):
-        if route_spec_matches_route(route_spec, route):
-            return i
-
-
 def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
                   check_mode):
-    routes_to_match = list(route_table.routes)
+    # A route table holds at most one route per destination CIDR block, so
+    # every route spec only has to be compared with the route it would
+    # replace.
+    routes_to_match = dict((r.destination_cidr_block, r) for r in route_table.routes
+                           if r.destination_cidr_block)
     route_specs_to_create = []
+    route_specs_to_replace = []
     for route_spec in route_specs:
-        i = index_of_matching_route(route_spec, routes_to_match)
-        if i is None:
+        route = routes_to_match.pop(route_spec['destination_cidr_block'], None)
+        if route is None:
             route_specs_to_create.append(route_spec)
-        else:
-            del routes_to_match[i]
+        elif propagating_vgw_ids and route.gateway_id in propagating_vgw_ids:
+            # boto does not expose the origin of a route, so like the deletes
+            # below, routes through a propagating VGW are left alone
+            continue
+        elif not route_spec_matches_route(route_spec, route):
+            route_specs_to_replace.append(route_spec)
+    routes_to_match = routes_to_match.values() + [r for r in route_table.routes
+                                                  if not r.destination_cidr_block]
 
     # NOTE: As of boto==2.38.0, the origin of a route is not available
     # (for example, whether it came from a gateway with route propagation
@@ -342,7 +347,7 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
         else:
             routes_to_delete.append(r)
 
-    changed = bool(routes_to_delete or route_specs_to_create)
+    changed = bool(routes_to_delete or route_specs_to_create or route_specs_to_replace)
     if changed:
         for route in routes_to_delete:
             try:
@@ -353,6 +358,19 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
                 if e.error_code == 'DryRunOperation':
                     pass
 
+        # Changing the target in place avoids the blackhole a delete and
+        # create would leave in between.
+        for route_spec in route_specs_to_replace:
+            try:
+                vpc_conn.replace_route(route_table.id,
+                                       dry_run=check_mode,
+                                       **route_spec)
+            except EC2ResponseError as e:
+                # a failed replace leaves the old target in place, so it
+                # must not be reported as a change
+                if e.error_code != 'DryRunOperation':
+                    raise
+
         for route_spec in route_specs_to_create:
             try:
                 vpc_conn.create_route(route_table.id,
@@ -365,25 +383,22 @@ def ensure_routes(vpc_conn, route_table, route_specs, propagating_vgw_ids,
     return {'changed': bool(changed)}
 
 
-def ensure_subnet_association(vpc_conn, vpc_id, route_table_id, subnet_id,
-                              check_mode):
+def get_subnet_associations(vpc_conn, vpc_id, subnet_ids):
+    """Map every subnet id to its (route table id, association id) with one API call"""
+    associations = {}
+    if not subnet_ids:
+        return associations
+
     route_tables = vpc_conn.get_all_route_tables(
-        filters={'association.subnet_id': subnet_id, 'vpc_id': vpc_id}
+        filters={'association.subnet_id': subnet_ids, 'vpc_id': vpc_id}
     )
     for route_table in route_tables:
         if route_table.id is None:
             continue
         for a in route_table.associations:
-            if a.subnet_id == subnet_id:
-                if route_table.id == route_table_id:
-                    return {'changed': False, 'association_id': a.id}
-                else:
-                    if check_mode:
-                        return {'changed': True}
-                    vpc_conn.disassociate_route_table(a.id)
-
-    association_id = vpc_conn.associate_route_table(route_table_id, subnet_id)
-    return {'changed': True, 'association_id': association_id}
+            if a.subnet_id in subnet_ids:
+                associations[a.subnet_id] = (route_table.id, a.id)
+    return associations
 
 
 def ensure_subnet_associations(vpc_conn, vpc_id, route_table, subnets,
@@ -391,13 +406,19 @@ def ensure_subnet_associations(vpc_conn, vpc_id, route_table, subnets,
     current_association_ids = [a.id for a in route_table.associations]
     new_association_ids = []
     changed = False
+    associations = get_subnet_associations(vpc_conn, vpc_id, [subnet.id for subnet in subnets])
     for subnet in subnets:
-        result = ensure_subnet_association(
-            vpc_conn, vpc_id, route_table.id, subnet.id, check_mode)
-        changed = changed or result['changed']
-        if changed and check_mode:
+        route_table_id, association_id = associations.get(subnet.id, (None, None))
+        if route_table_id == route_table.id:
+            new_association_ids.append(association_id)
+            continue
+
+        changed = True
+        if check_mode:
             return {'changed': True}
-        new_association_ids.append(result['association_id'])
+        if association_id is not None:
+            vpc_conn.disassociate_route_table(association_id)
+        new_association_ids.append(vpc_conn.associate_route_table(route_table.id, subnet.id))
 
     to_delete = [a_id for a_id in current_association_ids
                  if a_id not in new_association_ids]
@@ -34,12 +34,15 @@ options:
     state:
         description:
           - The desired state of the service
-        required: true
+          - Required unless C(services) is given, where it is the default state of every service and
+            defaults to C(present). C(deleting) is not supported with C(services).
+        required: false
         choices: ["present", "absent", "deleting"]
     name:
         description:
           - The name of the service
-        required: true
+          - Required unless C(services) is given.
+        required: false
     cluster:
         description:
           - The name of the cluster in which the service exists
@@ -75,6 +78,31 @@ options:
           - The number of times to check that the service is available
         required: false
         default: 10
+    services:
+        description:
+          - A list of services to converge in one task, each a dict with the C(name), C(state), C(cluster),
+            C(task_definition), C(load_balancers), C(desired_count), C(client_token) and C(role) keys of the single
+            service options. Missing keys default to the module options.
+          - Only the C(present) and C(absent) states are supported per service.
+          - Services are described 10 per call and created, updated or deleted concurrently.
+          - Mutually exclusive with C(name).
+        required: false
+        default: null
+        version_added: "2.2"
+    wait:
+        description:
+          - Wait for created and updated services to reach a steady state, a single deployment running the desired
+            count of tasks, and for deleted services to become C(INACTIVE).
+          - All services are polled together, every C(delay) seconds.
+        required: false
+        default: false
+        version_added: "2.2"
+    wait_timeout:
+        description:
+          - How long to wait, in seconds, when C(wait=true).
+        required: false
+        default: 600
+        version_added: "2.2"
 extends_documentation_fragment:
     - aws
     - ec2
@@ -100,6 +128,22 @@ EXAMPLES = '''
     name: default
     state: absent
     cluster: new_cluster
+
+# Roll a new task definition out to several services and wait for all of them
+- ecs_service:
+    state: present
+    cluster: new_cluster
+    desired_count: 2
+    wait: true
+    services:
+      - name: frontend
+        task_definition: frontend-task:7
+      - name: backend
+        task_definition: backend-task:12
+        desired_count: 4
+      - name: legacy
+        cluster: old_cluster
+        state: absent
 '''
 
 RETURN = '''
@@ -174,6 +218,17 @@ ansible_facts:
             description: Details of deleted service in the same structure described above for service creation.
             returned: when service existed and was deleted
             type: complex
+wait_seconds:
+    description: How long the service took to reach a steady state.
+    returned: when wait is true and the service was created or updated
+    type: float
+    sample: 84.3
+services:
+    description: The result of every entry of services, with its name, cluster, state, action (create, update,
+                 delete or null), changed, service details and, when waited on, wait_seconds.
+    returned: when services is given
+    type: list
+    sample: [{"name": "frontend", "cluster": "new_cluster", "state": "present", "action": "update", "changed": true, "wait_seconds": 84.3}]
 '''
 try:
     import boto
@@ -188,6 +243,15 @@ try:
 except ImportError:
     HAS_BOTO3 = False
 
+import time
+from multiprocessing.pool import ThreadPool
+
+# DescribeServices accepts at most 10 services per call
+ECS_DESCRIBE_SERVICES_MAX = 10
+ECS_MAX_THREADS = 10
+
+SERVICE_OPTIONS = ['state', 'cluster', 'task_definition', 'load_balancers', 'desired_count', 'client_token', 'role']
+
 class EcsServiceManager:
     """Handles ECS Services"""
 
@@ -237,6 +301,51 @@ class EcsServiceManager:
                 return c
         raise StandardError("Unknown problem describing service %s." % service_name)
 
+    def describe_services(self, cluster_name, service_names):
+        """
+        Describe services of one cluster, ECS_DESCRIBE_SERVICES_MAX per call.
+        Returns a dict of service name to service, None for missing services.
+        """
+        found = dict()
+        for i in range(0, len(service_names), ECS_DESCRIBE_SERVICES_MAX):
+            names = service_names[i:i + ECS_DESCRIBE_SERVICES_MAX]
+            params = dict(services=names)
+            if cluster_name:
+                params['cluster'] = cluster_name
+            response = self.ecs.describe_services(**params)
+            for failure in response['failures']:
+                if failure['reason'] != 'MISSING':
+                    raise StandardError("Problem describing service %s, failure reason is %s" % (failure['arn'], failure['reason']))
+            for name in names:
+                for service in response['services']:
+                    if name in (service['serviceName'], service['serviceArn']):
+                        found[name] = service
+        return dict((name, found.get(name)) for name in service_names)
+
+    def wait_for_services(self, pending, is_done, timeout, delay):
+        """
+        Poll the (cluster, name) services in a single loop until is_done holds
+        for each of them or the timeout passes. Returns a dict of the finished
+        services to their last description and the seconds they took, and the
+        services still pending.
+        """
+        started = time.time()
+        pending = list(pending)
+        finished = dict()
+        while pending:
+            by_cluster = dict()
+            for cluster, name in pending:
+                by_cluster.setdefault(cluster, []).append(name)
+            for cluster, names in by_cluster.iteritems():
+                for name, service in self.describe_services(cluster, names).iteritems():
+                    if is_done(service):
+                        finished[(cluster, name)] = (service, round(time.time() - started, 1))
+                        pending.remove((cluster, name))
+            if not pending or time.time() - started > timeout:
+                break
+            time.sleep(delay)
+        return finished, pending
+
     def is_matching_service(self, expected, existing):
         if expected['task_definition'] != existing['taskDefinition']:
             return False
@@ -288,12 +397,153 @@ class EcsServiceManager:
     def delete_service(self, service, cluster=None):
         return self.ecs.delete_service(cluster=cluster, service=service)
 
+
+def service_is_steady(service):
+    # a single deployment left, running the desired count of tasks
+    return service is not None and service['status'] == 'ACTIVE' and \
+        len(service['deployments']) == 1 and \
+        service['runningCount'] == service['desiredCount'] and \
+        service['pendingCount'] == 0
+
+
+def service_is_inactive(service):
+    return service is None or service['status'] == 'INACTIVE'
+
+
+def run_concurrently(func, items):
+    """Call func on every tuple of arguments in a thread pool, returning (args, result, error) tuples"""
+    def call(args):
+        try:
+            return args, func(*args), None
+        except Exception, e:
+            return args, None, e
+
+    pool = ThreadPool(min(ECS_MAX_THREADS, len(items)))
+    try:
+        return pool.map(call, items)
+    finally:
+        pool.close()
+
+
+def get_service_params(module, entry):
+    if not isinstance(entry, dict) or not entry.get('name'):
+        module.fail_json(msg="Every entry in services needs a name, got %s" % entry)
+
+    params = dict((key, entry.get(key, module.params.get(key))) for key in SERVICE_OPTIONS)
+    params['name'] = entry['name']
+    if params['state'] is None:
+        params['state'] = 'present'
+    if params['state'] not in ['present', 'absent']:
+        module.fail_json(msg="The state of service %s must be present or absent, got %s" % (params['name'], params['state']))
+    if params['state'] == 'present':
+        if params['task_definition'] is None or params['desired_count'] is None:
+            module.fail_json(msg="To create service %s, a task_definition and a desired_count must be specified" % params['name'])
+        params['desired_count'] = int(params['desired_count'])
+    return params
+
+
+def ensure_services(service_mgr, module):
+    """Describe every entry of services in batches, apply the changes concurrently and wait for them together"""
+    entries = [get_service_params(module, entry) for entry in module.params['services']]
+
+    by_cluster = dict()
+    for params in entries:
+        by_cluster.setdefault(params['cluster'], []).append(params['name'])
+    existing = dict()
+    try:
+        for cluster, names in by_cluster.iteritems():
+            for name, service in service_mgr.describe_services(cluster, names).iteritems():
+                existing[(cluster, name)] = service
+    except Exception, e:
+        module.fail_json(msg="Exception describing services: " + str(e))
+
+    # a draining service still holds its name, CreateService rejects it
+    draining = [params['name'] for params in entries
+                if params['state'] == 'present' and existing[(params['cluster'], params['name'])] is not None and
+                existing[(params['cluster'], params['name'])]['status'] == 'DRAINING']
+    if draining:
+        module.fail_json(msg="Services still DRAINING after a delete cannot be created until they are INACTIVE: " + ", ".join(draining))
+
+    results = []
+    changes = []
+    for params in entries:
+        key = (params['cluster'], params['name'])
+        service = existing[key]
+        action = None
+        if params['state'] == 'present':
+            if service is None or service['status'] != 'ACTIVE':
+                action = 'create'
+            elif not service_mgr.is_matching_service(params, service):
+                action = 'update'
+        elif service is not None and service['status'] != 'INACTIVE':
+            action = 'delete'
+
+        result = dict(name=params['name'], cluster=params['cluster'], state=params['state'],
+                      action=action, changed=action is not None)
+        if service is not None:
+            result['service'] = service_mgr.jsonize(service)
+        results.append(result)
+        if action:
+            changes.append((params, action, result))
+
+    def apply_change(params, action, result):
+        load_balancers = params['load_balancers'] or []
+        client_token = params['client_token'] or ''
+        role = params['role'] or ''
+        if action == 'create':
+            return service_mgr.create_service(params['name'], params['cluster'], params['task_definition'],
+                                              load_balancers, params['desired_count'], client_token, role)
+        if action == 'update':
+            return service_mgr.update_service(params['name'], params['cluster'], params['task_definition'],
+                                              load_balancers, params['desired_count'], client_token, role)
+        service_mgr.delete_service(params['name'], params['cluster'])
+
+    changed = len(changes) > 0
+    if module.check_mode or not changes:
+        module.exit_json(changed=changed, services=results)
+
+    failures = []
+    for (params, action, result), response, error in run_concurrently(apply_change, changes):
+        if error is not None:
+            failures.append("%s of service %s failed: %s" % (action, params['name'], str(error)))
+        elif response is not None:
+            result['service'] = response
+    if failures:
+        module.fail_json(msg=", ".join(failures), services=results)
+
+    if module.params['wait']:
+        pending = dict()
+        for params, action, result in changes:
+            pending[(params['cluster'], params['name'])] = result
+        steady = [key for key, result in pending.iteritems() if result['action'] != 'delete']
+        inactive = [key for key, result in pending.iteritems() if result['action'] == 'delete']
+
+        timeout = module.params['wait_timeout']
+        delay = module.params['delay']
+        started = time.time()
+        try:
+            finished, not_steady = service_mgr.wait_for_services(steady, service_is_steady, timeout, delay)
+            deleted, not_inactive = service_mgr.wait_for_services(inactive, service_is_inactive,
+                                                                  max(0, timeout - (time.time() - started)), delay)
+        except Exception, e:
+            module.fail_json(msg="Exception waiting for services: " + str(e), services=results)
+        finished.update(deleted)
+        for key, (service, seconds) in finished.iteritems():
+            if service is not None:
+                pending[key]['service'] = service_mgr.jsonize(service)
+            pending[key]['wait_seconds'] = seconds
+        if not_steady or not_inactive:
+            module.fail_json(msg="Timed out waiting for services: " + ", ".join(name for cluster, name in not_steady + not_inactive),
+                             services=results)
+
+    module.exit_json(changed=changed, services=results)
+
 def main():
 
     argument_spec = ec2_argument_spec()
     argument_spec.update(dict(
-        state=dict(required=True, choices=['present', 'absent', 'deleting'] ),
-        name=dict(required=True, type='str' ),
+        state=dict(required=False, choices=['present', 'absent', 'deleting'] ),
+        name=dict(required=False, type='str' ),
         cluster=dict(required=False, type='str' ),
         task_definition=dict(required=False, type='str' ),
         load_balancers=dict(required=False, type='list' ),
@@ -301,10 +551,16 @@ def main():
         client_token=dict(required=False, type='str' ),
         role=dict(required=False, type='str' ),
         delay=dict(required=False, type='int', default=10),
-        repeat=dict(required=False, type='int', default=10)
+        repeat=dict(required=False, type='int', default=10),
+        services=dict(required=False, type='list'),
+        wait=dict(required=False, type='bool', default=False),
+        wait_timeout=dict(required=False, type='int', default=600)
     ))
 
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(argument_spec=argument_spec,
+        mutually_exclusive=[['name', 'services']],
+        required_one_of=[['name', 'services']],
+        supports_check_mode=True)
 
     if not HAS_BOTO:
       module.fail_json(msg='boto is required.')
@@ -312,6 +568,14 @@ def main():
     if not HAS_BOTO3:
       module.fail_json(msg='boto3 is required.')
 
+    if module.params['services'] is not None:
+        if module.params['state'] == 'deleting':
+            module.fail_json(msg="state=deleting is not supported with services, use state=absent and wait=true")
+        ensure_services(EcsServiceManager(module), module)
+
+    if module.params['state'] is None:
+        module.fail_json(msg="state is required unless services is given")
+
     if module.params['state'] == 'present':
         if not 'task_definition' in module.params and module.params['task_definition'] is None:
             module.fail_json(msg="To use create a service, a task_definition must be specified")
@@ -372,6 +636,15 @@ def main():
 
                 results['service'] = response
 
+                if module.params['wait']:
+                    key = (module.params['cluster'], module.params['name'])
+                    finished, pending = service_mgr.wait_for_services([key], service_is_steady,
+                        module.params['wait_timeout'], module.params['delay'])
+                    if pending:
+                        module.fail_json(msg="Service '"+module.params['name']+"' did not reach a steady state after "+str(module.params['wait_timeout'])+" seconds.")
+                    results['service'] = service_mgr.jsonize(finished[key][0])
+                    results['wait_seconds'] = finished[key][1]
+
             results['changed'] = True
 
     elif module.params['state'] == 'absent':
@@ -404,17 +677,12 @@ def main():
         # return info about the cluster deleted
         delay = module.params['delay']
         repeat = module.params['repeat']
-        time.sleep(delay)
-        for i in range(repeat):
-            existing = service_mgr.describe_service(module.params['cluster'], module.params['name'])
-            status = existing['status']
-            if status == "INACTIVE":
-                results['changed'] = True
-                break
-            time.sleep(delay)
-        if i is repeat-1:
+        finished, pending = service_mgr.wait_for_services([(module.params['cluster'], module.params['name'])],
+            service_is_inactive, delay * repeat, delay)
+        if pending:
             module.fail_json(msg="Service still not deleted after "+str(repeat)+" tries of "+str(delay)+" seconds each.")
             return
+        results['changed'] = True
 
     module.exit_json(**results)
 
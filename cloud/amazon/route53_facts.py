@@ -59,6 +59,23 @@ options:
     description:
       - The DNS Zone delegation set ID
     required: false
+  all_pages:
+    description:
+      - "Used with query: record_sets. Walk every page of the zone with a paginator instead of returning
+        a single page, and return the record sets indexed by name, type and set identifier in
+        C(record_sets) along with a hash of every record set in C(record_set_hashes)."
+      - C(max_items) sets the page size when this is enabled.
+    required: false
+    default: false
+    version_added: "2.2"
+  since:
+    description:
+      - "The C(record_set_hashes) of a previous run with C(all_pages). Only the record sets that were
+        added or changed since are returned in C(record_sets), and the keys of the record sets that were
+        deleted in C(removed_record_sets)."
+    required: false
+    default: null
+    version_added: "2.2"
   start_record_name:
     description:
       - "The first name in the lexicographic ordering of domain names that you want
@@ -138,6 +155,21 @@ EXAMPLES = '''
     max_items: 20
   register: record_sets
 
+- name: Index every resource record set of a hosted zone
+  route53_facts:
+    query: record_sets
+    hosted_zone_id: 'ZZZ1111112222'
+    all_pages: true
+  register: zone_snapshot
+
+- name: Only return the record sets that changed since the snapshot
+  route53_facts:
+    query: record_sets
+    hosted_zone_id: 'ZZZ1111112222'
+    all_pages: true
+    since: "{{ zone_snapshot.record_set_hashes }}"
+  register: zone_changes
+
 - name: List first 20 health checks
   route53_facts:
     query: health_check
@@ -159,6 +191,13 @@ EXAMPLES = '''
   register: delegation_sets
 
 '''
+import hashlib
+
+try:
+    import json
+except ImportError:
+    import simplejson as json
+
 try:
     import boto
     import botocore
@@ -327,10 +366,59 @@ def record_sets_details(client, module):
     elif module.params.get('type'):
         params['StartRecordType'] = module.params.get('type')
 
+    if module.params.get('since') is not None and not module.params.get('all_pages'):
+        module.fail_json(msg="since can only be used with all_pages")
+    elif module.params.get('all_pages'):
+        return all_record_sets(client, module, params)
+
     results = client.list_resource_record_sets(**params)
     return results
 
 
+def record_set_key(record_set):
+    key = '%s|%s' % (record_set['Name'], record_set['Type'])
+    if 'SetIdentifier' in record_set:
+        key += '|%s' % record_set['SetIdentifier']
+    return key
+
+
+def compact_record_set(record_set):
+    compact = dict((k, v) for k, v in record_set.items() if k not in ('Name', 'Type', 'ResourceRecords'))
+    compact['Values'] = [r['Value'] for r in record_set.get('ResourceRecords', [])]
+    return compact
+
+
+def all_record_sets(client, module, params):
+    """
+    Walk every page of list_resource_record_sets and index the record sets
+    by name, type and set identifier.
+
+    Only the compact form of every record set is kept while paging. When
+    since is given the unchanged record sets are dropped from the result.
+    """
+    if 'MaxItems' in params:
+        params['PaginationConfig'] = {'PageSize': params.pop('MaxItems')}
+    since = module.params.get('since')
+
+    record_sets = dict()
+    hashes = dict()
+    paginator = client.get_paginator('list_resource_record_sets')
+    for page in paginator.paginate(**params):
+        for record_set in page['ResourceRecordSets']:
+            key = record_set_key(record_set)
+            compact = compact_record_set(record_set)
+            hashes[key] = hashlib.sha1(json.dumps(compact, sort_keys=True)).hexdigest()
+            if since is None or since.get(key) != hashes[key]:
+                compact['Name'] = record_set['Name']
+                compact['Type'] = record_set['Type']
+                record_sets[key] = compact
+
+    results = dict(record_sets=record_sets, record_set_hashes=hashes, record_set_count=len(hashes))
+    if since is not None:
+        results['removed_record_sets'] = sorted(key for key in since if key not in hashes)
+    return results
+
+
 def health_check_details(client, module):
     health_check_invocations = {
         'list': list_health_checks,
@@ -375,6 +463,8 @@ def main():
         next_marker=dict(),
         delegation_set_id=dict(),
         start_record_name=dict(),
+        all_pages=dict(type='bool', default=False),
+        since=dict(type='dict'),
         type=dict(choices=[
             'A', 'CNAME', 'MX', 'AAAA', 'TXT', 'PTR', 'SRV', 'SPF', 'NS'
         ]),
@@ -0,0 +1,354 @@
+#!/usr/bin/python
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+DOCUMENTATION = '''
+---
+module: route53_record_sets
+short_description: Manage many Route53 resource record sets in batched changes
+description:
+  - Reconcile a list of resource record sets with a hosted zone.
+  - The zone is listed once, the record sets that differ are packed into as few
+    ChangeResourceRecordSets calls as the Route53 limits allow and every change
+    batch is waited on once.
+version_added: "2.2"
+requirements: [boto3, botocore]
+options:
+  hosted_zone_id:
+    description:
+      - The id of the hosted zone to manage.
+    required: true
+  record_sets:
+    description:
+      - The resource record sets, each a dict with the keys C(name), C(type), C(ttl), C(values),
+        C(set_identifier), C(weight), C(region), C(failover), C(health_check_id) and C(alias).
+      - C(values) is a list of record values in the format Route53 expects, e.g. TXT values
+        have to be quoted.
+      - C(alias) is a dict with the C(hosted_zone_id), C(dns_name) and C(evaluate_target_health) keys.
+      - With C(state=absent) only C(name), C(type) and C(set_identifier) are used.
+    required: true
+  state:
+    description:
+      - Whether the record sets should exist or not.
+    required: false
+    default: present
+    choices: ['present', 'absent']
+  purge:
+    description:
+      - With C(state=present), delete every record set of the zone that is not in C(record_sets),
+        except the SOA and NS record sets of the zone apex.
+    required: false
+    default: false
+  wait:
+    description:
+      - Wait for every change batch to be C(INSYNC).
+    required: false
+    default: true
+  wait_timeout:
+    description:
+      - How long to wait for the change batches, in seconds.
+    required: false
+    default: 300
+author: "agent"
+extends_documentation_fragment:
+  - aws
+  - ec2
+'''
+
+EXAMPLES = '''
+- name: Point a set of hosts at their new addresses
+  route53_record_sets:
+    hosted_zone_id: ZZZ1111112222
+    record_sets:
+      - name: www.example.com
+        type: A
+        ttl: 300
+        values:
+          - 192.0.2.10
+          - 192.0.2.11
+      - name: example.com
+        type: TXT
+        ttl: 3600
+        values:
+          - '"v=spf1 mx -all"'
+      - name: cdn.example.com
+        type: A
+        alias:
+          hosted_zone_id: Z2FDTNDATAQYW2
+          dns_name: d111111abcdef8.cloudfront.net
+          evaluate_target_health: false
+
+- name: Remove two record sets without waiting for them to propagate
+  route53_record_sets:
+    hosted_zone_id: ZZZ1111112222
+    state: absent
+    wait: false
+    record_sets:
+      - name: old.example.com
+        type: A
+      - name: older.example.com
+        type: CNAME
+'''
+
+RETURN = '''
+change_ids:
+    description: the ids of the submitted change batches
+    returned: when changed and not in check mode
+    type: list
+    sample: ["/change/C2682N5HXP0BZ4"]
+changes:
+    description: the submitted changes
+    returned: always
+    type: list
+    sample: [{"action": "UPSERT", "name": "www.example.com.", "type": "A", "set_identifier": null}]
+batches:
+    description: the number of change batches the changes were packed into
+    returned: always
+    type: int
+    sample: 1
+'''
+
+try:
+    import botocore
+    from botocore.exceptions import ClientError
+    HAS_BOTO3 = True
+except ImportError:
+    HAS_BOTO3 = False
+
+import random
+import time
+
+# Route53 limits per ChangeResourceRecordSets call, UPSERT changes count twice
+R53_MAX_BATCH_RECORDS = 1000
+R53_MAX_BATCH_CHARS = 32000
+
+# Errors returned when the 5 requests per second limit is hit
+R53_THROTTLE_ERRORS = ['Throttling', 'PriorRequestNotComplete']
+R53_MAX_RETRIES = 8
+
+
+def normalize_name(name):
+    name = name.lower().replace('*', '\\052')
+    if not name.endswith('.'):
+        name += '.'
+    return name
+
+
+def record_set_key(record_set):
+    return (normalize_name(record_set['Name']), record_set['Type'], record_set.get('SetIdentifier'))
+
+
+def canonical_record_set(record_set):
+    """Comparable form of a boto3 ResourceRecordSet"""
+    canonical = dict(record_set)
+    canonical['Name'] = normalize_name(record_set['Name'])
+    if 'ResourceRecords' in canonical:
+        canonical['ResourceRecords'] = sorted(r['Value'] for r in canonical['ResourceRecords'])
+    if 'AliasTarget' in canonical:
+        alias = dict(canonical['AliasTarget'])
+        alias['DNSName'] = normalize_name(alias['DNSName'])
+        canonical['AliasTarget'] = alias
+    return canonical
+
+
+def build_record_set(module, item):
+    """Turn a record_sets entry into a boto3 ResourceRecordSet"""
+    if not isinstance(item, dict) or not item.get('name') or not item.get('type'):
+        module.fail_json(msg="Every entry in record_sets needs a name and a type, got %s" % item)
+
+    record_set = dict(Name=normalize_name(item['name']), Type=item['type'].upper())
+    if item.get('set_identifier') is not None:
+        record_set['SetIdentifier'] = item['set_identifier']
+    if module.params.get('state') == 'absent':
+        return record_set
+
+    if item.get('alias'):
+        alias = item['alias']
+        record_set['AliasTarget'] = dict(
+            HostedZoneId=alias['hosted_zone_id'],
+            DNSName=alias['dns_name'],
+            EvaluateTargetHealth=module.boolean(alias.get('evaluate_target_health', False)),
+        )
+    elif item.get('values'):
+        record_set['TTL'] = int(item.get('ttl', 300))
+        record_set['ResourceRecords'] = [dict(Value=str(value)) for value in item['values']]
+    else:
+        module.fail_json(msg="Every entry in record_sets needs values or an alias, got %s" % item)
+
+    if item.get('weight') is not None:
+        record_set['Weight'] = int(item['weight'])
+    if item.get('region') is not None:
+        record_set['Region'] = item['region']
+    if item.get('failover') is not None:
+        record_set['Failover'] = item['failover'].upper()
+    if item.get('health_check_id') is not None:
+        record_set['HealthCheckId'] = item['health_check_id']
+    return record_set
+
+
+def get_zone_snapshot(client, module):
+    """List every record set of the zone once, indexed by name, type and set identifier"""
+    snapshot = dict()
+    try:
+        paginator = client.get_paginator('list_resource_record_sets')
+        for page in paginator.paginate(HostedZoneId=module.params.get('hosted_zone_id')):
+            for record_set in page['ResourceRecordSets']:
+                snapshot[record_set_key(record_set)] = record_set
+    except ClientError as e:
+        module.fail_json(msg=e.message, **camel_dict_to_snake_dict(e.response))
+    return snapshot
+
+
+def get_changes(module, snapshot):
+    desired = [build_record_set(module, item) for item in module.params.get('record_sets')]
+    changes = []
+
+    if module.params.get('state') == 'absent':
+        for record_set in desired:
+            key = record_set_key(record_set)
+            if key in snapshot:
+                changes.append(dict(Action='DELETE', ResourceRecordSet=snapshot.pop(key)))
+        return changes
+
+    wanted = set()
+    for record_set in desired:
+        key = record_set_key(record_set)
+        wanted.add(key)
+        current = snapshot.get(key)
+        if current is None or canonical_record_set(current) != canonical_record_set(record_set):
+            changes.append(dict(Action='UPSERT', ResourceRecordSet=record_set))
+
+    if module.params.get('purge'):
+        apex = min([key[0] for key in snapshot if key[1] == 'SOA'] or [None])
+        for key, record_set in snapshot.items():
+            if key in wanted or (key[0] == apex and key[1] in ('SOA', 'NS')):
+                continue
+            changes.insert(0, dict(Action='DELETE', ResourceRecordSet=record_set))
+    return changes
+
+
+def change_size(change):
+    """The number of ResourceRecord elements and value characters a change counts for"""
+    record_set = change['ResourceRecordSet']
+    values = [r['Value'] for r in record_set.get('ResourceRecords', [])]
+    factor = 2 if change['Action'] == 'UPSERT' else 1
+    return max(1, len(values)) * factor, sum(len(value) for value in values) * factor
+
+
+def pack_batches(changes):
+    """Pack changes in order into the fewest batches the Route53 limits allow"""
+    batches = []
+    batch, records, chars = [], 0, 0
+    for change in changes:
+        change_records, change_chars = change_size(change)
+        if batch and (records + change_records > R53_MAX_BATCH_RECORDS or chars + change_chars > R53_MAX_BATCH_CHARS):
+            batches.append(batch)
+            batch, records, chars = [], 0, 0
+        batch.append(change)
+        records += change_records
+        chars += change_chars
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def submit_batch(client, module, batch):
+    """Submit a change batch, backing off while Route53 throttles the account"""
+    attempt = 0
+    while True:
+        try:
+            response = client.change_resource_record_sets(
+                HostedZoneId=module.params.get('hosted_zone_id'),
+                ChangeBatch=dict(Changes=batch))
+            return response['ChangeInfo']['Id']
+        except ClientError as e:
+            if e.response['Error']['Code'] not in R53_THROTTLE_ERRORS or attempt >= R53_MAX_RETRIES:
+                module.fail_json(msg=e.message, **camel_dict_to_snake_dict(e.response))
+            time.sleep(min(2 ** attempt + random.random(), 30))
+            attempt += 1
+
+
+def wait_for_changes(client, module, change_ids):
+    """Poll every submitted change batch until it is INSYNC"""
+    wait_timeout = time.time() + module.params.get('wait_timeout')
+    pending = list(change_ids)
+    while pending:
+        for change_id in list(pending):
+            try:
+                status = client.get_change(Id=change_id)['ChangeInfo']['Status']
+            except ClientError as e:
+                if e.response['Error']['Code'] in R53_THROTTLE_ERRORS:
+                    continue
+                module.fail_json(msg=e.message, **camel_dict_to_snake_dict(e.response))
+            if status == 'INSYNC':
+                pending.remove(change_id)
+        if not pending:
+            break
+        if time.time() > wait_timeout:
+            module.fail_json(msg="Timed out waiting for changes %s to be INSYNC" % ', '.join(pending),
+                             change_ids=change_ids)
+        time.sleep(5)
+
+
+def main():
+    argument_spec = ec2_argument_spec()
+    argument_spec.update(dict(
+        hosted_zone_id=dict(required=True),
+        record_sets=dict(required=True, type='list'),
+        state=dict(default='present', choices=['present', 'absent']),
+        purge=dict(type='bool', default=False),
+        wait=dict(type='bool', default=True),
+        wait_timeout=dict(type='int', default=300),
+        )
+    )
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+    )
+
+    if not HAS_BOTO3:
+        module.fail_json(msg='botocore/boto3 is required.')
+
+    try:
+        region, ec2_url, aws_connect_kwargs = get_aws_connection_info(module, boto3=True)
+        client = boto3_conn(module, conn_type='client', resource='route53', region=region, endpoint=ec2_url, **aws_connect_kwargs)
+    except botocore.exceptions.NoCredentialsError as e:
+        module.fail_json(msg="Can't authorize connection - " + str(e))
+
+    snapshot = get_zone_snapshot(client, module)
+    changes = get_changes(module, snapshot)
+    batches = pack_batches(changes)
+
+    results = dict(
+        changed=len(changes) > 0,
+        batches=len(batches),
+        changes=[dict(action=c['Action'], name=c['ResourceRecordSet']['Name'], type=c['ResourceRecordSet']['Type'],
+                      set_identifier=c['ResourceRecordSet'].get('SetIdentifier')) for c in changes],
+    )
+    if module.check_mode or not changes:
+        module.exit_json(**results)
+
+    change_ids = [submit_batch(client, module, batch) for batch in batches]
+    if module.params.get('wait'):
+        wait_for_changes(client, module, change_ids)
+
+    module.exit_json(change_ids=change_ids, **results)
+
+# import module snippets
+from ansible.module_utils.basic import *
+from ansible.module_utils.ec2 import *
+
+if __name__ == '__main__':
+    main()
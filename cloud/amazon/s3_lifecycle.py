@@ -30,7 +30,29 @@ options:
   name:
     description:
       - "Name of the s3 bucket"
-    required: true
+      - "Required unless C(buckets) is given."
+    required: false
+  buckets:
+    description:
+      - "A list of s3 bucket names to apply the rules to. The buckets are processed concurrently."
+      - "Mutually exclusive with C(name)."
+    required: false
+    default: null
+    version_added: "2.2"
+  rules:
+    description:
+      - "A list of lifecycle rules, each a dict with the C(rule_id), C(prefix), C(state), C(status), C(storage_class), C(expiration_days), C(expiration_date), C(transition_days) and C(transition_date) keys of the single rule options. C(state), C(status) and C(storage_class) default to the module options."
+      - "The desired lifecycle configuration of each bucket is computed from all the rules at once, so every bucket gets at most one read and one write of its lifecycle configuration."
+      - "If neither C(rules) nor C(buckets) is given, the rule described by the single rule options is managed."
+    required: false
+    default: null
+    version_added: "2.2"
+  purge_rules:
+    description:
+      - "With C(rules) or C(buckets), remove every existing lifecycle rule not matched by a rule with C(state=present)."
+    required: false
+    default: false
+    version_added: "2.2"
   expiration_date:
     description:
       - "Indicates the lifetime of the objects that are subject to the rule by the date they will expire. The value must be ISO-8601 format, the time must be midnight and a GMT timezone must be specified."
@@ -137,11 +159,30 @@ EXAMPLES = '''
     state: present
     status: enabled
 
+# Manage several rules on several buckets, replacing any other rule of those buckets
+- s3_lifecycle:
+    buckets:
+      - mybucket
+      - myotherbucket
+    purge_rules: true
+    rules:
+      - rule_id: expire-logs
+        prefix: /logs/
+        expiration_days: 30
+      - rule_id: archive-backups
+        prefix: /backups/
+        storage_class: standard_ia
+        transition_days: 31
+      - rule_id: old-tmp
+        state: absent
+
 '''
 
 import xml.etree.ElementTree as ET
 import copy
 import datetime
+import threading
+from multiprocessing.pool import ThreadPool
 
 try:
     import dateutil.parser
@@ -159,32 +200,23 @@ try:
 except ImportError:
     HAS_BOTO = False
 
-def create_lifecycle_rule(connection, module):
+S3_MAX_THREADS = 10
 
-    name = module.params.get("name")
-    expiration_date = module.params.get("expiration_date")
-    expiration_days = module.params.get("expiration_days")
-    prefix = module.params.get("prefix")
-    rule_id = module.params.get("rule_id")
-    status = module.params.get("status")
-    storage_class = module.params.get("storage_class")
-    transition_date = module.params.get("transition_date")
-    transition_days = module.params.get("transition_days")
-    changed = False
+RULE_OPTIONS = ['rule_id', 'prefix', 'state', 'status', 'storage_class', 'expiration_days', 'expiration_date', 'transition_days', 'transition_date']
+# Options a rules entry inherits from the module when it does not set them
+RULE_DEFAULT_OPTIONS = ['state', 'status', 'storage_class']
 
-    try:
-        bucket = connection.get_bucket(name)
-    except S3ResponseError, e:
-        module.fail_json(msg=e.message)
 
-    # Get the bucket's current lifecycle rules
-    try:
-        current_lifecycle_obj = bucket.get_lifecycle_config()
-    except S3ResponseError, e:
-        if e.error_code == "NoSuchLifecycleConfiguration":
-            current_lifecycle_obj = Lifecycle()
-        else:
-            module.fail_json(msg=e.message)
+def build_rule(params):
+
+    expiration_date = params.get("expiration_date")
+    expiration_days = params.get("expiration_days")
+    prefix = params.get("prefix")
+    rule_id = params.get("rule_id")
+    status = params.get("status")
+    storage_class = params.get("storage_class")
+    transition_date = params.get("transition_date")
+    transition_days = params.get("transition_days")
 
     # Create expiration
     if expiration_days is not None:
@@ -203,7 +235,15 @@ def create_lifecycle_rule(connection, module):
         transition_obj = None
 
     # Create rule
-    rule = Rule(rule_id, prefix, status.title(), expiration_obj, transition_obj)
+    return Rule(rule_id, prefix, status.title(), expiration_obj, transition_obj)
+
+
+def merge_rule(current_lifecycle_obj, rule):
+    """
+    Return a lifecycle with rule added to current_lifecycle_obj, replacing the
+    rule with the same id or prefix, and whether that changes the lifecycle.
+    """
+    changed = False
 
     # Create lifecycle
     lifecycle_obj = Lifecycle()
@@ -240,12 +280,64 @@ def create_lifecycle_rule(connection, module):
         lifecycle_obj.append(rule)
         changed = True
 
-    # Write lifecycle to bucket
+    return lifecycle_obj, changed
+
+
+def remove_rule(current_lifecycle_obj, rule_id, prefix):
+    """Return a lifecycle without the rule with rule_id, or prefix if no id is given, and whether one was removed"""
+    changed = False
+
+    if prefix is None:
+        prefix = ""
+
+    # Create lifecycle
+    lifecycle_obj = Lifecycle()
+
+    # Check if rule exists
+    # If an ID exists, use that otherwise compare based on prefix
+    for existing_rule in current_lifecycle_obj:
+        if (rule_id is not None and rule_id == existing_rule.id) or (rule_id is None and prefix == existing_rule.prefix):
+            # We're not keeping the rule (i.e. deleting) so mark as changed
+            changed = True
+        else:
+            lifecycle_obj.append(existing_rule)
+
+    return lifecycle_obj, changed
+
+
+def get_lifecycle(bucket):
+    """Get the bucket's current lifecycle rules, an empty lifecycle if it has none"""
+    try:
+        return bucket.get_lifecycle_config()
+    except S3ResponseError, e:
+        if e.error_code == "NoSuchLifecycleConfiguration":
+            return Lifecycle()
+        raise
+
+
+def create_lifecycle_rule(connection, module):
+
+    name = module.params.get("name")
+
     try:
-        bucket.configure_lifecycle(lifecycle_obj)
+        bucket = connection.get_bucket(name)
     except S3ResponseError, e:
         module.fail_json(msg=e.message)
 
+    try:
+        current_lifecycle_obj = get_lifecycle(bucket)
+    except S3ResponseError, e:
+        module.fail_json(msg=e.message)
+
+    lifecycle_obj, changed = merge_rule(current_lifecycle_obj, build_rule(module.params))
+
+    # Write lifecycle to bucket
+    if changed:
+        try:
+            bucket.configure_lifecycle(lifecycle_obj)
+        except S3ResponseError, e:
+            module.fail_json(msg=e.message)
+
     module.exit_json(changed=changed)
 
 def compare_rule(rule_a, rule_b):
@@ -296,57 +388,156 @@ def compare_rule(rule_a, rule_b):
 def destroy_lifecycle_rule(connection, module):
 
     name = module.params.get("name")
-    prefix = module.params.get("prefix")
-    rule_id = module.params.get("rule_id")
-    changed = False
-
-    if prefix is None:
-        prefix = ""
 
     try:
         bucket = connection.get_bucket(name)
     except S3ResponseError, e:
         module.fail_json(msg=e.message)
 
-    # Get the bucket's current lifecycle rules
     try:
-        current_lifecycle_obj = bucket.get_lifecycle_config()
+        current_lifecycle_obj = get_lifecycle(bucket)
     except S3ResponseError, e:
-        if e.error_code == "NoSuchLifecycleConfiguration":
-            module.exit_json(changed=changed)
-        else:
+        module.fail_json(msg=e.message)
+
+    lifecycle_obj, changed = remove_rule(current_lifecycle_obj, module.params.get("rule_id"), module.params.get("prefix"))
+
+    # Write lifecycle to bucket or, if there no rules left, delete lifecycle configuration
+    if changed:
+        try:
+            if lifecycle_obj:
+                bucket.configure_lifecycle(lifecycle_obj)
+            else:
+                bucket.delete_lifecycle_configuration()
+        except BotoServerError, e:
             module.fail_json(msg=e.message)
 
-    # Create lifecycle
-    lifecycle_obj = Lifecycle()
+    module.exit_json(changed=changed)
 
-    # Check if rule exists
-    # If an ID exists, use that otherwise compare based on prefix
-    if rule_id is not None:
-        for existing_rule in current_lifecycle_obj:
-            if rule_id == existing_rule.id:
-                # We're not keeping the rule (i.e. deleting) so mark as changed
-                changed = True
+
+def reconcile_bucket(connection, name, rules, purge_rules):
+    """
+    Apply every rule to the bucket's lifecycle configuration, read once, and
+    write the result back with a single request if anything changed.
+    """
+    bucket = connection.get_bucket(name, validate=False)
+    lifecycle_obj = get_lifecycle(bucket)
+    changed = False
+
+    wanted = []
+    for params in rules:
+        if params['state'] == 'present':
+            rule = build_rule(params)
+            lifecycle_obj, rule_changed = merge_rule(lifecycle_obj, rule)
+            wanted.append(rule)
+        else:
+            lifecycle_obj, rule_changed = remove_rule(lifecycle_obj, params.get('rule_id'), params.get('prefix'))
+        changed = changed or rule_changed
+
+    if purge_rules:
+        purged_lifecycle_obj = Lifecycle()
+        for existing_rule in lifecycle_obj:
+            if any(existing_rule is rule for rule in wanted):
+                purged_lifecycle_obj.append(existing_rule)
             else:
-                lifecycle_obj.append(existing_rule)
-    else:
-        for existing_rule in current_lifecycle_obj:
-            if prefix == existing_rule.prefix:
-                # We're not keeping the rule (i.e. deleting) so mark as changed
                 changed = True
-            else:
-                lifecycle_obj.append(existing_rule)
+        lifecycle_obj = purged_lifecycle_obj
 
-    # Write lifecycle to bucket or, if there no rules left, delete lifecycle configuration
-    try:
+    if changed:
         if lifecycle_obj:
             bucket.configure_lifecycle(lifecycle_obj)
         else:
             bucket.delete_lifecycle_configuration()
-    except BotoServerError, e:
-        module.fail_json(msg=e.message)
 
-    module.exit_json(changed=changed)
+    return changed
+
+
+def reconcile_buckets(module, location, aws_connect_params):
+
+    buckets = module.params.get("buckets") or [module.params.get("name")]
+    rules = module.params.get("rules")
+    if rules is None:
+        rules = [dict((key, module.params.get(key)) for key in RULE_OPTIONS)]
+    else:
+        rules = [get_rule_params(module, entry) for entry in rules]
+    for params in rules:
+        validate_rule_params(module, params)
+
+    # boto connections are not thread safe, every thread gets its own
+    local = threading.local()
+
+    def reconcile(name):
+        try:
+            if not hasattr(local, 'connection'):
+                local.connection = connect_to_s3(location, aws_connect_params)
+            return name, reconcile_bucket(local.connection, name, rules, module.params.get("purge_rules")), None
+        except Exception, e:
+            return name, False, getattr(e, 'message', None) or str(e)
+
+    pool = ThreadPool(min(S3_MAX_THREADS, len(buckets)))
+    try:
+        results = pool.map(reconcile, buckets)
+    finally:
+        pool.close()
+
+    bucket_results = [dict(name=name, changed=changed) for name, changed, error in results]
+    changed = any(bucket_changed for name, bucket_changed, error in results)
+    errors = ["%s: %s" % (name, error) for name, bucket_changed, error in results if error is not None]
+    if errors:
+        module.fail_json(msg="Failed to apply lifecycle rules to " + ", ".join(errors), changed=changed, buckets=bucket_results)
+
+    module.exit_json(changed=changed, buckets=bucket_results)
+
+
+def get_rule_params(module, entry):
+
+    if not isinstance(entry, dict):
+        module.fail_json(msg="Every entry in rules must be a dict, got %s" % entry)
+    for key in entry:
+        if key not in RULE_OPTIONS:
+            module.fail_json(msg="%s is not a valid option for a rule" % key)
+
+    params = dict((key, entry.get(key)) for key in RULE_OPTIONS)
+    for key in RULE_DEFAULT_OPTIONS:
+        if params[key] is None:
+            params[key] = module.params.get(key)
+    for key in ['expiration_days', 'transition_days']:
+        if params[key] is not None:
+            params[key] = int(params[key])
+
+    if params['state'] not in ['present', 'absent']:
+        module.fail_json(msg="The state of a rule must be present or absent, got %s" % params['state'])
+    if params['status'] not in ['enabled', 'disabled']:
+        module.fail_json(msg="The status of a rule must be enabled or disabled, got %s" % params['status'])
+    if params['storage_class'] not in ['glacier', 'standard_ia']:
+        module.fail_json(msg="The storage_class of a rule must be glacier or standard_ia, got %s" % params['storage_class'])
+    for days, date in [('expiration_days', 'expiration_date'), ('expiration_days', 'transition_date'),
+                       ('transition_days', 'transition_date'), ('transition_days', 'expiration_date')]:
+        if params[days] is not None and params[date] is not None:
+            module.fail_json(msg="%s and %s are mutually exclusive in a rule" % (days, date))
+    return params
+
+
+def validate_rule_params(module, params):
+
+    # If expiration_date set, check string is valid
+    for key in ['expiration_date', 'transition_date']:
+        if params.get(key) is not None:
+            try:
+                datetime.datetime.strptime(params[key], "%Y-%m-%dT%H:%M:%S.000Z")
+            except ValueError, e:
+                module.fail_json(msg="%s is not a valid ISO-8601 format. The time must be midnight and a timezone of GMT must be included" % key)
+
+    boto_required_version = (2,40,0)
+    if params.get('storage_class') == 'standard_ia' and tuple(map(int, (boto.__version__.split(".")))) < boto_required_version:
+        module.fail_json(msg="'standard_ia' class requires boto >= 2.40.0")
+
+
+def connect_to_s3(location, aws_connect_params):
+    connection = boto.s3.connect_to_region(location, is_secure=True, calling_format=OrdinaryCallingFormat(), **aws_connect_params)
+    # use this as fallback because connect_to_region seems to fail in boto + non 'classic' aws accounts in some cases
+    if connection is None:
+        connection = boto.connect_s3(**aws_connect_params)
+    return connection
 
 
 def main():
@@ -354,7 +545,10 @@ def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
-            name = dict(required=True, type='str'),
+            name = dict(required=False, type='str'),
+            buckets = dict(required=False, type='list'),
+            rules = dict(required=False, type='list'),
+            purge_rules = dict(default=False, type='bool'),
             expiration_days = dict(default=None, required=False, type='int'),
             expiration_date = dict(default=None, required=False, type='str'),
             prefix = dict(default=None, required=False),
@@ -373,8 +567,10 @@ def main():
                                                  [ 'expiration_days', 'expiration_date' ],
                                                  [ 'expiration_days', 'transition_date' ],
                                                  [ 'transition_days', 'transition_date' ],
-                                                 [ 'transition_days', 'expiration_date' ]
-                                                 ]
+                                                 [ 'transition_days', 'expiration_date' ],
+                                                 [ 'name', 'buckets' ]
+                                                 ],
+                           required_one_of = [ [ 'name', 'buckets' ] ]
                            )
 
     if not HAS_BOTO:
@@ -393,34 +589,15 @@ def main():
         # actually work fine for everything except us-east-1 (US Standard)
         location = region
     try:
-        connection = boto.s3.connect_to_region(location, is_secure=True, calling_format=OrdinaryCallingFormat(), **aws_connect_params)
-        # use this as fallback because connect_to_region seems to fail in boto + non 'classic' aws accounts in some cases
-        if connection is None:
-            connection = boto.connect_s3(**aws_connect_params)
+        connection = connect_to_s3(location, aws_connect_params)
     except (boto.exception.NoAuthHandlerFound, AnsibleAWSError), e:
         module.fail_json(msg=str(e))
 
-    expiration_date = module.params.get("expiration_date")
-    transition_date = module.params.get("transition_date")
-    state = module.params.get("state")
-    storage_class = module.params.get("storage_class")
+    if module.params.get("rules") is not None or module.params.get("buckets") is not None:
+        reconcile_buckets(module, location, aws_connect_params)
 
-    # If expiration_date set, check string is valid
-    if expiration_date is not None:
-        try:
-            datetime.datetime.strptime(expiration_date, "%Y-%m-%dT%H:%M:%S.000Z")
-        except ValueError, e:
-            module.fail_json(msg="expiration_date is not a valid ISO-8601 format. The time must be midnight and a timezone of GMT must be included")
-
-    if transition_date is not None:
-        try:
-            datetime.datetime.strptime(transition_date, "%Y-%m-%dT%H:%M:%S.000Z")
-        except ValueError, e:
-            module.fail_json(msg="expiration_date is not a valid ISO-8601 format. The time must be midnight and a timezone of GMT must be included")
-
-    boto_required_version = (2,40,0)
-    if storage_class == 'standard_ia' and tuple(map(int, (boto.__version__.split(".")))) < boto_required_version:
-        module.fail_json(msg="'standard_ia' class requires boto >= 2.40.0")
+    state = module.params.get("state")
+    validate_rule_params(module, module.params)
 
     if state == 'present':
         create_lifecycle_rule(connection, module)
@@ -28,7 +28,18 @@ options:
   name:
     description:
       - The name or ARN of the SNS topic to converge
-    required: True
+      - Required unless C(topics) is given.
+    required: False
+  topics:
+    description:
+      - A list of topics to converge in one task, each a dict with the C(name), C(state), C(display_name), C(policy),
+        C(delivery_policy), C(subscriptions) and C(purge_subscriptions) keys of the single topic options. Missing
+        keys default to the module options.
+      - The topics of the account are listed once for the whole list.
+      - Mutually exclusive with C(name).
+    required: False
+    default: None
+    version_added: "2.2"
   state:
     description:
       - Whether to create or destroy an SNS topic
@@ -94,6 +105,20 @@ EXAMPLES = """
       - endpoint: "my_mobile_number"
         protocol: "sms"
 
+- name: Create a topic per team, each mailing its own list
+  sns_topic:
+    topics:
+      - name: "team-a-alerts"
+        subscriptions:
+          - endpoint: "team-a@example.com"
+            protocol: "email"
+      - name: "team-b-alerts"
+        subscriptions:
+          - endpoint: "team-b@example.com"
+            protocol: "email"
+      - name: "retired-alerts"
+        state: absent
+
 """
 
 RETURN = '''
@@ -120,6 +145,11 @@ sns_topic:
       topic_created: false
       topic_deleted: false
       attributes_set: []
+
+sns_topics:
+    description: The sns_topic details of every topic, with its sns_arn, when topics is given
+    type: list
+    sample: [{"name": "team-a-alerts", "sns_arn": "arn:aws:sns:us-east-1:123456789012:team-a-alerts", "topic_created": true}]
 '''
 
 import sys
@@ -149,6 +179,7 @@ class SnsTopicManager(object):
                  purge_subscriptions,
                  check_mode,
                  region,
+                 topic_index=None,
                  **aws_connect_params):
 
         self.region = region
@@ -170,6 +201,8 @@ class SnsTopicManager(object):
         self.topic_created = False
         self.topic_deleted = False
         self.arn_topic = None
+        self.topic_attributes = None
+        self.topic_index = topic_index
         self.attributes_set = []
 
     def _get_boto_connection(self):
@@ -180,44 +213,63 @@ class SnsTopicManager(object):
             self.module.fail_json(msg=err.message)
 
     def _get_all_topics(self):
-        next_token = None
-        topics = []
-        while True:
-            try:
-                response = self.connection.get_all_topics(next_token)
-            except BotoServerError, err:
-                module.fail_json(msg=err.message)
-            topics.extend(response['ListTopicsResponse']['ListTopicsResult']['Topics'])
-            next_token = response['ListTopicsResponse']['ListTopicsResult']['NextToken']
-            if not next_token:
-                break
-        return [t['TopicArn'] for t in topics]
+        return get_all_topics(self.module, self.connection)
+
+
+    def _get_topic_attributes(self, arn):
+        # returns None if the topic does not exist
+        try:
+            return self.connection.get_topic_attributes(arn) \
+                ['GetTopicAttributesResponse'] ['GetTopicAttributesResult'] \
+                ['Attributes']
+        except BotoServerError, err:
+            if err.error_code == 'NotFound':
+                return None
+            self.module.fail_json(msg=err.message)
 
 
     def _arn_topic_lookup(self):
         # topic names cannot have colons, so this captures the full topic name
-        all_topics = self._get_all_topics()
-        lookup_topic = ':%s' % self.name
-        for topic in all_topics:
-            if topic.endswith(lookup_topic):
-                return topic
+        topic_name = self.name.split(':')[-1]
+        if self.topic_index is not None:
+            return self.topic_index.get(topic_name)
+
+        if self.name.startswith('arn:'):
+            arn = self.name
+        else:
+            # Every topic of the account shares the ARN prefix, one page of
+            # topics is enough to build the ARN the topic would have.
+            try:
+                response = self.connection.get_all_topics()
+            except BotoServerError, err:
+                self.module.fail_json(msg=err.message)
+            topics = response['ListTopicsResponse']['ListTopicsResult']['Topics']
+            if not topics:
+                return None
+            arn = '%s:%s' % (topics[0]['TopicArn'].rsplit(':', 1)[0], topic_name)
+
+        self.topic_attributes = self._get_topic_attributes(arn)
+        if self.topic_attributes is None:
+            return None
+        return arn
 
 
     def _create_topic(self):
         self.changed = True
         self.topic_created = True
         if not self.check_mode:
-            self.connection.create_topic(self.name)
-            self.arn_topic = self._arn_topic_lookup()
-            while not self.arn_topic:
-                time.sleep(3)
-                self.arn_topic = self._arn_topic_lookup()
+            # create_topic is idempotent and returns the ARN of the topic
+            try:
+                response = self.connection.create_topic(self.name.split(':')[-1])
+            except BotoServerError, err:
+                self.module.fail_json(msg=err.message)
+            self.arn_topic = response['CreateTopicResponse']['CreateTopicResult']['TopicArn']
 
 
     def _set_topic_attrs(self):
-        topic_attributes = self.connection.get_topic_attributes(self.arn_topic) \
-            ['GetTopicAttributesResponse'] ['GetTopicAttributesResult'] \
-            ['Attributes']
+        topic_attributes = self.topic_attributes
+        if topic_attributes is None:
+            topic_attributes = self._get_topic_attributes(self.arn_topic)
 
         if self.display_name and self.display_name != topic_attributes['DisplayName']:
             self.changed = True
@@ -340,12 +392,71 @@ class SnsTopicManager(object):
         return info
 
 
+def get_all_topics(module, connection):
+    next_token = None
+    topics = []
+    while True:
+        try:
+            response = connection.get_all_topics(next_token)
+        except BotoServerError, err:
+            module.fail_json(msg=err.message)
+        topics.extend(response['ListTopicsResponse']['ListTopicsResult']['Topics'])
+        next_token = response['ListTopicsResponse']['ListTopicsResult']['NextToken']
+        if not next_token:
+            break
+    return [t['TopicArn'] for t in topics]
+
+
+def ensure_topics(module, region, aws_connect_params):
+    """ Converge every entry of topics against a single listing of the account's topics """
+    try:
+        connection = connect_to_aws(boto.sns, region, **aws_connect_params)
+    except BotoServerError, err:
+        module.fail_json(msg=err.message)
+    topic_index = dict((arn.split(':')[-1], arn) for arn in get_all_topics(module, connection))
+
+    changed = False
+    results = []
+    for topic in module.params.get('topics'):
+        if not isinstance(topic, dict) or not topic.get('name'):
+            module.fail_json(msg="Every entry in topics needs a name, got %s" % topic)
+
+        params = dict((key, topic.get(key, module.params.get(key))) for key in
+                      ['state', 'display_name', 'policy', 'delivery_policy', 'subscriptions', 'purge_subscriptions'])
+        sns_topic = SnsTopicManager(module,
+                                    topic['name'],
+                                    params['state'],
+                                    params['display_name'],
+                                    params['policy'],
+                                    params['delivery_policy'],
+                                    params['subscriptions'] or [],
+                                    module.boolean(params['purge_subscriptions']),
+                                    module.check_mode,
+                                    region,
+                                    topic_index=topic_index,
+                                    **aws_connect_params)
+
+        if params['state'] == 'present':
+            sns_topic.ensure_ok()
+        elif params['state'] == 'absent':
+            sns_topic.ensure_gone()
+        else:
+            module.fail_json(msg="state must be present or absent, got %s" % params['state'])
+
+        changed = changed or sns_topic.changed
+        info = sns_topic.get_info()
+        info['sns_arn'] = sns_topic.arn_topic
+        results.append(info)
+
+    module.exit_json(changed=changed, sns_topics=results)
+
 
 def main():
     argument_spec = ec2_argument_spec()
     argument_spec.update(
         dict(
-            name=dict(type='str', required=True),
+            name=dict(type='str', required=False),
+            topics=dict(type='list', required=False),
             state=dict(type='str', default='present', choices=['present',
                 'absent']),
             display_name=dict(type='str', required=False),
@@ -357,6 +468,8 @@ def main():
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
+                           mutually_exclusive=[['name', 'topics']],
+                           required_one_of=[['name', 'topics']],
                            supports_check_mode=True)
 
     if not HAS_BOTO:
@@ -375,6 +488,9 @@ def main():
     if not region:
         module.fail_json(msg="region must be specified")
 
+    if module.params.get('topics') is not None:
+        ensure_topics(module, region, aws_connect_params)
+
     sns_topic = SnsTopicManager(module,
                                 name,
                                 state,
@@ -277,6 +277,18 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+requests:
+    description: The CLC requests that were waited for, with their final status and duration in seconds
+    returned: success, when wait is true
+    type: list
+    sample:
+        [
+            {
+                "id": "wa1-126437",
+                "status": "succeeded",
+                "duration": 182.4
+            }
+        ]
 server_ids:
     description: The list of server ids that are created
     returned: success
@@ -458,6 +470,7 @@ __version__ = '${version}'
 
 from time import sleep
 from distutils.version import LooseVersion
+from multiprocessing.pool import ThreadPool
 
 try:
     import requests
@@ -480,6 +493,18 @@ except ImportError:
 else:
     CLC_FOUND = True
 
+# The maximum number of concurrent CLC API calls when refreshing servers
+# and polling requests
+CLC_MAX_THREADS = 10
+
+# Bounds in seconds of the interval between two polls of the outstanding
+# requests, the interval grows while no request completes
+CLC_POLL_MIN_INTERVAL = 2
+CLC_POLL_MAX_INTERVAL = 30
+
+# Consecutive errors tolerated when fetching the status of a request
+CLC_POLL_MAX_ERRORS = 3
+
 
 class ClcServer:
     clc = clc_sdk
@@ -491,6 +516,7 @@ class ClcServer:
         self.clc = clc_sdk
         self.module = module
         self.group_dict = {}
+        self.request_results = []
 
         if not CLC_FOUND:
             self.module.fail_json(
@@ -574,7 +600,8 @@ class ClcServer:
             changed=changed,
             server_ids=new_server_ids,
             partially_created_server_ids=partial_servers_ids,
-            servers=server_dict_array)
+            servers=server_dict_array,
+            requests=self.request_results)
 
     @staticmethod
     def _define_module_argument_spec():
@@ -678,8 +705,7 @@ class ClcServer:
                 msg="You must set the CLC_V2_API_USERNAME and CLC_V2_API_PASSWD "
                     "environment variables")
 
-    @staticmethod
-    def _validate_module_params(clc, module):
+    def _validate_module_params(self, clc, module):
         """
         Validate the module params, and lookup default values.
         :param clc: clc-sdk instance to use
@@ -698,7 +724,7 @@ class ClcServer:
         params['description'] = ClcServer._find_description(module)
         params['ttl'] = ClcServer._find_ttl(clc, module)
         params['template'] = ClcServer._find_template_id(module, datacenter)
-        params['group'] = ClcServer._find_group(module, datacenter).id
+        params['group'] = self._find_group(module, datacenter).id
         params['network_id'] = ClcServer._find_network_id(module, datacenter)
         params['anti_affinity_policy_id'] = ClcServer._find_aa_policy_id(
             clc,
@@ -1069,7 +1095,7 @@ class ClcServer:
             return module.fail_json(
                 msg="you must use the 'count_group' option with exact_count")
 
-        servers, running_servers = ClcServer._find_running_servers_by_group(
+        servers, running_servers = self._find_running_servers_by_group(
             module, datacenter, count_group)
 
         if len(running_servers) == exact_count:
@@ -1089,46 +1115,117 @@ class ClcServer:
             remove_ids = all_server_ids[0:to_remove]
 
             (changed, server_dict_array, changed_server_ids) \
-                = ClcServer._delete_servers(module, clc, remove_ids)
+                = self._delete_servers(module, clc, remove_ids)
 
         return server_dict_array, changed_server_ids, partial_servers_ids, changed
 
-    @staticmethod
-    def _wait_for_requests(module, request_list):
+    def _wait_for_requests(self, module, request_list):
         """
-        Block until server provisioning requests are completed.
+        Block until server provisioning requests are completed. All outstanding
+        requests are polled together, and the poll interval backs off while none
+        of them completes.
         :param module: the AnsibleModule object
-        :param request_list: a list of clc-sdk.Request instances
+        :param request_list: a list of clc-sdk.Requests instances
         :return: none
         """
         wait = module.params.get('wait')
-        if wait:
-            # Requests.WaitUntilComplete() returns the count of failed requests
-            failed_requests_count = sum(
-                [request.WaitUntilComplete() for request in request_list])
+        if not wait:
+            return
+
+        start = time.time()
+        pending = []
+        for pending_requests in request_list:
+            pending.extend(pending_requests.requests)
+        total = len(pending)
+        errors = dict((request.id, 0) for request in pending)
+        results = []
+
+        def status(request):
+            try:
+                return request.Status(), None
+            except (CLCException, APIFailedResponse) as ex:
+                return None, str(ex)
+
+        interval = CLC_POLL_MIN_INTERVAL
+        while pending:
+            still_pending = []
+            statuses = ClcServer._run_concurrently(status, pending)
+            for request, (request_status, error) in zip(pending, statuses):
+                if request_status is None:
+                    errors[request.id] += 1
+                    if errors[request.id] < CLC_POLL_MAX_ERRORS:
+                        still_pending.append(request)
+                        continue
+                    request_status = 'unknown'
+                errors[request.id] = 0
+
+                if request_status in ('succeeded', 'failed', 'unknown'):
+                    result = {
+                        'id': request.id,
+                        'status': request_status,
+                        'duration': round(time.time() - start, 1)}
+                    if error:
+                        result['error'] = error
+                    results.append(result)
+                    module.log('CLC request %s %s after %ss, %s still pending' % (
+                        request.id, request_status, result['duration'],
+                        total - len(results)))
+                else:
+                    still_pending.append(request)
 
-            if failed_requests_count > 0:
-                module.fail_json(
-                    msg='Unable to process server request')
+            if still_pending and len(still_pending) == len(pending):
+                interval = min(interval * 2, CLC_POLL_MAX_INTERVAL)
+            else:
+                interval = CLC_POLL_MIN_INTERVAL
+            pending = still_pending
+            if pending:
+                sleep(interval)
+
+        self.request_results.extend(results)
+        failed_requests = [r for r in results if r['status'] != 'succeeded']
+        if failed_requests:
+            module.fail_json(
+                msg='Unable to process server request',
+                requests=self.request_results)
+
+    @staticmethod
+    def _run_concurrently(func, items):
+        """
+        Call func for every item using a bounded pool of threads
+        :param func: the function to call, it must not exit the module
+        :param items: list of arguments to call func with
+        :return: list of the results in the order of items
+        """
+        if len(items) < 2:
+            return [func(item) for item in items]
+        pool = ThreadPool(min(CLC_MAX_THREADS, len(items)))
+        try:
+            return pool.map(func, items)
+        finally:
+            pool.close()
 
     @staticmethod
     def _refresh_servers(module, servers):
         """
-        Loop through a list of servers and refresh them.
+        Refresh a list of servers concurrently.
         :param module: the AnsibleModule object
         :param servers: list of clc-sdk.Server instances to refresh
         :return: none
         """
-        for server in servers:
+        def refresh(server):
             try:
                 server.Refresh()
             except CLCException as ex:
-                module.fail_json(msg='Unable to refresh the server {0}. {1}'.format(
-                    server.id, ex.message
-                ))
+                return 'Unable to refresh the server {0}. {1}'.format(
+                    server.id, ex.message)
+            return None
+
+        errors = [error for error in ClcServer._run_concurrently(refresh, servers) if error]
+        if errors:
+            module.fail_json(msg=errors[0])
 
-    @staticmethod
     def _add_public_ip_to_servers(
+            self,
             module,
             should_add_public_ip,
             servers,
@@ -1161,7 +1258,7 @@ class ClcServer:
                     request_list.append(request)
         except APIFailedResponse:
             failed_servers.append(server)
-        ClcServer._wait_for_requests(module, request_list)
+        self._wait_for_requests(module, request_list)
         return failed_servers
 
     @staticmethod
@@ -1237,8 +1334,7 @@ class ClcServer:
                         msg='multiple alert policies were found with policy name : %s' % alert_policy_name)
         return alert_policy_id
 
-    @staticmethod
-    def _delete_servers(module, clc, server_ids):
+    def _delete_servers(self, module, clc, server_ids):
         """
         Delete the servers on the provided list
         :param module: the AnsibleModule object
@@ -1258,15 +1354,14 @@ class ClcServer:
         for server in servers:
             if not module.check_mode:
                 request_list.append(server.Delete())
-        ClcServer._wait_for_requests(module, request_list)
+        self._wait_for_requests(module, request_list)
 
         for server in servers:
             terminated_server_ids.append(server.id)
 
         return True, server_dict_array, terminated_server_ids
 
-    @staticmethod
-    def _start_stop_servers(module, clc, server_ids):
+    def _start_stop_servers(self, module, clc, server_ids):
         """
         Start or Stop the servers on the provided list
         :param module: the AnsibleModule object
@@ -1298,7 +1393,7 @@ class ClcServer:
                             state))
                 changed = True
 
-        ClcServer._wait_for_requests(module, request_list)
+        self._wait_for_requests(module, request_list)
         ClcServer._refresh_servers(module, changed_servers)
 
         for server in set(changed_servers + servers):
@@ -1341,8 +1436,7 @@ class ClcServer:
                     server.id))
         return result
 
-    @staticmethod
-    def _find_running_servers_by_group(module, datacenter, count_group):
+    def _find_running_servers_by_group(self, module, datacenter, count_group):
         """
         Find a list of running servers in the provided group
         :param module: the AnsibleModule object
@@ -1350,12 +1444,15 @@ class ClcServer:
         :param count_group: the group to count the servers
         :return: list of servers, and list of running servers
         """
-        group = ClcServer._find_group(
+        group = self._find_group(
             module=module,
             datacenter=datacenter,
             lookup_group=count_group)
 
-        servers = group.Servers().Servers()
+        server_ids = group.Servers().servers_lst
+        servers = ClcServer._run_concurrently(
+            lambda server_id: self.clc.v2.Server(id=server_id, alias=group.alias),
+            server_ids)
         running_servers = []
 
         for server in servers:
@@ -1364,27 +1461,18 @@ class ClcServer:
 
         return servers, running_servers
 
-    @staticmethod
-    def _find_group(module, datacenter, lookup_group=None):
+    def _find_group(self, module, datacenter, lookup_group=None):
         """
-        Find a server group in a datacenter by calling the CLC API
+        Find a server group in the group index of a datacenter
         :param module: the AnsibleModule instance
         :param datacenter: clc-sdk.Datacenter instance to search for the group
-        :param lookup_group: string name of the group to search for
+        :param lookup_group: string name or id of the group to search for
         :return: clc-sdk.Group instance
         """
         if not lookup_group:
             lookup_group = module.params.get('group')
-        try:
-            return datacenter.Groups().Get(lookup_group)
-        except CLCException:
-            pass
 
-        # The search above only acts on the main
-        result = ClcServer._find_group_recursive(
-            module,
-            datacenter.Groups(),
-            lookup_group)
+        result = self._get_group_index(datacenter).get(lookup_group.lower())
 
         if result is None:
             module.fail_json(
@@ -1396,30 +1484,30 @@ class ClcServer:
 
         return result
 
-    @staticmethod
-    def _find_group_recursive(module, group_list, lookup_group):
-        """
-        Find a server group by recursively walking the tree
-        :param module: the AnsibleModule instance to use
-        :param group_list: a list of groups to search
-        :param lookup_group: the group to look for
-        :return: list of groups
-        """
-        result = None
-        for group in group_list.groups:
-            subgroups = group.Subgroups()
-            try:
-                return subgroups.Get(lookup_group)
-            except CLCException:
-                result = ClcServer._find_group_recursive(
-                    module,
-                    subgroups,
-                    lookup_group)
-
-            if result is not None:
-                break
-
-        return result
+    def _get_group_index(self, datacenter):
+        """
+        Fetch the group hierarchy of a datacenter once and index it by name and id.
+        The root group is returned by the API with all of its nested subgroups, so
+        the whole tree is walked without further API calls. Shallower groups win
+        when names are not unique.
+        :param datacenter: clc-sdk.Datacenter instance to index
+        :return: dictionary of lower cased group names and ids to clc-sdk.Group instances
+        """
+        if datacenter.id not in self.group_dict:
+            root_group = datacenter.RootGroup()
+            index = {}
+            pending = list(root_group.data.get('groups', []))
+            while pending:
+                group_obj = pending.pop(0)
+                group = self.clc.v2.Group(
+                    id=group_obj['id'],
+                    alias=root_group.alias,
+                    group_obj=group_obj)
+                index.setdefault(group_obj['id'].lower(), group)
+                index.setdefault(group_obj['name'].lower(), group)
+                pending.extend(group_obj.get('groups', []))
+            self.group_dict[datacenter.id] = index
+        return self.group_dict[datacenter.id]
 
     @staticmethod
     def _create_clc_server(
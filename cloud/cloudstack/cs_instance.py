@@ -209,6 +209,31 @@ options:
       - Poll async jobs until job has finished.
     required: false
     default: true
+  page_size:
+    description:
+      - Number of results requested per page when listing instances, offerings, templates and networks.
+    required: false
+    default: 500
+    version_added: '2.2'
+  instances:
+    description:
+      - List of instances to manage in one task, as dicts with C(name) or C(display_name) and optional per instance
+        C(group), C(service_offering), C(cpu), C(cpu_speed), C(memory), C(template), C(iso), C(networks), C(ip_to_networks), C(ip_address),
+        C(ip6_address), C(disk_offering), C(disk_size), C(root_disk_size), C(keyboard), C(security_groups),
+        C(affinity_groups), C(user_data) and C(ssh_key). All other options are shared by every instance.
+      - Zone, template and offering lookups are resolved once and all deploy, start and stop jobs are polled together.
+      - Only C(state=present), C(deployed), C(started) and C(stopped) are supported. Existing instances are
+        started or stopped but not updated.
+      - Mutually exclusive with C(name) and C(display_name).
+    required: false
+    default: null
+    version_added: '2.2'
+  concurrency:
+    description:
+      - Maximum number of async jobs in flight when C(instances) is used.
+    required: false
+    default: 10
+    version_added: '2.2'
 extends_documentation_fragment: cloudstack
 '''
 
@@ -273,6 +298,20 @@ EXAMPLES = '''
 
 # Remove an instance
 - local_action: cs_instance name=web-vm-1 state=absent
+
+# Deploy a fleet of instances, 20 jobs at a time
+- local_action:
+    module: cs_instance
+    template: Linux Debian 7 64-bit
+    service_offering: Tiny
+    zone: ch-gva-2
+    state: started
+    concurrency: 20
+    instances:
+      - name: web-vm-1
+      - name: web-vm-2
+      - name: db-vm-1
+        service_offering: Large
 '''
 
 RETURN = '''
@@ -392,13 +431,31 @@ instance_name:
   returned: success
   type: string
   sample: i-44-3992-VM
+instances:
+  description: Result of every instance when C(instances) is used, with the job duration in seconds.
+  returned: success, when instances is used
+  type: list
+  sample: '[ { "name": "web-vm-1", "action": "deploy", "changed": true, "id": "04589590-ac63-4ffc-93f5-b698b8ac38b6", "state": "Running", "duration": 42.1 } ]'
 '''
 
 import base64
+import re
+import time
+from multiprocessing.pool import ThreadPool
 
 # import cloudstack common
 from ansible.module_utils.cloudstack import *
 
+# Options which can be set per instance in the instances list
+CS_FLEET_INSTANCE_KEYS = [
+    'name', 'display_name', 'group', 'service_offering', 'cpu', 'cpu_speed', 'memory',
+    'template', 'iso', 'networks', 'ip_to_networks', 'ip_address', 'ip6_address', 'disk_offering',
+    'disk_size', 'root_disk_size', 'keyboard', 'security_groups', 'affinity_groups', 'user_data', 'ssh_key',
+]
+CS_FLEET_STATES = ['present', 'deployed', 'started', 'stopped']
+
+CS_UUID_RE = re.compile('^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
 
 class AnsibleCloudStackInstance(AnsibleCloudStack):
 
@@ -419,19 +476,73 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
         self.instance = None
         self.template = None
         self.iso = None
+        self.lookup_cache = {}
+
+
+    def list_paged(self, api, result_key, **args):
+        """Yield the items of a list API call page by page."""
+        page_size = self.module.params.get('page_size')
+        args['pagesize'] = page_size
+        page = 1
+        while True:
+            args['page'] = page
+            res = getattr(self.cs, api)(**args)
+            if res and 'errortext' in res:
+                self.module.fail_json(msg="Failed: '%s'" % res['errortext'])
+
+            items = []
+            if res:
+                items = res.get(result_key, [])
+            for item in items:
+                yield item
+
+            if len(items) < page_size or page * page_size >= res.get('count', 0):
+                break
+            page += 1
+
+
+    def lookup(self, api, result_key, value, fields, **args):
+        """Find a resource matching value in one of fields, cached for the run.
+
+        The query is narrowed server side by id or keyword before falling back
+        to the full listing. If value is None, the first resource found is
+        returned.
+        """
+        cache_key = (api, value, tuple(sorted(args.items())))
+        if cache_key in self.lookup_cache:
+            return self.lookup_cache[cache_key]
+
+        queries = [{}]
+        if value is not None:
+            queries = [{'keyword': value}, {}]
+            if CS_UUID_RE.match(value):
+                queries.insert(0, {'id': value})
+
+        found = None
+        for query in queries:
+            query.update(args)
+            try:
+                for item in self.list_paged(api, result_key, **query):
+                    if value is None or value in [ item.get(f) for f in fields ]:
+                        found = item
+                        break
+            except CloudStackException:
+                # ids of resources not visible to the caller are rejected
+                if 'id' not in query:
+                    raise
+            if found:
+                break
+
+        self.lookup_cache[cache_key] = found
+        return found
 
 
     def get_service_offering_id(self):
         service_offering = self.module.params.get('service_offering')
 
-        service_offerings = self.cs.listServiceOfferings()
-        if service_offerings:
-            if not service_offering:
-                return service_offerings['serviceoffering'][0]['id']
-
-            for s in service_offerings['serviceoffering']:
-                if service_offering in [ s['name'], s['id'] ]:
-                    return s['id']
+        s = self.lookup('listServiceOfferings', 'serviceoffering', service_offering, [ 'name', 'id' ])
+        if s:
+            return s['id']
         self.module.fail_json(msg="Service offering '%s' not found" % service_offering)
 
 
@@ -454,24 +565,20 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
                 return self._get_by_key(key, self.template)
 
             args['templatefilter'] = self.module.params.get('template_filter')
-            templates = self.cs.listTemplates(**args)
-            if templates:
-                for t in templates['template']:
-                    if template in [ t['displaytext'], t['name'], t['id'] ]:
-                        self.template = t
-                        return self._get_by_key(key, self.template)
+            t = self.lookup('listTemplates', 'template', template, [ 'displaytext', 'name', 'id' ], **args)
+            if t:
+                self.template = t
+                return self._get_by_key(key, self.template)
             self.module.fail_json(msg="Template '%s' not found" % template)
 
         elif iso:
             if self.iso:
                 return self._get_by_key(key, self.iso)
             args['isofilter'] = self.module.params.get('template_filter')
-            isos = self.cs.listIsos(**args)
-            if isos:
-                for i in isos['iso']:
-                    if iso in [ i['displaytext'], i['name'], i['id'] ]:
-                        self.iso = i
-                        return self._get_by_key(key, self.iso)
+            i = self.lookup('listIsos', 'iso', iso, [ 'displaytext', 'name', 'id' ], **args)
+            if i:
+                self.iso = i
+                return self._get_by_key(key, self.iso)
             self.module.fail_json(msg="ISO '%s' not found" % iso)
 
 
@@ -481,11 +588,9 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
         if not disk_offering:
             return None
 
-        disk_offerings = self.cs.listDiskOfferings()
-        if disk_offerings:
-            for d in disk_offerings['diskoffering']:
-                if disk_offering in [ d['displaytext'], d['name'], d['id'] ]:
-                    return d['id']
+        d = self.lookup('listDiskOfferings', 'diskoffering', disk_offering, [ 'displaytext', 'name', 'id' ])
+        if d:
+            return d['id']
         self.module.fail_json(msg="Disk offering '%s' not found" % disk_offering)
 
 
@@ -499,12 +604,23 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
             args['domainid']    = self.get_domain(key='id')
             args['projectid']   = self.get_project(key='id')
             # Do not pass zoneid, as the instance name must be unique across zones.
-            instances = self.cs.listVirtualMachines(**args)
-            if instances:
-                for v in instances['virtualmachine']:
-                    if instance_name.lower() in [ v['name'].lower(), v['displayname'].lower(), v['id'] ]:
-                        self.instance = v
-                        break
+            # The keyword matches name and display name server side.
+            queries = [ {'keyword': instance_name} ]
+            if CS_UUID_RE.match(instance_name):
+                queries.insert(0, {'id': instance_name})
+
+            for query in queries:
+                query.update(args)
+                try:
+                    for v in self.list_paged('listVirtualMachines', 'virtualmachine', **query):
+                        if instance_name.lower() in [ v['name'].lower(), v['displayname'].lower(), v['id'] ]:
+                            self.instance = v
+                            break
+                except CloudStackException:
+                    if 'id' not in query:
+                        raise
+                if self.instance:
+                    break
         return self.instance
 
 
@@ -558,14 +674,17 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
         args['projectid']   = self.get_project(key='id')
         args['zoneid']      = self.get_zone(key='id')
 
-        networks = self.cs.listNetworks(**args)
+        cache_key = ('listNetworks', tuple(sorted(args.items())))
+        if cache_key not in self.lookup_cache:
+            self.lookup_cache[cache_key] = list(self.list_paged('listNetworks', 'network', **args))
+        networks = self.lookup_cache[cache_key]
         if not networks:
             self.module.fail_json(msg="No networks available")
 
         network_ids = []
         network_displaytexts = []
         for network_name in network_names:
-            for n in networks['network']:
+            for n in networks:
                 if network_name in [ n['displaytext'], n['name'], n['id'] ]:
                     network_ids.append(n['id'])
                     network_displaytexts.append(n['name'])
@@ -883,6 +1002,123 @@ class AnsibleCloudStackInstance(AnsibleCloudStack):
         return instance
 
 
+    def get_fleet_index(self):
+        args                = {}
+        args['account']     = self.get_account(key='name')
+        args['domainid']    = self.get_domain(key='id')
+        args['projectid']   = self.get_project(key='id')
+
+        index = {}
+        for v in self.list_paged('listVirtualMachines', 'virtualmachine', **args):
+            for k in [ v['name'].lower(), v['displayname'].lower(), v['id'] ]:
+                index.setdefault(k, v)
+        return index
+
+
+    def submit_fleet_job(self, params, instance, action):
+        # The instance methods read the module params, swap in the ones of this instance
+        module_params = self.module.params
+        self.module.params = params
+        self.instance = instance
+        self.template = None
+        self.iso = None
+        try:
+            if action == 'deploy':
+                return self.deploy_instance(start_vm=params['state'] != 'stopped')
+            elif action == 'start':
+                return self.start_instance()
+            else:
+                return self.stop_instance()
+        finally:
+            self.module.params = module_params
+
+
+    def poll_fleet_job(self, jobid):
+        return self.cs.queryAsyncJobResult(jobid=jobid)
+
+
+    def fleet_instances(self):
+        state = self.module.params.get('state')
+        if state not in CS_FLEET_STATES:
+            self.module.fail_json(msg="instances only supports state %s" % ', '.join(CS_FLEET_STATES))
+
+        index = self.get_fleet_index()
+
+        queue = []
+        results = []
+        for item in self.module.params.get('instances'):
+            if not isinstance(item, dict):
+                item = {'name': item}
+            unknown = [k for k in item if k not in CS_FLEET_INSTANCE_KEYS]
+            if unknown:
+                self.module.fail_json(msg="Unsupported keys in instances: %s" % ', '.join(unknown))
+
+            params = dict(self.module.params)
+            params.update(item)
+            params['poll_async'] = False
+            name = params.get('name') or params.get('display_name')
+            if not name:
+                self.module.fail_json(msg="Every entry in instances requires name or display_name")
+
+            instance = index.get(name.lower())
+            instance_state = instance and instance['state'].lower()
+            if not instance:
+                action = 'deploy'
+            elif state == 'started' and instance_state in ['stopped', 'stopping']:
+                action = 'start'
+            elif state == 'stopped' and instance_state in ['starting', 'running']:
+                action = 'stop'
+            else:
+                results.append({'name': name, 'changed': False, 'id': instance['id'], 'state': instance['state']})
+                continue
+
+            self.result['changed'] = True
+            if self.module.check_mode:
+                results.append({'name': name, 'action': action, 'changed': True})
+            else:
+                queue.append((name, params, instance, action))
+
+        concurrency = max(1, self.module.params.get('concurrency'))
+        running = {}
+        pool = ThreadPool(concurrency)
+        try:
+            while queue or running:
+                while queue and len(running) < concurrency:
+                    name, params, instance, action = queue.pop(0)
+                    job = self.submit_fleet_job(params, instance, action)
+                    running[job['jobid']] = (name, action, time.time())
+
+                time.sleep(2)
+                jobids = list(running.keys())
+                for jobid, res in zip(jobids, pool.map(self.poll_fleet_job, jobids)):
+                    if res.get('jobstatus') == 0:
+                        continue
+
+                    name, action, started = running.pop(jobid)
+                    entry = {
+                        'name': name,
+                        'action': action,
+                        'changed': True,
+                        'duration': round(time.time() - started, 1),
+                    }
+                    job_result = res.get('jobresult', {})
+                    if res.get('jobstatus') == 2 or 'errortext' in job_result:
+                        entry['failed'] = True
+                        entry['msg'] = job_result.get('errortext', 'Job %s failed' % jobid)
+                    elif 'virtualmachine' in job_result:
+                        entry['id'] = job_result['virtualmachine']['id']
+                        entry['state'] = job_result['virtualmachine']['state']
+                    results.append(entry)
+        finally:
+            pool.close()
+
+        self.result['instances'] = results
+        failed = [r for r in results if r.get('failed')]
+        if failed:
+            self.module.fail_json(msg="%s of %s instances failed" % (len(failed), len(results)), **self.result)
+        return self.result
+
+
     def get_result(self, instance):
         super(AnsibleCloudStackInstance, self).get_result(instance)
         if instance:
@@ -937,6 +1173,9 @@ def main():
         force = dict(type='bool', default=False),
         tags = dict(type='list', aliases=[ 'tag' ], default=None),
         poll_async = dict(type='bool', default=True),
+        page_size = dict(type='int', default=500),
+        instances = dict(type='list', default=None),
+        concurrency = dict(type='int', default=10),
     ))
 
     required_together = cs_required_together()
@@ -948,10 +1187,12 @@ def main():
         argument_spec=argument_spec,
         required_together=required_together,
         required_one_of = (
-            ['display_name', 'name'],
+            ['display_name', 'name', 'instances'],
         ),
         mutually_exclusive = (
             ['template', 'iso'],
+            ['instances', 'name'],
+            ['instances', 'display_name'],
         ),
         supports_check_mode=True
     )
@@ -959,6 +1200,9 @@ def main():
     try:
         acs_instance = AnsibleCloudStackInstance(module)
 
+        if module.params.get('instances'):
+            module.exit_json(**acs_instance.fleet_instances())
+
         state = module.params.get('state')
 
         if state in ['absent', 'destroyed']:
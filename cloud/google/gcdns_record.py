@@ -44,8 +44,20 @@ options:
     record:
         description:
             - The fully-qualified domain name of the resource record.
-        required: true
+            - Required unless I(records) is specified.
+        required: false
         aliases: ['name']
+    records:
+        description:
+            - A list of resource records to manage in one task, each a dict
+              with the I(record), I(type), I(values) and I(ttl) keys of the
+              single record options. I(ttl) defaults to the I(ttl) option.
+            - The zone's records are listed once and every addition and
+              deletion is submitted as a single atomic Cloud DNS change.
+            - I(state) and I(overwrite) apply to every record in the list.
+            - Mutually exclusive with I(record), I(type) and I(values).
+        required: false
+        default: null
     zone:
         description:
             - The DNS domain name of the zone (e.g., example.com).
@@ -69,13 +81,14 @@ options:
     type:
         description:
             - The type of resource record to add.
-        required: true
+            - Required unless I(records) is specified.
+        required: false
         choices: [ 'A', 'AAAA', 'CNAME', 'SRV', 'TXT', 'SOA', 'NS', 'MX', 'SPF', 'PTR' ]
     values:
         description:
             - The values to use for the resource record.
             - I(values) must be specified if I(state) is C(present) or
-              I(overwrite) is C(True), or the module will fail.
+              I(overwrite) is C(False), or the module will fail.
             - Valid values vary based on the record's I(type). In addition,
               resource records that contain a DNS domain name in the value
               field (e.g., CNAME, PTR, SRV, .etc) MUST include a trailing dot
@@ -230,6 +243,21 @@ EXAMPLES = '''
     overwrite: true   # overwrite is true, so no values are needed
     type: A
 
+# Create or update several records in a single change.
+- gcdns_record:
+    zone: 'example.com'
+    overwrite: true
+    records:
+      - record: 'www.example.com'
+        type: A
+        values:
+          - '10.1.2.3'
+      - record: 'api.example.com'
+        type: CNAME
+        values:
+          - 'www.example.com.'
+        ttl: 60
+
 # Create an AAAA record
 - gcdns_record:
     record: 'www1.example.com'
@@ -307,6 +335,16 @@ zone_id:
     returned: success
     type: string
     sample: example-com
+additions:
+    description: The type:name of every resource record added by the change
+    returned: success, when records is specified
+    type: list
+    sample: ['A:www.example.com.']
+deletions:
+    description: The type:name of every resource record deleted by the change
+    returned: success, when records is specified
+    type: list
+    sample: ['A:www.example.com.']
 '''
 
 
@@ -314,6 +352,7 @@ zone_id:
 # Imports
 ################################################################################
 
+import re
 import socket
 from distutils.version import LooseVersion
 
@@ -503,8 +542,17 @@ def _get_zone(gcdns, zone_name, zone_id):
 
     # To create a zone, we need to supply a domain name. However, to delete a
     # zone, we need to supply a zone ID. Zone ID's are often based on domain
-    # names, but that's not guaranteed, so we'll iterate through the list of
-    # zones to see if we can find a matching domain name.
+    # names, so we'll try the ID libcloud would have generated for the domain
+    # first, before iterating through the list of zones to see if we can find
+    # a matching domain name.
+    guessed_id = re.sub(r'[^a-zA-Z0-9-]', '-', zone_name).strip('-')
+    try:
+        zone = gcdns.get_zone(guessed_id)
+        if zone.domain == zone_name:
+            return zone
+    except (ZoneDoesNotExistError, InvalidRequestError):
+        pass
+
     available_zones = gcdns.iterate_zones()
     found_zone = None
 
@@ -516,6 +564,97 @@ def _get_zone(gcdns, zone_name, zone_id):
     return found_zone
 
 
+def _get_record_index(gcdns, zone):
+    """Lists the zone's records once and indexes them by their type:name ID."""
+
+    return dict((record.id, record) for record in gcdns.iterate_records(zone))
+
+
+def _record_params(module, item):
+    """Builds the parameters of one I(records) entry."""
+
+    if not isinstance(item, dict) or not item.get('record') or not item.get('type'):
+        module.fail_json(
+            msg     = "every entry in records needs a record and a type, got: %s" % item,
+            changed = False
+        )
+
+    params = dict(
+        record    = item['record'],
+        type      = item['type'],
+        values    = item.get('values', item.get('value')),
+        ttl       = int(item.get('ttl', module.params['ttl'])),
+        state     = module.params['state'],
+        overwrite = module.boolean(module.params['overwrite'])
+    )
+
+    if params['type'] not in SUPPORTED_RECORD_TYPES:
+        module.fail_json(
+            msg     = "record type must be one of %s, got: %s" % (', '.join(SUPPORTED_RECORD_TYPES), params['type']),
+            changed = False
+        )
+    if params['values'] is not None and not isinstance(params['values'], list):
+        params['values'] = [params['values']]
+    if params['values'] is None and (params['state'] == 'present' or not params['overwrite']):
+        module.fail_json(
+            msg     = "values are required for record: %s" % params['record'],
+            changed = False
+        )
+
+    # Google Cloud DNS wants the trailing dot on all DNS names.
+    if params['record'][-1] != '.':
+        params['record'] = params['record'] + '.'
+
+    return params
+
+
+def update_records(module, gcdns, zone, records):
+    """Reconciles the parameters of every I(records) entry in a single Cloud
+    DNS change."""
+
+    index = _get_record_index(gcdns, zone)
+    additions = []
+    deletions = []
+
+    for params in records:
+        _additional_sanity_checks(module, zone, params)
+
+        record = index.get("%s:%s" % (params['type'], params['record']))
+        if record is not None and params['values'] is not None and \
+                _records_match(record.data['ttl'], record.data['rrdatas'], params['ttl'], params['values']):
+            if params['state'] == 'present':
+                continue
+        elif record is not None and not params['overwrite']:
+            module.fail_json(
+                msg     = 'cannot overwrite or delete non-matching record, overwrite protection enabled: ' +
+                          "%s:%s" % (params['type'], params['record']),
+                changed = False
+            )
+
+        if record is not None:
+            deletions.append(record.data)
+        if params['state'] == 'present':
+            additions.append(dict(
+                kind    = 'dns#resourceRecordSet',
+                name    = params['record'],
+                type    = params['type'],
+                ttl     = params['ttl'],
+                rrdatas = params['values']
+            ))
+
+    if (additions or deletions) and not module.check_mode:
+        try:
+            gcdns.ex_bulk_record_changes(zone, dict(additions=additions, deletions=deletions))
+        except InvalidRequestError as error:
+            # The change is atomic, so nothing was modified.
+            module.fail_json(
+                msg     = "error applying record changes: %s" % error,
+                changed = False
+            )
+
+    return additions, deletions
+
+
 def _records_match(old_ttl, old_values, new_ttl, new_values):
     """Checks to see if original and new TTL and values match."""
 
@@ -529,15 +668,18 @@ def _records_match(old_ttl, old_values, new_ttl, new_values):
     return matches
 
 
-def _sanity_check(module):
+def _sanity_check(module, params=None):
     """Run sanity checks that don't depend on info from the zone/record."""
 
-    overwrite   = module.params['overwrite']
-    record_name = module.params['record']
-    record_type = module.params['type']
-    state       = module.params['state']
-    ttl         = module.params['ttl']
-    values      = module.params['values']
+    if params is None:
+        params = module.params
+
+    overwrite   = params['overwrite']
+    record_name = params['record']
+    record_type = params['type']
+    state       = params['state']
+    ttl         = params['ttl']
+    values      = params['values']
 
     # Apache libcloud needs to be installed and at least the minimum version.
     if not HAS_LIBCLOUD:
@@ -616,13 +758,16 @@ def _sanity_check(module):
                     )
 
 
-def _additional_sanity_checks(module, zone):
+def _additional_sanity_checks(module, zone, params=None):
     """Run input sanity checks that depend on info from the zone/record."""
 
-    overwrite   = module.params['overwrite']
-    record_name = module.params['record']
-    record_type = module.params['type']
-    state       = module.params['state']
+    if params is None:
+        params = module.params
+
+    overwrite   = params['overwrite']
+    record_name = params['record']
+    record_type = params['type']
+    state       = params['state']
 
     # CNAME records are not allowed to have the same name as the root domain.
     if record_type == 'CNAME' and record_name == zone.domain:
@@ -666,10 +811,11 @@ def main():
     module = AnsibleModule(
         argument_spec = dict(
             state                 = dict(default='present', choices=['present', 'absent'], type='str'),
-            record                = dict(required=True, aliases=['name'], type='str'),
+            record                = dict(aliases=['name'], type='str'),
+            records               = dict(type='list'),
             zone                  = dict(type='str'),
             zone_id               = dict(type='str'),
-            type                  = dict(required=True, choices=SUPPORTED_RECORD_TYPES, type='str'),
+            type                  = dict(choices=SUPPORTED_RECORD_TYPES, type='str'),
             values                = dict(aliases=['value'], type='list'),
             ttl                   = dict(default=300, type='int'),
             overwrite             = dict(default=False, type='bool'),
@@ -678,16 +824,11 @@ def main():
             credentials_file      = dict(type='path'),
             project_id            = dict(type='str')
         ),
-        required_if = [
-            ('state', 'present', ['values']),
-            ('overwrite', False, ['values'])
-        ],
-        required_one_of     = [['zone', 'zone_id']],
+        mutually_exclusive  = [['records', 'record'], ['records', 'type'], ['records', 'values']],
+        required_one_of     = [['zone', 'zone_id'], ['record', 'records']],
         supports_check_mode = True
     )
 
-    _sanity_check(module)
-
     record_name = module.params['record']
     record_type = module.params['type']
     state       = module.params['state']
@@ -695,6 +836,20 @@ def main():
     zone_name   = module.params['zone']
     zone_id     = module.params['zone_id']
 
+    if module.params['records'] is not None:
+        records = [_record_params(module, item) for item in module.params['records']]
+        for params in records:
+            _sanity_check(module, params)
+    else:
+        # The values requirements only apply to a single record, the
+        # entries of records are checked individually.
+        if record_type is None:
+            module.fail_json(msg='type is required when record is specified', changed=False)
+        if module.params['values'] is None and \
+                (state == 'present' or not module.boolean(module.params['overwrite'])):
+            module.fail_json(msg='values are required unless state is absent and overwrite is true', changed=False)
+        _sanity_check(module)
+
     json_output = dict(
         state     = state,
         record    = record_name,
@@ -709,7 +864,7 @@ def main():
     # Google Cloud DNS wants the trailing dot on all DNS names.
     if zone_name is not None and zone_name[-1] != '.':
         zone_name = zone_name + '.'
-    if record_name[-1] != '.':
+    if record_name is not None and record_name[-1] != '.':
         record_name = record_name + '.'
 
     # Build a connection object that we can use to connect with Google Cloud
@@ -734,6 +889,12 @@ def main():
     json_output['zone'] = zone.domain
     json_output['zone_id'] = zone.id
 
+    if module.params['records'] is not None:
+        additions, deletions = update_records(module, gcdns, zone, records)
+        json_output['additions'] = ["%s:%s" % (r['type'], r['name']) for r in additions]
+        json_output['deletions'] = ["%s:%s" % (r['type'], r['name']) for r in deletions]
+        module.exit_json(changed=bool(additions or deletions), **json_output)
+
     # We also need to check if the record we want to create or remove actually
     # exists.
     try:
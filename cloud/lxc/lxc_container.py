@@ -152,8 +152,20 @@ options:
           - none
         description:
           - Type of compression to use when creating an archive of a running
-            container.
+            container. When C(pigz) or C(pbzip2) is installed it is used in
+            place of the single threaded compressor.
         default: gzip
+    archive_incremental:
+        version_added: "2.2"
+        choices:
+          - true
+          - false
+        description:
+          - Only archive the files changed since the last archive of the
+            container. A GNU tar manifest named after the container is kept
+            in "archive_path" and every run writes a new timestamped archive.
+            Remove the manifest to start over with a full archive.
+        default: false
     state:
         choices:
           - started
@@ -193,7 +205,9 @@ notes:
   - If "archive" is **true** the system will attempt to create a compressed
     tarball of the running container. The "archive" option supports LVM backed
     containers and will create a snapshot of the running container when
-    creating the archive.
+    creating the archive. The archive is streamed straight from the
+    (snapshot) mounted rootfs, only the container configuration is staged
+    in a temporary directory.
   - If your distro does not have a package for "python2-lxc", which is a
     requirement for this module, it can be installed from source at
     "https://github.com/lxc/python2-lxc" or installed via pip using the package
@@ -436,18 +450,23 @@ else:
 
 # LXC_COMPRESSION_MAP is a map of available compression types when creating
 # an archive of a container.
+# The "program" is a multi-threaded compressor used in place of the tar
+# built-in compression when it is installed.
 LXC_COMPRESSION_MAP = {
     'gzip': {
         'extension': 'tar.tgz',
-        'argument': '-czf'
+        'argument': '-czf',
+        'program': 'pigz'
     },
     'bzip2': {
         'extension': 'tar.bz2',
-        'argument': '-cjf'
+        'argument': '-cjf',
+        'program': 'pbzip2'
     },
     'none': {
         'extension': 'tar',
-        'argument': '-cf'
+        'argument': '-cf',
+        'program': None
     }
 }
 
@@ -1359,25 +1378,54 @@ class LxcContainerManagement(object):
         archive_compression = self.module.params.get('archive_compression')
         compression_type = LXC_COMPRESSION_MAP[archive_compression]
 
-        # remove trailing / if present.
-        archive_name = '%s.%s' % (
-            os.path.join(
-                archive_path,
-                self.container_name
-            ),
-            compression_type['extension']
-        )
-
         build_command = [
             self.module.get_bin_path('tar', True),
             '--directory=%s' % os.path.realpath(
                 os.path.expanduser(source_dir)
-            ),
-            compression_type['argument'],
-            archive_name,
-            '.'
+            )
         ]
 
+        archive_base = os.path.join(archive_path, self.container_name)
+        if self.module.params.get('archive_incremental'):
+            # Every run writes a new archive holding the files changed since
+            # the manifest was last updated. The device check is disabled as
+            # snapshots are mounted on a new device every time.
+            archive_base = '%s-%s' % (
+                archive_base,
+                time.strftime('%Y%m%d%H%M%S')
+            )
+            build_command.extend([
+                '--listed-incremental=%s.snar' % os.path.join(
+                    archive_path,
+                    self.container_name
+                ),
+                '--no-check-device'
+            ])
+
+        archive_name = '%s.%s' % (
+            archive_base,
+            compression_type['extension']
+        )
+
+        compress_program = None
+        if compression_type['program']:
+            compress_program = self.module.get_bin_path(
+                compression_type['program']
+            )
+
+        if compress_program:
+            build_command.extend([
+                '--use-compress-program=%s' % compress_program,
+                '-cf',
+                archive_name
+            ])
+        else:
+            build_command.extend([
+                compression_type['argument'],
+                archive_name
+            ])
+        build_command.append('.')
+
         rc, stdout, err = self._run_command(
             build_command=build_command,
             unsafe_shell=True
@@ -1418,41 +1466,73 @@ class LxcContainerManagement(object):
             )
 
     def _rsync_data(self, container_path, temp_dir):
-        """Sync the container directory to the temp directory.
+        """Sync the container configuration to the temp directory.
+
+        The rootfs and any overlayfs layers are left out, they are mounted
+        into the working directory and archived in place.
 
-        :param container_path: path to the container container
+        :param container_path: path to the container rootfs
         :type container_path: ``str``
         :param temp_dir: path to the temporary local working directory
         :type temp_dir: ``str``
         """
-        # This loop is created to support overlayfs archives. This should
-        # squash all of the layers into a single archive.
+        container_dir = os.path.dirname(self.container.config_file_name)
+
         fs_paths = container_path.split(':')
         if 'overlayfs' in fs_paths:
             fs_paths.pop(fs_paths.index('overlayfs'))
 
+        build_command = [
+            self.module.get_bin_path('rsync', True),
+            '-aHAX'
+        ]
         for fs_path in fs_paths:
-            # Set the path to the container data
-            fs_path = os.path.dirname(fs_path)
-
-            # Run the sync command
-            build_command = [
-                self.module.get_bin_path('rsync', True),
-                '-aHAX',
-                fs_path,
-                temp_dir
-            ]
-            rc, stdout, err = self._run_command(
-                build_command,
-                unsafe_shell=True
-            )
-            if rc != 0:
-                self.failure(
-                    err=err,
-                    rc=rc,
-                    msg='failed to perform archive',
-                    command=' '.join(build_command)
+            fs_path = os.path.realpath(fs_path)
+            if fs_path.startswith(container_dir + os.sep):
+                # Anchored to the transfer root, the parent of container_dir
+                build_command.append(
+                    '--exclude=/%s' % os.path.relpath(
+                        fs_path,
+                        os.path.dirname(container_dir)
+                    )
                 )
+        build_command.extend([container_dir, temp_dir])
+
+        rc, stdout, err = self._run_command(
+            build_command,
+            unsafe_shell=True
+        )
+        if rc != 0:
+            self.failure(
+                err=err,
+                rc=rc,
+                msg='failed to perform archive',
+                command=' '.join(build_command)
+            )
+
+    def _bind_mount(self, source_dir, mount_point):
+        """Bind mount a directory.
+
+        :param source_dir: path of the directory to bind mount.
+        :type source_dir: ``str``
+        :param mount_point: path on the file system that is mounted.
+        :type mount_point: ``str``
+        """
+
+        build_command = [
+            self.module.get_bin_path('mount', True),
+            '--bind',
+            source_dir,
+            mount_point,
+        ]
+        rc, stdout, err = self._run_command(build_command)
+        if rc != 0:
+            self.failure(
+                err=err,
+                rc=rc,
+                msg='failed to bind mount %s to %s' % (source_dir, mount_point),
+                command=' '.join(build_command)
+            )
 
     def _unmount(self, mount_point):
         """Unmount a file system.
@@ -1507,12 +1587,15 @@ class LxcContainerManagement(object):
         The process is as follows:
             * Stop or Freeze the container
             * Create temporary dir
-            * Copy container and config to temporary directory
+            * Copy container config to temporary directory
             * If LVM backed:
                 * Create LVM snapshot of LV backing the container
                 * Mount the snapshot to tmpdir/rootfs
-            * Restore the state of the container
+            * If overlayfs backed:
+                * Mount the overlay to tmpdir/rootfs
+            * Otherwise bind mount the rootfs to tmpdir/rootfs
             * Create tar of tmpdir
+            * Restore the state of the container
             * Clean up
         """
 
@@ -1537,6 +1620,8 @@ class LxcContainerManagement(object):
         snapshot_name = '%s_lxc_snapshot' % self.container_name
 
         container_state = self._get_state()
+        mounted = False
+        snapshot_created = False
         try:
             # Ensure the original container is stopped or frozen
             if container_state not in ['stopped', 'frozen']:
@@ -1545,14 +1630,14 @@ class LxcContainerManagement(object):
                 else:
                     self.container.stop()
 
-            # Sync the container data from the container_path to work_dir
+            # Sync the container config from the container_path to work_dir
             self._rsync_data(lxc_rootfs, temp_dir)
 
+            if not os.path.exists(mount_point):
+                os.makedirs(mount_point)
+
             if block_backed:
                 if snapshot_name not in self._lvm_lv_list():
-                    if not os.path.exists(mount_point):
-                        os.makedirs(mount_point)
-
                     # Take snapshot
                     size, measurement = self._get_lv_size(
                         lv_name=self.container_name
@@ -1562,6 +1647,7 @@ class LxcContainerManagement(object):
                         snapshot_name=snapshot_name,
                         snapshot_size_gb=size
                     )
+                    snapshot_created = True
 
                     # Mount snapshot
                     self._lvm_lv_mount(
@@ -1583,16 +1669,22 @@ class LxcContainerManagement(object):
                     upperdir=upperdir,
                     mount_point=mount_point
                 )
+            else:
+                self._bind_mount(
+                    source_dir=lxc_rootfs,
+                    mount_point=mount_point
+                )
+            mounted = True
 
             # Set the state as changed and set a new fact
             self.state_change = True
             return self._create_tar(source_dir=work_dir)
         finally:
-            if block_backed or overlayfs_backed:
-                # unmount snapshot
+            if mounted:
+                # unmount snapshot, overlay or bind mount
                 self._unmount(mount_point)
 
-            if block_backed:
+            if snapshot_created:
                 # Remove snapshot
                 self._lvm_lv_remove(snapshot_name)
 
@@ -1732,6 +1824,10 @@ def main():
             archive_compression=dict(
                 choices=LXC_COMPRESSION_MAP.keys(),
                 default='gzip'
+            ),
+            archive_incremental=dict(
+                type='bool',
+                default=False
             )
         ),
         supports_check_mode=False,
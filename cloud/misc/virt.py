@@ -27,9 +27,17 @@ options:
     description:
       - name of the guest VM being managed. Note that VM must be previously
         defined with xml.
-    required: true
+      - Required unless C(names) is given.
+    required: false
     default: null
-    aliases: []
+    aliases: ['guest']
+  names:
+    description:
+      - list of guest VMs to apply C(state) or a guest C(command) to over a
+        single hypervisor connection. Mutually exclusive with C(name).
+    required: false
+    default: null
+    version_added: "2.2"
   state:
     description:
       - Note that there may be some lag for state requests like C(shutdown)
@@ -82,6 +90,14 @@ tasks:
           uri=lxc:///
   - name: start vm
     virt: name=foo state=running uri=lxc:///
+
+# make sure a set of guests is running, over one libvirt connection
+- virt:
+    names:
+      - web01
+      - web02
+      - db01
+    state: running
 '''
 
 RETURN = '''
@@ -94,6 +110,12 @@ list_vms:
         "build.example.org", 
         "dev.example.org"
     ]
+# for state changes on several names
+guests:
+    description: The result of the state change for every guest in names
+    type: dictionary
+    returned: success, when names is given with a state
+    sample: {"web01": {"changed": true, "msg": 0}, "web02": {"changed": false}}
 # for status command
 status:
     description: The status of the VM, among running, crashed, paused and shutdown
@@ -131,6 +153,14 @@ VIRT_STATE_NAME_MAP = {
    6 : "crashed"
 }
 
+# libvirt listAllDomains() flags matching the VIRT_STATE_NAME_MAP names,
+# domains in any other state are matched with VIR_CONNECT_LIST_DOMAINS_OTHER.
+VIRT_STATE_LIST_FLAGS = {
+   "running"  : "VIR_CONNECT_LIST_DOMAINS_RUNNING",
+   "paused"   : "VIR_CONNECT_LIST_DOMAINS_PAUSED",
+   "shutdown" : "VIR_CONNECT_LIST_DOMAINS_SHUTOFF",
+}
+
 class VMNotFound(Exception):
     pass
 
@@ -160,6 +190,39 @@ class LibvirtConnection(object):
         """
         Extra bonus feature: vmid = -1 returns a list of everything
         """
+        if vmid == -1:
+            return self.find_all_vms()
+
+        try:
+            return self.conn.lookupByName(vmid)
+        except libvirt.libvirtError:
+            raise VMNotFound("virtual machine %s not found" % vmid)
+
+    def find_all_vms(self, state=None):
+        """
+        Return every domain, or only the domains in the given state, with as
+        few libvirt calls as the hypervisor allows
+        """
+        conn = self.conn
+
+        if not hasattr(conn, 'listAllDomains'):
+            vms = self._find_all_vms_legacy()
+            if state:
+                vms = [vm for vm in vms if self.get_status2(vm) == state]
+            return vms
+
+        if not state:
+            return conn.listAllDomains(0)
+
+        vms = []
+        if state in VIRT_STATE_LIST_FLAGS:
+            vms.extend(conn.listAllDomains(getattr(libvirt, VIRT_STATE_LIST_FLAGS[state])))
+        for vm in conn.listAllDomains(libvirt.VIR_CONNECT_LIST_DOMAINS_OTHER):
+            if self.get_status2(vm) == state:
+                vms.append(vm)
+        return vms
+
+    def _find_all_vms_legacy(self):
         conn = self.conn
 
         vms = []
@@ -176,14 +239,7 @@ class LibvirtConnection(object):
             vm = conn.lookupByName(name)
             vms.append(vm)
 
-        if vmid == -1:
-            return vms
-
-        for vm in vms:
-            if vm.name() == vmid:
-                return vm
-
-        raise VMNotFound("virtual machine %s not found" % vmid)
+        return vms
 
     def shutdown(self, vmid):
         return self.find_vm(vmid).shutdown()
@@ -255,9 +311,11 @@ class Virt(object):
     def __init__(self, uri, module):
         self.module = module
         self.uri = uri
+        self.conn = None
 
     def __get_conn(self):
-        self.conn = LibvirtConnection(self.uri, self.module)
+        if self.conn is None:
+            self.conn = LibvirtConnection(self.uri, self.module)
         return self.conn
 
     def get_vm(self, vmid):
@@ -311,16 +369,11 @@ class Virt(object):
 
     def list_vms(self, state=None):
         self.conn = self.__get_conn()
-        vms = self.conn.find_vm(-1)
+        vms = self.conn.find_all_vms(state=state)
         results = []
         for x in vms:
             try:
-                if state:
-                    vmstate = self.conn.get_status2(x)
-                    if vmstate == state:
-                        results.append(x.name())
-                else:
-                    results.append(x.name())
+                results.append(x.name())
             except:
                 pass
         return results
@@ -417,10 +470,39 @@ class Virt(object):
         self.__get_conn()
         return self.conn.define_from_xml(xml)
 
+def apply_state(v, guest, state, module):
+
+    res = {'changed': False}
+    status = v.status(guest)
+    if state == 'running':
+        if status == 'paused':
+            res['changed'] = True
+            res['msg'] = v.unpause(guest)
+        elif status != 'running':
+            res['changed'] = True
+            res['msg'] = v.start(guest)
+    elif state == 'shutdown':
+        if status != 'shutdown':
+            res['changed'] = True
+            res['msg'] = v.shutdown(guest)
+    elif state == 'destroyed':
+        if status != 'shutdown':
+            res['changed'] = True
+            res['msg'] = v.destroy(guest)
+    elif state == 'paused':
+        if status == 'running':
+            res['changed'] = True
+            res['msg'] = v.pause(guest)
+    else:
+        module.fail_json(msg="unexpected state")
+
+    return res
+
 def core(module):
 
     state      = module.params.get('state', None)
     guest      = module.params.get('name', None)
+    names      = module.params.get('names', None)
     command    = module.params.get('command', None)
     uri        = module.params.get('uri', None)
     xml        = module.params.get('xml', None)
@@ -435,35 +517,29 @@ def core(module):
         return VIRT_SUCCESS, res
 
     if state:
+        if names:
+            res = {'changed': False, 'guests': {}}
+            for name in names:
+                res['guests'][name] = apply_state(v, name, state, module)
+                if res['guests'][name]['changed']:
+                    res['changed'] = True
+            return VIRT_SUCCESS, res
+
         if not guest:
             module.fail_json(msg = "state change requires a guest specified")
 
-        res['changed'] = False
-        if state == 'running':
-            if v.status(guest) is 'paused':
-                res['changed'] = True
-                res['msg'] = v.unpause(guest)
-            elif v.status(guest) is not 'running':
-                res['changed'] = True
-                res['msg'] = v.start(guest)
-        elif state == 'shutdown':
-            if v.status(guest) is not 'shutdown':
-                res['changed'] = True
-                res['msg'] = v.shutdown(guest)
-        elif state == 'destroyed':
-            if v.status(guest) is not 'shutdown':
-                res['changed'] = True
-                res['msg'] = v.destroy(guest)
-        elif state == 'paused':
-            if v.status(guest) is 'running':
-                res['changed'] = True
-                res['msg'] = v.pause(guest)
-        else:
-            module.fail_json(msg="unexpected state")
-
+        res = apply_state(v, guest, state, module)
         return VIRT_SUCCESS, res
 
     if command:
+        if command in VM_COMMANDS and names:
+            if command == 'define':
+                module.fail_json(msg = "define does not support names, use name")
+            res = {command: {}}
+            for name in names:
+                res[command][name] = getattr(v, command)(name)
+            return VIRT_SUCCESS, res
+
         if command in VM_COMMANDS:
             if not guest:
                 module.fail_json(msg = "%s requires 1 argument: guest" % command)
@@ -496,11 +572,14 @@ def main():
 
     module = AnsibleModule(argument_spec=dict(
         name = dict(aliases=['guest']),
+        names = dict(type='list'),
         state = dict(choices=['running', 'shutdown', 'destroyed', 'paused']),
         command = dict(choices=ALL_COMMANDS),
         uri = dict(default='qemu:///system'),
         xml = dict(),
-    ))
+    ),
+        mutually_exclusive = [['name', 'names']],
+    )
 
     if not HAS_VIRT:
         module.fail_json(
@@ -180,6 +180,7 @@ EXAMPLES = '''
 import re
 import uuid
 import time
+from multiprocessing.pool import ThreadPool
 
 HAS_PB_SDK = True
 
@@ -193,6 +194,9 @@ LOCATIONS = ['us/las',
              'de/fkb',
              'us/lasdev']
 
+# Upper bound on concurrent power and removal calls against the API
+PB_MAX_THREADS = 10
+
 uuid_match = re.compile(
     '[\w]{8}-[\w]{4}-[\w]{4}-[\w]{4}-[\w]{12}', re.I)
 
@@ -302,47 +306,128 @@ def _create_machine(module, profitbricks, datacenter, name):
     except Exception as e:
         module.fail_json(msg="failed to create the new server: %s" % str(e))
 
-def _remove_machine(module, profitbricks, datacenter, name):
+def _remove_machine(module, profitbricks, datacenter, server):
     remove_boot_volume = module.params.get('remove_boot_volume')
-    wait = module.params.get('wait')
-    wait_timeout = module.params.get('wait_timeout')
-    changed = False
 
-    # User provided the actual UUID instead of the name.
-    try:
-        if remove_boot_volume:
-            # Collect information needed for later. 
-            server = profitbricks.get_server(datacenter, name)
-            volume_id = server['properties']['bootVolume']['href'].split('/')[7]
-
-        server_response = profitbricks.delete_server(datacenter, name)
-        changed = True
+    # Raise rather than fail_json, this runs in a worker thread.
+    if remove_boot_volume:
+        # Collect information needed for later.
+        boot_volume = server['properties'].get('bootVolume')
+        if boot_volume is None:
+            boot_volume = profitbricks.get_server(datacenter, server['id'])['properties']['bootVolume']
+        volume_id = boot_volume and boot_volume['href'].split('/')[7]
 
+    try:
+        profitbricks.delete_server(datacenter, server['id'])
     except Exception as e:
-        module.fail_json(msg="failed to terminate the virtual server: %s" % str(e))
+        raise Exception("failed to terminate the virtual server: %s" % str(e))
 
     # Remove the bootVolume
-    if remove_boot_volume:
+    if remove_boot_volume and volume_id:
         try:
-            volume_response = profitbricks.delete_volume(datacenter, volume_id)
-
+            profitbricks.delete_volume(datacenter, volume_id)
         except Exception as e:
-            module.fail_json(msg="failed to remove the virtual server's bootvolume: %s" % str(e))
+            raise Exception("failed to remove the virtual server's bootvolume: %s" % str(e))
 
-    return changed
+    return True
 
-def _startstop_machine(module, profitbricks, datacenter, name):
+def _startstop_machine(module, profitbricks, datacenter, server):
     state = module.params.get('state')
 
+    # Raise rather than fail_json, this runs in a worker thread.
     try:
         if state == 'running':
-            profitbricks.start_server(datacenter, name)
+            profitbricks.start_server(datacenter, server['id'])
         else:
-            profitbricks.stop_server(datacenter, name)
+            profitbricks.stop_server(datacenter, server['id'])
 
         return True
     except Exception as e:
-        module.fail_json(msg="failed to start or stop the virtual machine %s: %s" % (name, str(e)))
+        raise Exception("failed to start or stop the virtual machine %s: %s" % (server['properties']['name'], str(e)))
+
+def _run_concurrently(func, items):
+    """
+    Call func on every item from a thread pool.
+
+    Returns a list of (item, result, error) tuples in the order of items,
+    so failures can be reported from the main thread.
+    """
+    def run(item):
+        try:
+            return (item, func(item), None)
+        except Exception as e:
+            return (item, None, e)
+
+    if not items:
+        return []
+    pool = ThreadPool(min(PB_MAX_THREADS, len(items)))
+    try:
+        return pool.map(run, items)
+    finally:
+        pool.close()
+
+def _get_datacenter_id(profitbricks, datacenter):
+    """
+    Resolve a datacenter name or UUID to its UUID.
+
+    The names come from a single depth-expanded list call instead of a
+    get_datacenter() call per datacenter. Returns None if it is not found.
+    """
+    if uuid_match.match(datacenter):
+        return datacenter
+
+    datacenter_index = {}
+    for d in profitbricks.list_datacenters(depth=1)['items']:
+        datacenter_index.setdefault(d['properties']['name'], d['id'])
+    return datacenter_index.get(datacenter)
+
+def _get_servers(module, profitbricks, datacenter, instance_ids):
+    """
+    Resolve instance_ids, given as names or UUIDs, to server dicts.
+
+    Every server of the datacenter is listed once with its properties and
+    indexed by id and name. A name matching several servers selects all of
+    them, ids or names that do not exist are skipped.
+    """
+    server_index = {}
+    for s in profitbricks.list_servers(datacenter, depth=1)['items']:
+        server_index[s['id']] = [s]
+        server_index.setdefault(s['properties']['name'], []).append(s)
+
+    servers = {}
+    for n in instance_ids:
+        for s in server_index.get(n, []):
+            servers[s['id']] = s
+    return servers.values()
+
+def _server_in_state(server, state):
+    vm_state = server['properties']['vmState'].lower()
+    if state == 'running':
+        return vm_state == 'running'
+    return vm_state == 'shutoff'
+
+def _wait_for_state(module, profitbricks, datacenter, servers, state):
+    """
+    Poll the given servers until they all reached state.
+
+    Only the servers that have not reached the state yet are fetched again
+    on every round.
+    """
+    wait_timeout = time.time() + module.params.get('wait_timeout')
+    pending = [s['id'] for s in servers]
+    while pending:
+        results = _run_concurrently(
+            lambda server_id: profitbricks.get_server(datacenter, server_id),
+            pending)
+        pending = [server_id for server_id, server, error in results
+                   if error is not None or not _server_in_state(server, state)]
+        if not pending:
+            break
+        if wait_timeout <= time.time():
+            # waiting took too long
+            module.fail_json(msg = "wait for virtual machine state timeout on %s" % time.asctime(),
+                             pending=pending)
+        time.sleep(5)
 
 def _create_datacenter(module, profitbricks):
     datacenter = module.params.get('datacenter')
@@ -381,22 +466,15 @@ def create_virtual_machine(module, profitbricks):
     lan = module.params.get('lan')
     wait_timeout = module.params.get('wait_timeout')
     failed = True
-    datacenter_found = False
 
     virtual_machines = []
     virtual_machine_ids = []
 
     # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = profitbricks.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = profitbricks.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                datacenter_found = True
-                break
-
-    if not datacenter_found:
+    datacenter_id = _get_datacenter_id(profitbricks, datacenter)
+    if datacenter_id:
+        datacenter = datacenter_id
+    else:
         datacenter_response = _create_datacenter(module, profitbricks)
         datacenter = datacenter_response['id']
 
@@ -466,25 +544,20 @@ def remove_virtual_machine(module, profitbricks):
     instance_ids = module.params.get('instance_ids')
 
     # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = profitbricks.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = profitbricks.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                break
+    datacenter_id = _get_datacenter_id(profitbricks, datacenter)
+    if not datacenter_id:
+        return False
 
-    for n in instance_ids:
-        if(uuid_match.match(n)):
-            _remove_machine(module, profitbricks, d['id'], n)
-        else:
-            servers = profitbricks.list_servers(d['id'])
+    servers = _get_servers(module, profitbricks, datacenter_id, instance_ids)
+    results = _run_concurrently(
+        lambda server: _remove_machine(module, profitbricks, datacenter_id, server),
+        servers)
 
-            for s in servers['items']:
-                if n == s['properties']['name']:
-                    server_id = s['id']
+    errors = [str(error) for server, result, error in results if error is not None]
+    if errors:
+        module.fail_json(msg='; '.join(errors))
 
-                    _remove_machine(module, profitbricks, datacenter, server_id)
+    return len(results) > 0
 
 def startstop_machine(module, profitbricks, state):
     """
@@ -500,58 +573,29 @@ def startstop_machine(module, profitbricks, state):
         module.fail_json(msg='instance_ids should be a list of virtual machine ids or names, aborting')
 
     wait = module.params.get('wait')
-    wait_timeout = module.params.get('wait_timeout')
-    changed = False
 
     datacenter = module.params.get('datacenter')
     instance_ids = module.params.get('instance_ids')
 
     # Locate UUID for Datacenter
-    if not (uuid_match.match(datacenter)):
-        datacenter_list = profitbricks.list_datacenters()
-        for d in datacenter_list['items']:
-            dc = profitbricks.get_datacenter(d['id'])
-            if datacenter == dc['properties']['name']:
-                datacenter = d['id']
-                break
-
-    for n in instance_ids:
-        if(uuid_match.match(n)):
-            _startstop_machine(module, profitbricks, datacenter, n)
+    datacenter_id = _get_datacenter_id(profitbricks, datacenter)
+    if not datacenter_id:
+        module.fail_json(msg='datacenter %s not found' % datacenter)
 
-            changed = True
-        else:
-            servers = profitbricks.list_servers(d['id'])
-
-            for s in servers['items']:
-                if n == s['properties']['name']:
-                    server_id = s['id']
-                    _startstop_machine(module, profitbricks, datacenter, server_id)
+    servers = _get_servers(module, profitbricks, datacenter_id, instance_ids)
+    pending = [s for s in servers if not _server_in_state(s, state)]
+    results = _run_concurrently(
+        lambda server: _startstop_machine(module, profitbricks, datacenter_id, server),
+        pending)
 
-                    changed = True
+    errors = [str(error) for server, result, error in results if error is not None]
+    if errors:
+        module.fail_json(msg='; '.join(errors))
 
     if wait:
-        wait_timeout = time.time() + wait_timeout
-        while wait_timeout > time.time():
-            matched_instances = []
-            for res in profitbricks.list_servers(datacenter)['items']:
-                if state == 'running':
-                    if res['properties']['vmState'].lower() == state:
-                        matched_instances.append(res)
-                elif state == 'stopped':
-                    if res['properties']['vmState'].lower() == 'shutoff':
-                        matched_instances.append(res)                    
-
-            if len(matched_instances) < len(instance_ids):
-                time.sleep(5)
-            else:
-                break
-
-        if wait_timeout <= time.time():
-            # waiting took too long
-            module.fail_json(msg = "wait for virtual machine state timeout on %s" % time.asctime())
+        _wait_for_state(module, profitbricks, datacenter_id, pending, state)
 
-    return (changed)
+    return len(pending) > 0
 
 def main():
     module = AnsibleModule(
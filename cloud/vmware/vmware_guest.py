@@ -89,6 +89,17 @@ options:
         description:
             - The esxi hostname where the VM will run.
         required: True
+   inventory_cache_ttl:
+        description:
+            - Seconds to keep the on-disk name/uuid/path index of the vCenter inventory.
+            - Repeated guest tasks against the same vCenter reuse the index instead of walking every virtualmachine.
+            - The index is stored in a private per-user directory under the system temporary directory.
+            - VMs found by name in the cached index are checked against vCenter before use, and the index is rebuilt when
+              the VM is missing, renamed or removed. Lookups with a C(folder) and C(datacenter) are always resolved live.
+            - Without a C(folder), a duplicate name created within the cache lifetime is only detected once the index is rebuilt.
+            - Set to 0 to disable the cache.
+        required: False
+        default: 60
 extends_documentation_fragment: vmware.documentation    
 '''
 
@@ -139,15 +150,18 @@ except ImportError:
 HAS_PYVMOMI = False
 try:
     import pyVmomi
-    from pyVmomi import vim
+    from pyVmomi import vim, vmodl
     from pyVim.connect import SmartConnect, Disconnect
     HAS_PYVMOMI = True
 except ImportError:
     pass
 
 import atexit
+import hashlib
 import os
 import ssl
+import stat
+import tempfile
 import time
 
 from ansible.module_utils.urls import fetch_url
@@ -162,8 +176,9 @@ class PyVmomiHelper(object):
         self.module = module
         self.params = module.params
         self.si = None
+        self.inventory = None
+        self.inventory_cached = False
         self.smartconnect()
-        self.datacenter = None
 
     def smartconnect(self):
         kwargs = {'host': self.params['hostname'],
@@ -185,80 +200,144 @@ class PyVmomiHelper(object):
         atexit.register(Disconnect, self.si)
         self.content = self.si.RetrieveContent()
 
-    def _build_folder_tree(self, folder, tree={}, treepath=None):
-
-        tree = {'virtualmachines': [],
-                        'subfolders': {},
-                        'name': folder.name}
-
-        children = None
-        if hasattr(folder, 'childEntity'):
-            children = folder.childEntity
-
-        if children:
-            for child in children:
-                if child == folder or child in tree:
-                    continue
-                if type(child) == vim.Folder:
-                    #ctree = self._build_folder_tree(child, tree={})
-                    ctree = self._build_folder_tree(child)
-                    tree['subfolders'][child] = dict.copy(ctree)
-                elif type(child) == vim.VirtualMachine:
-                    tree['virtualmachines'].append(child)
-        else:
-            if type(folder) == vim.VirtualMachine:
-                return folder
-        return tree
+    def _inventory_cache_path(self):
 
+        ''' Path of the cache file in a private per-user directory, None if that directory is not safe to use '''
 
-    def _build_folder_map(self, folder, vmap={}, inpath='/'):
+        cache_dir = os.path.join(tempfile.gettempdir(), 'ansible-vmware-guest-%d' % os.getuid())
+        try:
+            os.mkdir(cache_dir, 0o700)
+        except OSError:
+            pass
+        try:
+            st = os.lstat(cache_dir)
+        except OSError:
+            return None
+        # refuse a directory planted or opened up by another user
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+            return None
+
+        key = '%s@%s' % (self.params['username'], self.params['hostname'])
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(cache_dir, '%s.json' % digest)
+
+    def _load_inventory_cache(self):
+        ttl = self.params['inventory_cache_ttl']
+        if not ttl:
+            return None
+
+        path = self._inventory_cache_path()
+        if path is None:
+            return None
+        try:
+            st = os.lstat(path)
+            if not stat.S_ISREG(st.st_mode) or st.st_uid != os.getuid():
+                return None
+            if time.time() - st.st_mtime > ttl:
+                return None
+            f = open(path)
+            try:
+                return json.load(f)
+            finally:
+                f.close()
+        except (IOError, OSError, ValueError):
+            return None
+
+    def _save_inventory_cache(self, index):
+        if not self.params['inventory_cache_ttl']:
+            return
+
+        path = self._inventory_cache_path()
+        if path is None:
+            return
+        tmp_path = None
+        try:
+            # mkstemp creates the file with 0600 permissions
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            f = os.fdopen(fd, 'w')
+            try:
+                json.dump(index, f)
+            finally:
+                f.close()
+            os.rename(tmp_path, path)
+        except (IOError, OSError):
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def invalidate_inventory_cache(self):
+        self.inventory = None
+        path = self._inventory_cache_path()
+        if path is None:
+            return
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
-        ''' Build a searchable index for vms+uuids+folders '''
+    def get_inventory(self, refresh=False):
 
-        if type(folder) == tuple:
-            folder = folder[1]
+        ''' Return the name/uuid/path index of all virtualmachines '''
 
-        if not 'names' in vmap:
-            vmap['names'] = {}
-        if not 'uuids' in vmap:
-            vmap['uuids'] = {}
-        if not 'paths' in vmap:
-            vmap['paths'] = {}
+        if self.inventory is not None and not refresh:
+            return self.inventory
 
-        if inpath == '/':
-            thispath = '/vm'
+        index = None
+        if not refresh:
+            index = self._load_inventory_cache()
+        self.inventory_cached = index is not None
+
+        if index is None:
+            index = build_inventory_index(self.content)
+            self._save_inventory_cache(index)
+
+        self.inventory = index
+        return index
+
+    def _folder_paths(self, folder):
+        if self.params['datacenter']:
+            datacenters = [self.params['datacenter']]
         else:
-            thispath = os.path.join(inpath, folder['name'])
-
-        for item in folder.items():
-            k = item[0]
-            v = item[1]
-            if k == 'name':
-                pass
-            elif k == 'subfolders':
-                for x in v.items():
-                    vmap = self._build_folder_map(x, vmap=vmap, inpath=thispath)
-            elif k == 'virtualmachines':
-                for x in v:
-                    if not x.config.name in vmap['names']:
-                        vmap['names'][x.config.name] = []
-                    vmap['names'][x.config.name].append(x.config.uuid)
-                    vmap['uuids'][x.config.uuid] = x.config.name
-                    if not thispath in vmap['paths']:
-                        vmap['paths'][thispath] = []
-                    vmap['paths'][thispath].append(x.config.uuid)
-
-        return vmap
-
-    def getfolders(self):
-
-        if not self.datacenter:
-            self.datacenter = get_obj(self.content, [vim.Datacenter], 
-                                       self.params['esxi']['datacenter'])
-        self.folders = self._build_folder_tree(self.datacenter.vmFolder)
-        self.folder_map = self._build_folder_map(self.folders)
-        return (self.folders, self.folder_map)
+            datacenters = self.get_inventory()['datacenters']
+        return ['%s/vm/%s' % (dc, folder.strip('/')) for dc in datacenters]
+
+    def _find_indexed_vms(self, name, folder=None):
+
+        ''' Resolve vms by name from the index '''
+
+        index = self.get_inventory()
+        paths = None
+        if folder:
+            paths = self._folder_paths(folder)
+
+        matches = []
+        for moid in index['names'].get(name, []):
+            if paths is not None and index['vms'][moid]['path'] not in paths:
+                continue
+            matches.append(vim.VirtualMachine(moid, self.si._stub))
+        return matches
+
+    def _verify_cached_vms(self, matches, name):
 
+        ''' Check vms resolved from a cached index against vCenter, False if any was renamed or removed '''
+
+        for vm in matches:
+            try:
+                if vm.name != name:
+                    return False
+            except vmodl.fault.ManagedObjectNotFound:
+                return False
+        return True
+
+    def _search_folder_vms(self, name, folder):
+        matches = []
+        for folder_path in self._folder_paths(folder):
+            fObj = self.si.content.searchIndex.FindByInventoryPath(folder_path)
+            if fObj is None:
+                continue
+            cObj = self.si.content.searchIndex.FindChild(fObj, name)
+            if type(cObj) == vim.VirtualMachine:
+                matches.append(cObj)
+        return matches
 
     def getvm(self, name=None, uuid=None, folder=None, name_match=None):
 
@@ -266,65 +345,31 @@ class PyVmomiHelper(object):
         # self.si.content.searchIndex.FindByInventoryPath('DC1/vm/test_folder')
 
         vm = None
-        folder_path = None
 
         if uuid:
             vm = self.si.content.searchIndex.FindByUuid(uuid=uuid, vmSearch=True)
-
-        elif folder:
-
-            matches = []
-            folder_paths = []
-
-            datacenter = None
-            if 'esxi' in self.params:
-                if 'datacenter' in self.params['esxi']:
-                    datacenter = self.params['esxi']['datacenter']
-
-            if datacenter:
-                folder_paths.append('%s/vm/%s' % (datacenter, folder))
+            return vm
+
+        matches = self._find_indexed_vms(name, folder)
+        if self.inventory_cached:
+            if folder and self.params['datacenter']:
+                # FindChild is a cheap live lookup and a folder holds unique names
+                matches = self._search_folder_vms(name, folder)
+            elif not matches or not self._verify_cached_vms(matches, name):
+                # the vm is newer than the cached index, or was renamed or removed since
+                self.get_inventory(refresh=True)
+                matches = self._find_indexed_vms(name, folder)
+
+        if len(matches) > 1 and not name_match:
+            if folder:
+                self.module.fail_json(msg='more than 1 vm exists by the name %s in folder %s. Please specify a uuid, a datacenter or name_match' \
+                                      % (name, folder))
+            self.module.fail_json(msg='more than 1 vm exists by the name %s. Please specify a uuid, or a folder, or a datacenter or name_match' % name)
+        elif matches:
+            if name_match == 'last':
+                vm = matches[-1]
             else:
-                # get a list of datacenters
-                datacenters = get_all_objs(self.content, [vim.Datacenter])
-                datacenters = [x.name for x in datacenters]
-                for dc in datacenters:
-                    folder_paths.append('%s/vm/%s' % (dc, folder))
-
-            for folder_path in folder_paths:
-                fObj = self.si.content.searchIndex.FindByInventoryPath(folder_path)
-                for cObj in fObj.childEntity:
-                    if not type(cObj) == vim.VirtualMachine:
-                        continue
-                    if cObj.name == name:
-                        matches.append(cObj)
-            if len(matches) > 1 and not name_match:
-                module.fail_json(msg='more than 1 vm exists by the name %s in folder %s. Please specify a uuid, a datacenter or name_match' \
-                                 % (folder, name))
-            elif len(matches) > 0:
                 vm = matches[0]
-        else:
-            vmList = get_all_objs(self.content, [vim.VirtualMachine])
-            if name_match:
-                if name_match == 'first':
-                    vm = get_obj(self.content, [vim.VirtualMachine], name)
-                elif name_match == 'last':
-                    matches = []
-                    vmList = get_all_objs(self.content, [vim.VirtualMachine])
-                    for thisvm in vmList:
-                        if thisvm.config.name == name:
-                            matches.append(thisvm)
-                    if matches:
-                        vm = matches[-1]
-            else:            
-                matches = []
-                vmList = get_all_objs(self.content, [vim.VirtualMachine])
-                for thisvm in vmList:
-                    if thisvm.config.name == name:
-                        matches.append(thisvm)
-                    if len(matches) > 1:
-                        module.fail_json(msg='more than 1 vm exists by the name %s. Please specify a uuid, or a folder, or a datacenter or name_match' % name)
-                    if matches:
-                        vm = matches[0]
 
         return vm
 
@@ -439,6 +484,7 @@ class PyVmomiHelper(object):
         if task.info.state == 'error':
             return ({'changed': False, 'failed': True, 'msg': task.info.error.msg})
         else:
+            self.invalidate_inventory_cache()
             return ({'changed': True, 'failed': False})
  
 
@@ -496,6 +542,7 @@ class PyVmomiHelper(object):
             return ({'changed': False, 'failed': True, 'msg': task.info.error.msg})
         else:
 
+            self.invalidate_inventory_cache()
             vm = task.info.result
             if wait_for_ip:
                 self.set_powerstate(vm, 'poweredon', force=False)
@@ -718,6 +765,79 @@ def get_all_objs(content, vimtype):
     return obj
 
 
+def build_inventory_index(content):
+    """
+    Index all virtual machines by name, uuid and inventory path
+    with a single PropertyCollector retrieval
+    """
+    view = content.viewManager.CreateContainerView(
+        content.rootFolder, [vim.VirtualMachine, vim.Folder, vim.Datacenter], True)
+    traversal = vmodl.query.PropertyCollector.TraversalSpec(
+        name='traverseEntities', path='view', skip=False, type=vim.view.ContainerView)
+    obj_spec = vmodl.query.PropertyCollector.ObjectSpec(
+        obj=view, skip=True, selectSet=[traversal])
+    prop_specs = [
+        vmodl.query.PropertyCollector.PropertySpec(
+            type=vim.VirtualMachine, pathSet=['name', 'parent', 'config.uuid']),
+        vmodl.query.PropertyCollector.PropertySpec(
+            type=vim.Folder, pathSet=['name', 'parent']),
+        vmodl.query.PropertyCollector.PropertySpec(
+            type=vim.Datacenter, pathSet=['name', 'parent']),
+    ]
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[obj_spec], propSet=prop_specs)
+    try:
+        results = content.propertyCollector.RetrieveContents([filter_spec])
+    finally:
+        view.Destroy()
+
+    nodes = {}
+    vms = []
+    folders = []
+    for result in results:
+        props = dict((p.name, p.val) for p in result.propSet)
+        moid = result.obj._moId
+        parent = props.get('parent')
+        nodes[moid] = {
+            'name': props.get('name'),
+            'parent': parent._moId if parent is not None else None,
+            'datacenter': type(result.obj) == vim.Datacenter,
+        }
+        if type(result.obj) == vim.VirtualMachine:
+            vms.append((moid, props.get('config.uuid')))
+        elif type(result.obj) == vim.Folder:
+            folders.append(moid)
+
+    index = {
+        'datacenters': sorted([x['name'] for x in nodes.values() if x['datacenter']]),
+        'folders': sorted([_inventory_path(nodes, x) for x in folders]),
+        'names': {},
+        'uuids': {},
+        'paths': {},
+        'vms': {},
+    }
+    for moid, uuid in vms:
+        name = nodes[moid]['name']
+        path = _inventory_path(nodes, nodes[moid]['parent'])
+        index['vms'][moid] = {'name': name, 'uuid': uuid, 'path': path}
+        index['names'].setdefault(name, []).append(moid)
+        index['paths'].setdefault(path, []).append(moid)
+        if uuid:
+            index['uuids'].setdefault(uuid, []).append(moid)
+
+    return index
+
+
+def _inventory_path(nodes, moid):
+    parts = []
+    while moid in nodes:
+        parts.append(nodes[moid]['name'])
+        if nodes[moid]['datacenter']:
+            break
+        moid = nodes[moid]['parent']
+    return '/'.join(reversed(parts))
+
+
 def _build_folder_tree(nodes, parent):
     tree = {}
 
@@ -801,7 +921,8 @@ def main():
             force=dict(required=False, type='bool', default=False),
             datacenter=dict(required=False, type='str', default=None),
             esxi_hostname=dict(required=False, type='str', default=None),
-            wait_for_ip_address=dict(required=False, type='bool', default=True)
+            wait_for_ip_address=dict(required=False, type='bool', default=True),
+            inventory_cache_ttl=dict(required=False, type='int', default=60)
         ),
         supports_check_mode=True,
         mutually_exclusive=[],
@@ -42,7 +42,8 @@ options:
   src:
     description:
       - The file to push to vCenter
-    required: true
+      - Required unless C(files) is given.
+    required: false
   datacenter:
     description:
       - The datacenter on the vCenter server that holds the datastore.
@@ -54,7 +55,47 @@ options:
   path:
     description:
       - The file to push to the datastore on the vCenter server.
-    required: true
+      - Required unless C(files) is given.
+    required: false
+    aliases: ['dest']
+  files:
+    description:
+      - A list of dicts with C(src) and C(dest) keys to upload concurrently to the same datastore.
+      - Mutually exclusive with C(src) and C(path).
+    required: false
+    default: null
+    version_added: "2.2"
+  concurrency:
+    description:
+      - The number of uploads to run at the same time when C(files) is given.
+    required: false
+    default: 4
+    version_added: "2.2"
+  compare:
+    description:
+      - How to decide whether a file already on the datastore is identical and can be skipped.
+      - C(none) always uploads, C(size) compares the local size with the remote Content-Length,
+        C(checksum) additionally compares the SHA1 of the local file with a C(.sha1) file
+        stored next to the remote file on a previous upload.
+      - With C(checksum), every uploaded file leaves a C(<dest>.sha1) file on the datastore, which
+        this module never removes.
+    required: false
+    default: 'none'
+    choices: ['none', 'size', 'checksum']
+    version_added: "2.2"
+  retries:
+    description:
+      - The number of times to retry an upload when vSphere resets the connection.
+      - The datastore interface does not support partial uploads, so a retried upload starts from the beginning of the file.
+    required: false
+    default: 3
+    version_added: "2.2"
+  retry_delay:
+    description:
+      - The number of seconds to wait before the first retry, increased linearly for further retries.
+    required: false
+    default: 5
+    version_added: "2.2"
   validate_certs:
     description:
       - If C(no), SSL certificates will not be validated. This should only be
@@ -74,13 +115,53 @@ EXAMPLES = '''
   transport: local
 - vsphere_copy: host=vhost login=vuser password=vpass src=/other/local/file datacenter='DC2 Someplace' datastore=datastore2 path=other/remote/file
   delegate_to: other_system
+- vsphere_copy:
+    host: vhost
+    login: vuser
+    password: vpass
+    datacenter: DC1 Someplace
+    datastore: datastore1
+    compare: checksum
+    concurrency: 2
+    files:
+      - src: /isos/centos7.iso
+        dest: isos/centos7.iso
+      - src: /ovas/appliance.ova
+        dest: ovas/appliance.ova
+  transport: local
 '''
 
-import atexit
+RETURN = '''
+size:
+    description: size of the uploaded file in bytes
+    returned: success
+    type: int
+    sample: 4393533440
+elapsed:
+    description: seconds spent uploading
+    returned: success
+    type: float
+    sample: 38.52
+throughput:
+    description: upload throughput in bytes per second
+    returned: success
+    type: int
+    sample: 114058396
+results:
+    description: the result of every upload when C(files) is given
+    returned: when files is given
+    type: list
+    sample: [{"src": "/isos/centos7.iso", "dest": "isos/centos7.iso", "changed": false, "size": 4393533440}]
+'''
+
+import os
+import time
 import urllib
+import urllib2
 import mmap
 import errno
 import socket
+from multiprocessing.pool import ThreadPool
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.pycompat24 import get_exception
@@ -100,78 +181,190 @@ def vmware_path(datastore, datacenter, path):
     params = urllib.urlencode(params)
     return "%s?%s" % (path, params)
 
-def main():
+def datastore_url(module, path):
+    params = module.params
+    return 'https://%s%s' % (params['host'], vmware_path(params['datastore'], params['datacenter'], path))
 
-    module = AnsibleModule(
-        argument_spec = dict(
-            host = dict(required=True, aliases=[ 'hostname' ]),
-            login = dict(required=True, aliases=[ 'username' ]),
-            password = dict(required=True, no_log=True),
-            src = dict(required=True, aliases=[ 'name' ]),
-            datacenter = dict(required=True),
-            datastore = dict(required=True),
-            dest = dict(required=True, aliases=[ 'path' ]),
-            validate_certs = dict(required=False, default=True, type='bool'),
-        ),
-        # Implementing check-mode using HEAD is impossible, since size/date is not 100% reliable
-        supports_check_mode = False,
-    )
+def datastore_request(module, url, data=None, headers=None, method='GET'):
+    ''' Issue a request against the datastore, returns None if the file does not exist '''
+    try:
+        return open_url(url, data=data, headers=headers, method=method,
+                url_username=module.params['login'], url_password=module.params['password'],
+                validate_certs=module.params['validate_certs'], force_basic_auth=True)
+    except urllib2.HTTPError:
+        e = get_exception()
+        if e.code == 404:
+            return None
+        raise
+
+def is_uptodate(module, dest, size, checksum):
+    ''' Compare the size and optionally the checksum of the datastore copy '''
+    if module.params['compare'] == 'none':
+        return False
 
-    host = module.params.get('host')
-    login = module.params.get('login')
-    password = module.params.get('password')
-    src = module.params.get('src')
-    datacenter = module.params.get('datacenter')
-    datastore = module.params.get('datastore')
-    dest = module.params.get('dest')
-    validate_certs = module.params.get('validate_certs')
+    r = datastore_request(module, datastore_url(module, dest), method='HEAD')
+    if r is None:
+        return False
+    length = r.headers.get('content-length', None)
+    if length is None or int(length) != size:
+        return False
+    if checksum is None:
+        return True
 
+    r = datastore_request(module, datastore_url(module, dest + '.sha1'))
+    if r is None:
+        return False
+    return r.read().strip() == checksum
+
+def upload(module, src, url):
+    ''' PUT a file on the datastore, retrying when vSphere resets the connection '''
     fd = open(src, "rb")
-    atexit.register(fd.close)
+    data = ''
+    size = 0
+    try:
+        size = os.fstat(fd.fileno()).st_size
+        if size:
+            data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
 
-    data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
-    atexit.register(data.close)
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(size),
+        }
 
-    remote_path = vmware_path(datastore, datacenter, dest)
-    url = 'https://%s%s' % (host, remote_path)
+        attempt = 0
+        while True:
+            if size:
+                data.seek(0)
+            try:
+                return datastore_request(module, url, data=data, headers=headers, method='PUT')
+            except socket.error:
+                e = get_exception()
+                if e.args and e.args[0] == errno.ECONNRESET and attempt < module.params['retries']:
+                    attempt += 1
+                    time.sleep(module.params['retry_delay'] * attempt)
+                    continue
+                raise
+    finally:
+        if size:
+            data.close()
+        fd.close()
 
-    headers = {
-        "Content-Type": "application/octet-stream",
-        "Content-Length": str(len(data)),
-    }
+def copy_file(module, src, dest):
+    ''' Upload a single file, returns a result dict instead of exiting so it can run in a thread '''
+    url = datastore_url(module, dest)
+    result = dict(src=src, dest=dest, url=url, changed=False)
 
     try:
-        r = open_url(url, data=data, headers=headers, method='PUT',
-                url_username=login, url_password=password, validate_certs=validate_certs,
-                force_basic_auth=True)
+        size = os.path.getsize(src)
+        checksum = None
+        if module.params['compare'] == 'checksum':
+            checksum = module.sha1(src)
+        result.update(size=size)
+
+        if is_uptodate(module, dest, size, checksum):
+            return result
+
+        start = time.time()
+        r = upload(module, src, url)
+        elapsed = time.time() - start
     except socket.error:
         e = get_exception()
         if isinstance(e.args, tuple) and e[0] == errno.ECONNRESET:
             # VSphere resets connection if the file is in use and cannot be replaced
-            module.fail_json(msg='Failed to upload, image probably in use', status=None, errno=e[0], reason=str(e), url=url)
+            result.update(failed=True, msg='Failed to upload, image probably in use', status=None, errno=e[0], reason=str(e))
         else:
-            module.fail_json(msg=str(e), status=None, errno=e[0], reason=str(e), url=url)
+            result.update(failed=True, msg=str(e), status=None, errno=e[0], reason=str(e))
+        return result
     except Exception:
         e = get_exception()
         error_code = -1
         try:
             if isinstance(e[0], int):
                 error_code = e[0]
-        except KeyError:
+        except (KeyError, IndexError, TypeError):
             pass
-        module.fail_json(msg=str(e), status=None, errno=error_code, reason=str(e), url=url)
+        result.update(failed=True, msg=str(e), status=None, errno=error_code, reason=str(e))
+        return result
 
     status = r.getcode()
-    if 200 <= status < 300:
-        module.exit_json(changed=True, status=status, reason=r.msg, url=url)
-    else:
+    if not 200 <= status < 300:
         length = r.headers.get('content-length', None)
         if r.headers.get('transfer-encoding', '').lower() == 'chunked':
             chunked = 1
         else:
             chunked = 0
+        result.update(failed=True, msg='Failed to upload', errno=None, status=status, reason=r.msg, length=length, headers=dict(r.headers), chunked=chunked)
+        return result
+
+    if checksum is not None:
+        try:
+            datastore_request(module, datastore_url(module, dest + '.sha1'), data=checksum,
+                    headers={"Content-Type": "text/plain"}, method='PUT')
+        except Exception:
+            e = get_exception()
+            result.update(failed=True, msg='Uploaded file but failed to store checksum: %s' % str(e), status=None, errno=None, reason=str(e))
+            return result
+
+    result.update(changed=True, status=status, reason=r.msg, elapsed=round(elapsed, 3))
+    if elapsed > 0:
+        result['throughput'] = int(size / elapsed)
+    return result
+
+def main():
+
+    module = AnsibleModule(
+        argument_spec = dict(
+            host = dict(required=True, aliases=[ 'hostname' ]),
+            login = dict(required=True, aliases=[ 'username' ]),
+            password = dict(required=True, no_log=True),
+            src = dict(required=False, aliases=[ 'name' ]),
+            datacenter = dict(required=True),
+            datastore = dict(required=True),
+            dest = dict(required=False, aliases=[ 'path' ]),
+            files = dict(required=False, type='list'),
+            concurrency = dict(required=False, default=4, type='int'),
+            compare = dict(required=False, default='none', choices=['none', 'size', 'checksum']),
+            retries = dict(required=False, default=3, type='int'),
+            retry_delay = dict(required=False, default=5, type='int'),
+            validate_certs = dict(required=False, default=True, type='bool'),
+        ),
+        mutually_exclusive = [ ['files', 'src'], ['files', 'dest'] ],
+        required_one_of = [ ['files', 'src'] ],
+        required_together = [ ['src', 'dest'] ],
+        # Implementing check-mode using HEAD is impossible, since size/date is not 100% reliable
+        supports_check_mode = False,
+    )
+
+    files = module.params.get('files')
+
+    if not files:
+        result = copy_file(module, module.params.get('src'), module.params.get('dest'))
+        if result.get('failed'):
+            module.fail_json(**result)
+        module.exit_json(**result)
+
+    for f in files:
+        if not isinstance(f, dict) or not f.get('src') or not f.get('dest'):
+            module.fail_json(msg='Every entry in files needs a src and a dest, got %s' % f)
+
+    start = time.time()
+    pool = ThreadPool(max(1, min(module.params.get('concurrency'), len(files))))
+    try:
+        results = pool.map(lambda f: copy_file(module, f['src'], f['dest']), files)
+    finally:
+        pool.close()
+    elapsed = time.time() - start
+
+    uploaded = sum([r['size'] for r in results if r['changed']])
+    changed = any([r['changed'] for r in results])
+    failed = [r for r in results if r.get('failed')]
+    result = dict(changed=changed, results=results, size=uploaded, elapsed=round(elapsed, 3))
+    if elapsed > 0:
+        result['throughput'] = int(uploaded / elapsed)
 
-        module.fail_json(msg='Failed to upload', errno=None, status=status, reason=r.msg, length=length, headers=dict(r.headers), chunked=chunked, url=url)
+    if failed:
+        module.fail_json(msg='Failed to upload %d of %d files' % (len(failed), len(files)), **result)
+    module.exit_json(**result)
 
 if __name__ == '__main__':
     main()
@@ -25,9 +25,31 @@ description:
 author:
     - Andy Hill (@andyhky)
     - Tim Rupp
+options:
+  gather_subset:
+    description:
+      - The record types to gather, C(all) gathers every type.
+      - All types are fetched in a single XAPI multicall round trip.
+    required: false
+    default: ['all']
+    choices: ['all', 'networks', 'pifs', 'vlans', 'vms', 'srs']
+    version_added: "2.2"
+  vm_names:
+    description:
+      - Only gather the VMs with these name labels, filtered by XAPI on the server side.
+    required: false
+    default: null
+    version_added: "2.2"
+  sr_names:
+    description:
+      - Only gather the SRs with these name labels, filtered by XAPI on the server side.
+    required: false
+    default: null
+    version_added: "2.2"
 '''
 
 import platform
+import xmlrpclib
 import XenAPI
 
 EXAMPLES = '''
@@ -39,6 +61,15 @@ EXAMPLES = '''
   with_items: xs_vms.keys()
   when: xs_vms[item]['power_state'] == "Running"
 
+- name: Gather only two VMs and the networks
+  xenserver_facts:
+    gather_subset:
+      - vms
+      - networks
+    vm_names:
+      - web01
+      - db01
+
 TASK: [Print running VMs] ***********************************************************
 skipping: [10.13.0.22] => (item=CentOS 4.7 (32-bit))
 ok: [10.13.0.22] => (item=Control domain on host: 10.0.13.22) => {
@@ -79,21 +110,57 @@ def get_xenapi_session():
     return session
 
 
-def get_networks(session):
-    recs = session.xenapi.network.get_all_records()
-    xs_networks = {}
-    networks = change_keys(recs, key='uuid')
-    for network in networks.itervalues():
-        xs_networks[network['name_label']] = network
-    return xs_networks
+# XenAPI class behind every gather_subset, in the order they are fetched
+XS_SUBSETS = [
+    ('networks', 'network'),
+    ('pifs', 'PIF'),
+    ('vlans', 'VLAN'),
+    ('vms', 'VM'),
+    ('srs', 'SR'),
+]
+
+
+def name_label_filter(names):
+    """Build a get_all_records_where expression matching any of names"""
+    if not names:
+        return 'true'
+    return ' or '.join(['field "name__label" = "%s"' % name.replace('"', '\\"')
+                        for name in names])
+
+
+def xapi_multicall(session, calls):
+    """
+    Run several (method, params) XenAPI calls in one system.multicall
+    round trip, falling back to one request per call if xapi refuses it.
+    """
+    try:
+        results = session.system.multicall([
+            {'methodName': method, 'params': [session.handle] + list(params)}
+            for method, params in calls
+        ])
+    except xmlrpclib.Fault:
+        return [session.xenapi_request(method, tuple(params)) for method, params in calls]
+
+    values = []
+    for result in results:
+        if isinstance(result, dict):
+            raise XenAPI.Failure([result.get('faultCode'), result.get('faultString')])
+        result = result[0]
+        if result['Status'] != 'Success':
+            raise XenAPI.Failure(result['ErrorDescription'])
+        values.append(result['Value'])
+    return values
 
 
-def get_pifs(session):
-    recs = session.xenapi.PIF.get_all_records()
-    pifs = change_keys(recs, key='uuid')
+def get_networks(recs):
+    return change_keys(recs, key='name_label')
+
+
+def get_pifs(recs):
     xs_pifs = {}
     devicenums = range(0, 7)
-    for pif in pifs.itervalues():
+    for ref, pif in recs.iteritems():
+        pif['ref'] = ref
         for eth in devicenums:
             interface_name = "eth%s" % (eth)
             bond_name = interface_name.replace('eth', 'bond')
@@ -104,8 +171,7 @@ def get_pifs(session):
     return xs_pifs
 
 
-def get_vlans(session):
-    recs = session.xenapi.VLAN.get_all_records()
+def get_vlans(recs):
     return change_keys(recs, key='tag')
 
 
@@ -113,7 +179,8 @@ def change_keys(recs, key='uuid', filter_func=None):
     """
     Take a xapi dict, and make the keys the value of recs[ref][key].
 
-    Preserves the ref in rec['ref']
+    Preserves the ref in rec['ref']. The records are indexed in place,
+    not copied.
 
     """
     new_recs = {}
@@ -122,8 +189,8 @@ def change_keys(recs, key='uuid', filter_func=None):
         if filter_func is not None and not filter_func(rec):
             continue
 
+        rec['ref'] = ref
         new_recs[rec[key]] = rec
-        new_recs[rec[key]]['ref'] = ref
 
     return new_recs
 
@@ -133,30 +200,35 @@ def get_host(session):
     # We only have one host, so just return its entry
     return session.xenapi.host.get_record(host_recs[0])
 
-def get_vms(session):
-    xs_vms = {}
-    recs = session.xenapi.VM.get_all()
+def get_vms(recs):
     if not recs:
         return None
+    return change_keys(recs, key='name_label')
 
-    vms = change_keys(recs, key='uuid')
-    for vm in vms.itervalues():
-       xs_vms[vm['name_label']] = vm
-    return xs_vms
 
-
-def get_srs(session):
-    xs_srs = {}
-    recs = session.xenapi.SR.get_all()
+def get_srs(recs):
     if not recs:
         return None
-    srs = change_keys(recs, key='uuid')
-    for sr in srs.itervalues():
-       xs_srs[sr['name_label']] = sr
-    return xs_srs
+    return change_keys(recs, key='name_label')
 
 def main():
-    module = AnsibleModule({})
+    module = AnsibleModule(
+        argument_spec=dict(
+            gather_subset=dict(type='list', default=['all']),
+            vm_names=dict(type='list'),
+            sr_names=dict(type='list'),
+        ),
+        supports_check_mode=True,
+    )
+
+    valid_subsets = ['all'] + [name for name, cls in XS_SUBSETS]
+    gather_subset = module.params['gather_subset']
+    for subset in gather_subset:
+        if subset not in valid_subsets:
+            module.fail_json(msg='gather_subset must be one of %s, got %s'
+                             % (', '.join(valid_subsets), subset))
+    if 'all' in gather_subset:
+        gather_subset = valid_subsets
 
     obj = XenServerFacts()
     try:
@@ -169,11 +241,25 @@ def main():
         'xenserver_codename': obj.codename
     }
 
-    xs_networks = get_networks(session)
-    xs_pifs = get_pifs(session)
-    xs_vlans = get_vlans(session)
-    xs_vms = get_vms(session)
-    xs_srs = get_srs(session)
+    filters = {
+        'vms': name_label_filter(module.params['vm_names']),
+        'srs': name_label_filter(module.params['sr_names']),
+    }
+    subsets = [(name, cls) for name, cls in XS_SUBSETS if name in gather_subset]
+    try:
+        recs = xapi_multicall(session, [
+            ('%s.get_all_records_where' % cls, [filters.get(name, 'true')])
+            for name, cls in subsets
+        ])
+    except XenAPI.Failure, e:
+        module.fail_json(msg='%s' % e)
+    recs = dict(zip([name for name, cls in subsets], recs))
+
+    xs_networks = get_networks(recs.get('networks', {}))
+    xs_pifs = get_pifs(recs.get('pifs', {}))
+    xs_vlans = get_vlans(recs.get('vlans', {}))
+    xs_vms = get_vms(recs.get('vms', {}))
+    xs_srs = get_srs(recs.get('srs', {}))
 
     if xs_vlans:
         data['xs_vlans'] = xs_vlans
@@ -27,6 +27,9 @@ except ImportError:
         # Let snippet from module_utils/basic.py return a proper error in this case
         pass
 import urllib
+import time
+import random
+from multiprocessing.pool import ThreadPool
 
 DOCUMENTATION = '''
 ---
@@ -47,10 +50,30 @@ options:
     description:
       - "Account email."
     required: true
+  concurrency:
+    description:
+      - The number of API calls to run at the same time, used to fetch the remaining pages of a listing once the number of pages is known.
+    required: false
+    default: 4
+    version_added: "2.2"
+  per_page:
+    description:
+      - The number of DNS records to request per page when listing the records of a zone, between 5 and 100.
+      - Other listings, such as the zone lookup, keep the Cloudflare default page size.
+    required: false
+    default: 100
+    version_added: "2.2"
   port:
     description: Service port. Required for C(type=SRV)
     required: false
     default: null
+  purge:
+    description:
+      - Only used with C(records) and C(state=present). Delete every record of the zone with one of the
+        types this module manages that is not listed in C(records).
+    required: false
+    default: false
+    version_added: "2.2"
   priority:
     description: Record priority. Required for C(type=MX) and C(type=SRV)
     required: false
@@ -66,6 +89,17 @@ options:
     required: false
     default: "@"
     aliases: [ "name" ]
+  records:
+    description:
+      - A list of records to reconcile in one task, each a dict with the C(type), C(record), C(value), C(ttl),
+        C(priority), C(port), C(proto), C(service) and C(weight) keys of the single record options.
+        Missing keys default to the module options.
+      - The zone is listed once, the differences are computed locally and the resulting changes run
+        C(concurrency) at a time, backing off when Cloudflare rate limits the account.
+      - Mutually exclusive with C(type), C(value) and C(solo).
+    required: false
+    default: null
+    version_added: "2.2"
   service:
     description: Record service. Required for C(type=SRV)
     required: false
@@ -166,6 +200,23 @@ EXAMPLES = '''
     account_email: test@example.com
     account_api_token: dummyapitoken
 
+# make sure a set of records exist and remove all other records of the zone
+- cloudflare_dns:
+    zone: my.com
+    purge: true
+    records:
+      - record: www
+        type: A
+        value: 127.0.0.1
+      - record: mail
+        type: MX
+        value: mx.my.com
+        priority: 10
+      - type: TXT
+        value: v=spf1 mx -all
+    account_email: test@example.com
+    account_api_token: dummyapitoken
+
 # create a SRV record _foo._tcp.my.com
 - cloudflare_dns:
     domain: my.com
@@ -179,6 +230,11 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+changes:
+    description: the changes made to the zone when C(records) is given
+    returned: success, when records is given
+    type: list
+    sample: [{"action": "create", "type": "A", "name": "www.my.com", "content": "127.0.0.1"}]
 record:
     description: dictionary containing the record data
     returned: success, except on record deletion
@@ -269,6 +325,16 @@ record:
             sample: sample.com
 '''
 
+# Record types this module manages, other types are never purged
+CF_RECORD_TYPES = [ 'A', 'AAAA', 'CNAME', 'TXT', 'SRV', 'MX', 'NS', 'SPF' ]
+
+# Backoff for API calls rejected with HTTP 429
+CF_RATE_LIMIT_RETRIES = 5
+CF_RATE_LIMIT_MAX_DELAY = 60
+
+class CloudflareAPIError(Exception):
+    pass
+
 class CloudflareAPI(object):
 
     cf_api_endpoint = 'https://api.cloudflare.com/client/v4'
@@ -278,10 +344,14 @@ class CloudflareAPI(object):
         self.module            = module
         self.account_api_token = module.params['account_api_token']
         self.account_email     = module.params['account_email']
+        self.concurrency       = module.params['concurrency']
+        self.per_page          = module.params['per_page']
         self.port              = module.params['port']
         self.priority          = module.params['priority']
         self.proto             = module.params['proto']
+        self.purge             = module.params['purge']
         self.record            = module.params['record']
+        self.records           = module.params['records']
         self.service           = module.params['service']
         self.is_solo           = module.params['solo']
         self.state             = module.params['state']
@@ -291,6 +361,7 @@ class CloudflareAPI(object):
         self.value             = module.params['value']
         self.weight            = module.params['weight']
         self.zone              = module.params['zone']
+        self.zone_ids          = {}
 
         if self.record == '@':
             self.record = self.zone
@@ -308,6 +379,14 @@ class CloudflareAPI(object):
             self.record = self.record + '.' + self.zone
 
     def _cf_simple_api_call(self,api_call,method='GET',payload=None):
+        try:
+            return self._cf_request(api_call,method,payload)
+        except CloudflareAPIError, e:
+            self.module.fail_json(msg=str(e))
+
+    def _cf_request(self,api_call,method='GET',payload=None):
+        # raises CloudflareAPIError instead of calling fail_json so it
+        # can be used from worker threads
         headers = { 'X-Auth-Email': self.account_email,
                     'X-Auth-Key': self.account_api_token,
                     'Content-Type': 'application/json' }
@@ -316,17 +395,26 @@ class CloudflareAPI(object):
             try:
                 data = json.dumps(payload)
             except Exception, e:
-                self.module.fail_json(msg="Failed to encode payload as JSON: {0}".format(e))
-
-        resp, info = fetch_url(self.module,
-                               self.cf_api_endpoint + api_call,
-                               headers=headers,
-                               data=data,
-                               method=method,
-                               timeout=self.timeout)
+                raise CloudflareAPIError("Failed to encode payload as JSON: {0}".format(e))
+
+        for attempt in range(CF_RATE_LIMIT_RETRIES + 1):
+            resp, info = fetch_url(self.module,
+                                   self.cf_api_endpoint + api_call,
+                                   headers=headers,
+                                   data=data,
+                                   method=method,
+                                   timeout=self.timeout)
+            if info['status'] != 429 or attempt == CF_RATE_LIMIT_RETRIES:
+                break
+            # rate limited, honour Retry-After or back off exponentially
+            try:
+                delay = int(info.get('retry-after'))
+            except (TypeError, ValueError):
+                delay = 2 ** attempt + random.random()
+            time.sleep(min(delay,CF_RATE_LIMIT_MAX_DELAY))
 
         if info['status'] not in [200,304,400,401,403,429,405,415]:
-            self.module.fail_json(msg="Failed API call {0}; got unexpected HTTP code {1}".format(api_call,info['status']))
+            raise CloudflareAPIError("Failed API call {0}; got unexpected HTTP code {1}".format(api_call,info['status']))
 
         error_msg = ''
         if info['status'] == 401:
@@ -349,6 +437,7 @@ class CloudflareAPI(object):
             error_msg = "API bad request; Status: {0}; Method: {1}: Call: {2}".format(info['status'],method,api_call)
 
         result = None
+        content = None
         try:
             content = resp.read()
         except AttributeError:
@@ -365,7 +454,7 @@ class CloudflareAPI(object):
 
         # received an error status but no data with details on what failed
         if  (info['status'] not in [200,304]) and (result is None):
-            self.module.fail_json(msg=error_msg)
+            raise CloudflareAPIError(error_msg)
 
         if not result['success']:
             error_msg += "; Error details: "
@@ -374,11 +463,36 @@ class CloudflareAPI(object):
                 if 'error_chain' in error:
                     for chain_error in error['error_chain']:
                         error_msg += "code: {0}, error: {1}; ".format(chain_error['code'],chain_error['message'])
-            self.module.fail_json(msg=error_msg)
+            raise CloudflareAPIError(error_msg)
 
         return result, info['status']
 
+    def _page_api_call(self,api_call,page):
+        # replace any "page" parameter of the original call, the page size
+        # limits differ per endpoint so only record listings get per_page
+        if '?' in api_call:
+            raw_api_call,query = api_call.split('?',1)
+            parameters = [param for param in query.split('&') if param and not param.startswith('page=')]
+        else:
+            raw_api_call = api_call
+            parameters = []
+        if raw_api_call.endswith('/dns_records'):
+            parameters = [param for param in parameters if not param.startswith('per_page=')]
+            parameters.append('per_page={0}'.format(self.per_page))
+        parameters.append('page={0}'.format(page))
+        return raw_api_call + '?' + '&'.join(parameters)
+
+    def _cf_page(self,args):
+        api_call,method,payload = args
+        try:
+            result, status = self._cf_request(api_call,method,payload)
+            return result['result'], None
+        except Exception, e:
+            return None, e
+
     def _cf_api_call(self,api_call,method='GET',payload=None):
+        if method == 'GET':
+            api_call = self._page_api_call(api_call,1)
         result, status = self._cf_simple_api_call(api_call,method,payload)
 
         data = result['result']
@@ -386,19 +500,19 @@ class CloudflareAPI(object):
         if 'result_info' in result:
             pagination = result['result_info']
             if pagination['total_pages'] > 1:
-                next_page = int(pagination['page']) + 1
-                parameters = ['page={0}'.format(next_page)]
-                # strip "page" parameter from call parameters (if there are any)
-                if '?' in api_call:
-                    raw_api_call,query = api_call.split('?',1)
-                    parameters += [param for param in query.split('&') if not param.startswith('page')]
-                else:
-                    raw_api_call = api_call
-                while next_page <= pagination['total_pages']:
-                    raw_api_call += '?' + '&'.join(parameters)
-                    result, status = self._cf_simple_api_call(raw_api_call,method,payload)
-                    data += result['result']
-                    next_page += 1
+                # the number of pages is known after the first one, fetch
+                # the others concurrently and keep them in page order
+                calls = [(self._page_api_call(api_call,page),method,payload)
+                         for page in range(int(pagination['page']) + 1,pagination['total_pages'] + 1)]
+                pool = ThreadPool(max(1,min(self.concurrency,len(calls))))
+                try:
+                    pages = pool.map(self._cf_page,calls)
+                finally:
+                    pool.close()
+                for page_data, error in pages:
+                    if error is not None:
+                        self.module.fail_json(msg=str(error))
+                    data += page_data
 
         return data, status
 
@@ -406,6 +520,9 @@ class CloudflareAPI(object):
         if not zone:
             zone = self.zone
 
+        if zone in self.zone_ids:
+            return self.zone_ids[zone]
+
         zones = self.get_zones(zone)
         if len(zones) > 1:
             self.module.fail_json(msg="More than one zone matches {0}".format(zone))
@@ -413,7 +530,8 @@ class CloudflareAPI(object):
         if len(zones) < 1:
             self.module.fail_json(msg="No zone found with name {0}".format(zone))
 
-        return zones[0]['id']
+        self.zone_ids[zone] = zones[0]['id']
+        return self.zone_ids[zone]
 
     def get_zones(self,name=None):
         if not name:
@@ -436,7 +554,7 @@ class CloudflareAPI(object):
         if (not value) and (value is not None):
             value = self.value
 
-        zone_id = self._get_zone_id()
+        zone_id = self._get_zone_id(zone_name)
         api_call = '/zones/{0}/dns_records'.format(zone_id)
         query = {}
         if type:
@@ -484,14 +602,14 @@ class CloudflareAPI(object):
                     result, info = self._cf_api_call('/zones/{0}/dns_records/{1}'.format(rr['zone_id'],rr['id']),'DELETE')
         return self.changed
 
-    def ensure_dns_record(self,**kwargs):
-        params = {}
-        for param in ['port','priority','proto','service','ttl','type','record','value','weight','zone']:
-          if param in kwargs:
-              params[param] = kwargs[param]
-          else:
-              params[param] = getattr(self,param)
+    def _new_record(self,params):
+        """
+        Validate params and build the payload of the record they describe.
 
+        Returns the payload along with the name and content to search
+        existing records for, the content is None for records that can
+        only exist once per name.
+        """
         search_value = params['value']
         search_record = params['record']
         new_record = None
@@ -545,6 +663,30 @@ class CloudflareAPI(object):
             search_value = str(params['weight']) + '\t' + str(params['port']) + '\t' + params['value']
             search_record = params['service'] + '.' + params['proto'] + '.' + params['record']
 
+        return new_record, search_record, search_value
+
+    def _needs_update(self,params,cur_record,new_record):
+        if (params['ttl'] is not None) and (cur_record['ttl'] != params['ttl'] ):
+            return True
+        if (params['priority'] is not None) and ('priority' in cur_record) and (cur_record['priority'] != params['priority']):
+            return True
+        if ('data' in new_record) and ('data' in cur_record):
+            if (cur_record['data'] > new_record['data']) - (cur_record['data'] < new_record['data']):
+                return True
+        if (params['type'] == 'CNAME') and (cur_record['content'] != new_record['content']):
+            return True
+        return False
+
+    def ensure_dns_record(self,**kwargs):
+        params = {}
+        for param in ['port','priority','proto','service','ttl','type','record','value','weight','zone']:
+          if param in kwargs:
+              params[param] = kwargs[param]
+          else:
+              params[param] = getattr(self,param)
+
+        new_record, search_record, search_value = self._new_record(params)
+
         zone_id = self._get_zone_id(params['zone'])
         records = self.get_dns_records(params['zone'],params['type'],search_record,search_value)
         # in theory this should be impossible as cloudflare does not allow
@@ -553,18 +695,7 @@ class CloudflareAPI(object):
             self.module.fail_json(msg="More than one record already exists for the given attributes. That should be impossible, please open an issue!")
         # record already exists, check if it must be updated
         if len(records) == 1:
-            cur_record = records[0]
-            do_update = False
-            if (params['ttl'] is not None) and (cur_record['ttl'] != params['ttl'] ):
-                do_update = True
-            if (params['priority'] is not None) and ('priority' in cur_record) and (cur_record['priority'] != params['priority']):
-                do_update = True
-            if ('data' in new_record) and ('data' in cur_record):
-                if (cur_record['data'] > new_record['data']) - (cur_record['data'] < new_record['data']):
-                    do_update = True
-            if (type == 'CNAME') and (cur_record['content'] != new_record['content']):
-                do_update = True
-            if do_update:
+            if self._needs_update(params,records[0],new_record):
                 if not self.module.check_mode:
                     result, info = self._cf_api_call('/zones/{0}/dns_records/{1}'.format(zone_id,records[0]['id']),'PUT',new_record)
                 self.changed = True
@@ -576,28 +707,154 @@ class CloudflareAPI(object):
         self.changed = True
         return result,self.changed
 
+    def _record_params(self,item):
+        """Fill a C(records) entry from the module options and normalize it like __init__ does"""
+        if not isinstance(item,dict):
+            self.module.fail_json(msg="Every entry in records must be a dict, got {0}".format(item))
+        params = {'zone': self.zone}
+        for param in ['port','priority','proto','service','ttl','weight']:
+            params[param] = item.get(param,getattr(self,param))
+        params['type'] = item.get('type')
+        params['record'] = item.get('record',item.get('name','@'))
+        params['value'] = item.get('value',item.get('content'))
+
+        if params['type'] not in CF_RECORD_TYPES:
+            self.module.fail_json(msg="Every entry in records needs a type out of {0}, got {1}".format(', '.join(CF_RECORD_TYPES),item))
+        if params['record'] == '@':
+            params['record'] = self.zone
+        if (params['type'] in ['CNAME','NS','MX','SRV']) and (params['value'] is not None):
+            params['value'] = params['value'].rstrip('.')
+        if params['type'] == 'SRV':
+            if (params['proto'] is not None) and (not params['proto'].startswith('_')):
+                params['proto'] = '_' + params['proto']
+            if (params['service'] is not None) and (not params['service'].startswith('_')):
+                params['service'] = '_' + params['service']
+        if not params['record'].endswith(self.zone):
+            params['record'] = params['record'] + '.' + self.zone
+        return params
+
+    def _apply_change(self,change):
+        try:
+            self._cf_request(change['api_call'],change['method'],change['payload'])
+            return None
+        except Exception, e:
+            return "{0} {1} {2}: {3}".format(change['action'],change['type'],change['name'],e)
+
+    def ensure_dns_records(self):
+        """
+        Reconcile the C(records) list with the zone.
+
+        The zone is listed once and indexed by (type, name, content), the
+        resulting deletes run concurrently first, then the creates and
+        updates.
+        """
+        zone_id = self._get_zone_id()
+        existing,status = self._cf_api_call('/zones/{0}/dns_records'.format(zone_id))
+
+        index = {}
+        by_name = {}
+        for rr in existing:
+            index[(rr['type'],rr['name'].lower(),rr['content'])] = rr
+            by_name.setdefault((rr['type'],rr['name'].lower()),[]).append(rr)
+
+        records_call = '/zones/{0}/dns_records'.format(zone_id)
+        changes = []
+        wanted = set()
+
+        def add_change(action,method,api_call,payload,rr_type,name,content):
+            changes.append({'action': action, 'method': method, 'api_call': api_call, 'payload': payload,
+                            'type': rr_type, 'name': name, 'content': content})
+
+        for item in self.records:
+            params = self._record_params(item)
+            if self.state == 'absent':
+                name = params['record']
+                content = params['value']
+                if params['type'] == 'SRV':
+                    if params['service'] is None or params['proto'] is None:
+                        self.module.fail_json(msg="SRV entries in records need a service and a proto to be deleted, got {0}".format(item))
+                    name = params['service'] + '.' + params['proto'] + '.' + params['record']
+                    if params['value']:
+                        # without a value every SRV record for this name is deleted
+                        content = str(params['weight']) + '\t' + str(params['port']) + '\t' + params['value']
+                if content:
+                    matches = [index.get((params['type'],name.lower(),content))]
+                else:
+                    matches = by_name.get((params['type'],name.lower()),[])
+                for rr in matches:
+                    if rr is not None and rr['id'] not in wanted:
+                        wanted.add(rr['id'])
+                        add_change('delete','DELETE',records_call + '/' + rr['id'],None,rr['type'],rr['name'],rr['content'])
+                continue
+
+            new_record, search_record, search_value = self._new_record(params)
+            if search_value is None:
+                # at most one record of this type per name, e.g. CNAME
+                cur_record = (by_name.get((params['type'],search_record.lower())) or [None])[0]
+            else:
+                cur_record = index.get((params['type'],search_record.lower(),search_value))
+
+            if cur_record is None:
+                add_change('create','POST',records_call,new_record,params['type'],search_record,search_value or params['value'])
+                continue
+            wanted.add(cur_record['id'])
+            if self._needs_update(params,cur_record,new_record):
+                add_change('update','PUT',records_call + '/' + cur_record['id'],new_record,params['type'],search_record,search_value or params['value'])
+
+        if self.purge and self.state == 'present':
+            for rr in existing:
+                if rr['type'] in CF_RECORD_TYPES and rr['id'] not in wanted:
+                    add_change('delete','DELETE',records_call + '/' + rr['id'],None,rr['type'],rr['name'],rr['content'])
+
+        errors = []
+        if changes and not self.module.check_mode:
+            # deletes go first, a create conflicting with a record that
+            # still exists (e.g. an A record replacing a CNAME) is rejected
+            deletes = [change for change in changes if change['action'] == 'delete']
+            others = [change for change in changes if change['action'] != 'delete']
+            pool = ThreadPool(max(1,min(self.concurrency,len(changes))))
+            try:
+                for batch in [deletes,others]:
+                    if batch and not errors:
+                        errors = [error for error in pool.map(self._apply_change,batch) if error is not None]
+            finally:
+                pool.close()
+
+        report = [dict((k,change[k]) for k in ['action','type','name','content']) for change in changes]
+        if errors:
+            self.module.fail_json(msg="Failed {0} of {1} changes: {2}".format(len(errors),len(changes),'; '.join(errors)),
+                                  changes=report)
+        self.changed = len(changes) > 0
+        return report,self.changed
+
 def main():
     module = AnsibleModule(
         argument_spec = dict(
             account_api_token = dict(required=True, no_log=True, type='str'),
             account_email     = dict(required=True, type='str'),
+            concurrency       = dict(required=False, default=4, type='int'),
+            per_page          = dict(required=False, default=100, type='int'),
             port              = dict(required=False, default=None, type='int'),
             priority          = dict(required=False, default=1, type='int'),
             proto             = dict(required=False, default=None, choices=[ 'tcp', 'udp' ], type='str'),
+            purge             = dict(required=False, default=False, type='bool'),
             record            = dict(required=False, default='@', aliases=['name'], type='str'),
+            records           = dict(required=False, default=None, type='list'),
             service           = dict(required=False, default=None, type='str'),
             solo              = dict(required=False, default=None, type='bool'),
             state             = dict(required=False, default='present', choices=['present', 'absent'], type='str'),
             timeout           = dict(required=False, default=30, type='int'),
             ttl               = dict(required=False, default=1, type='int'),
-            type              = dict(required=False, default=None, choices=[ 'A', 'AAAA', 'CNAME', 'TXT', 'SRV', 'MX', 'NS', 'SPF' ], type='str'),
+            type              = dict(required=False, default=None, choices=CF_RECORD_TYPES, type='str'),
             value             = dict(required=False, default=None, aliases=['content'], type='str'),
             weight            = dict(required=False, default=1, type='int'),
             zone              = dict(required=True, default=None, aliases=['domain'], type='str'),
         ),
         supports_check_mode = True,
+        mutually_exclusive = (
+            [['records','type'],['records','value'],['records','solo']]
+        ),
         required_if = ([
-                ('state','present',['record','type']),
                 ('type','MX',['priority','value']),
                 ('type','SRV',['port','priority','proto','service','value','weight']),
                 ('type','A',['value']),
@@ -613,10 +870,19 @@ def main():
         )
     )
 
+    if not 5 <= module.params['per_page'] <= 100:
+        module.fail_json(msg="per_page must be between 5 and 100, got {0}".format(module.params['per_page']))
+
     changed = False
     cf_api = CloudflareAPI(module)
 
+    if cf_api.records is not None:
+        result,changed = cf_api.ensure_dns_records()
+        module.exit_json(changed=changed,result={'changes': result})
+
     # sanity checks
+    if cf_api.state == 'present' and not cf_api.type:
+        module.fail_json(msg="type is required when state=present")
     if cf_api.is_solo and cf_api.state == 'absent':
         module.fail_json(msg="solo=true can only be used with state=present")
 